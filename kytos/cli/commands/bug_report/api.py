@@ -1,6 +1,26 @@
 """Translate cli commands to non-cli code."""
+import json
+import platform
 import re
-import subprocess
+import shutil
+import sys
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime, timezone
+
+try:
+    from importlib import metadata
+except ImportError:  # Python < 3.8
+    import importlib_metadata as metadata
+
+from kytos.utils.diagnostics import probe_kytosd
+from kytos.utils.exceptions import KytosException
+from kytos.utils.metadata import __version__
+from kytos.utils.napps import NAppsManager
+
+#: Result of a collector: its data, the error it raised and its duration.
+Collected = namedtuple('Collected', ['data', 'error', 'seconds'])
 
 
 class BugReportAPI:
@@ -9,94 +29,268 @@ class BugReportAPI:
     Collect system information, python environment, python packages and
     installed NApps to print this report to the user, aiming to improve
     bug reports.
+
+    Each kind of information has a collector, a ``_collect_<name>`` method
+    returning plain data. Collectors run concurrently and, instead of
+    spawning processes, use the Python standard library and kytosd's API.
     """
 
+    #: Collector names, in the order they are reported.
+    COLLECTORS = ('system', 'python', 'packages', 'kytos', 'napps')
+
+    #: Default seconds a collector may take before being given up.
+    TIMEOUT = 5
+
+    #: Collectors given the seconds left, so they return partial results
+    #: instead of being given up.
+    TIMED_COLLECTORS = ('latency',)
+
     @classmethod
-    def bug_report(cls, _):
+    def bug_report(cls, args):
         """Run all reports."""
-        cls.system_report()
-        cls.python_environment()
-        cls.python_packages_report()
-        cls.kytos_environment_report()
+        try:
+            timeout = float(args.get('--timeout') or cls.TIMEOUT)
+        except ValueError:
+            timeout = -1
+        if timeout <= 0:
+            raise KytosException('--timeout must be a positive number of '
+                                 'seconds.')
+        if args.get('--json'):
+            cls.json_report(timeout)
+            return
+        collected = cls.collect(timeout=timeout)
+        cls.system_report(collected['system'])
+        cls.python_environment(collected['python'])
+        cls.python_packages_report(collected['packages'])
+        cls.kytos_environment_report(collected['kytos'], collected['napps'])
+
+    @classmethod
+    def collect(cls, names=None, timeout=TIMEOUT):
+        """Run collectors concurrently.
+
+        Collectors still running after ``timeout`` seconds are reported with
+        a TimeoutError and left behind in daemon threads, so they can't
+        delay the report or the exit of the command. Collectors in
+        TIMED_COLLECTORS are called with the seconds they have.
+
+        Args:
+            names (list): Collector names, by default all in COLLECTORS.
+            timeout (float): Seconds to wait for all collectors.
+
+        Returns:
+            dict: Collected results by collector name.
+
+        """
+        names = names or cls.COLLECTORS
+        results = {}
+        deadline = time.monotonic() + timeout
+
+        def run(name):
+            start = time.monotonic()
+            collector = getattr(cls, f'_collect_{name}')
+            try:
+                if name in cls.TIMED_COLLECTORS:
+                    # Leave some time to hand in the results.
+                    data = collector(0.9 * (deadline - start))
+                else:
+                    data = collector()
+                results[name] = Collected(data, None,
+                                          time.monotonic() - start)
+            # Any failure belongs to the report, not to the user's terminal.
+            except Exception as exception:  # pylint: disable=broad-except
+                results[name] = Collected(None, exception,
+                                          time.monotonic() - start)
+
+        threads = [threading.Thread(target=run, args=(name,), daemon=True)
+                   for name in names]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(max(0, deadline - time.monotonic()))
+
+        timed_out = Collected(None, TimeoutError(f'no answer in {timeout}s'),
+                              timeout)
+        return {name: results.get(name, timed_out) for name in names}
+
+    @classmethod
+    def json_report(cls, timeout=TIMEOUT):
+        """Print a JSON document with all collectors and kytosd latencies.
+
+        Besides its data, each collector has the seconds it took and its
+        error, if any. The "latency" collector probes the kytosd endpoints
+        used by the CLI.
+        """
+        collected = cls.collect(cls.COLLECTORS + ('latency',), timeout)
+        report = {
+            'version': 1,
+            'created': datetime.now(timezone.utc).isoformat(),
+            'timeout': timeout,
+            'collectors': {
+                name: {'data': result.data,
+                       'error': result.error and repr(result.error),
+                       'seconds': round(result.seconds, 6)}
+                for name, result in collected.items()}}
+        print(json.dumps(report, indent=2, default=str))
+
+    @classmethod
+    def _collect_latency(cls, total=TIMEOUT):
+        """Return the latency probes of the kytosd endpoints.
+
+        Probes without an answer within ``total`` seconds are reported with
+        their error, along with the samples taken so far by the others.
+        """
+        return probe_kytosd(samples=3, timeout=1, total=total)
+
+    @staticmethod
+    def _collect_system():
+        """Return the OS release fields and the uname information."""
+        try:
+            release = platform.freedesktop_os_release()
+        except (AttributeError, OSError):
+            # Python < 3.10 or no /etc/os-release, as in macOS.
+            release = {'NAME': platform.system(),
+                       'VERSION': platform.release()}
+        return {'release': release, 'uname': ' '.join(platform.uname())}
+
+    @classmethod
+    def _collect_python(cls):
+        """Return the path and version of the running python and pip."""
+        return {'python': {'path': sys.executable,
+                           'version': platform.python_version()},
+                'pip': {'path': shutil.which('pip'),
+                        'version': cls._get_version('pip')}}
+
+    @classmethod
+    def _collect_packages(cls):
+        """Return the installed Kytos packages.
+
+        Packages installed from a repository, as with ``pip install -e``,
+        also have their repository and commit.
+        """
+        packages = {}
+        for dist in metadata.distributions():
+            name = dist.metadata['Name']
+            if not name or not ('kytos' in name or 'python-openflow' in name):
+                continue
+            package = {'name': name, 'version': dist.version}
+            direct_url = json.loads(dist.read_text('direct_url.json') or '{}')
+            if direct_url.get('vcs_info'):
+                package['repository'] = cls._parse_repository(
+                    direct_url['url'])
+                package['commit'] = direct_url['vcs_info'].get(
+                    'commit_id', '')[:8]
+            packages[name.lower()] = package
+        return [packages[name] for name in sorted(packages)]
 
     @classmethod
-    def system_report(cls):
+    def _parse_repository(cls, url):
+        """Return the github path of a repository url, if it is there."""
+        result = re.search('(github.com[:/].*?)(?:\\.git)?$', url)
+        return result.group(1) if result else url
+
+    @classmethod
+    def _collect_kytos(cls):
+        """Return the path and version of kytosd and kytos."""
+        return {'kytosd': {'path': shutil.which('kytosd'),
+                           'version': cls._get_version('kytos')},
+                'kytos': {'path': shutil.which('kytos'),
+                          'version': cls._get_version('kytos-utils',
+                                                      __version__)}}
+
+    @staticmethod
+    def _collect_napps():
+        """Return the NApps installed in kytosd and whether they are enabled.
+
+        Raises:
+            KytosException: If kytosd can't be reached.
+
+        """
+        mgr = NAppsManager()
+        enabled = set(mgr.get_enabled())
+        return [{'napp': '/'.join(napp), 'enabled': napp in enabled}
+                for napp in sorted(mgr.get_installed())]
+
+    @staticmethod
+    def _get_version(distribution, default=None):
+        try:
+            return metadata.version(distribution)
+        except metadata.PackageNotFoundError:
+            return default
+
+    @staticmethod
+    def _print_failure(collected):
+        """Print why a collector has no data and return whether it failed."""
+        if collected.error is None:
+            return False
+        print(f'Not available: {collected.error!r}')
+        return True
+
+    @classmethod
+    def system_report(cls, collected):
         """Display system information.
 
         Print distribution release system information.
         """
         print('# Platform')
-        lsb_release = cls._execute('lsb_release -a 2> /dev/null')
-        uname = cls._execute('uname -a')
+        if cls._print_failure(collected):
+            return
         print('## Release information')
-        print(lsb_release)
+        for key, value in collected.data['release'].items():
+            print(f'{key}={value}')
         print('## System Information')
-        print(uname)
+        print(collected.data['uname'])
 
     @classmethod
-    def python_environment(cls):
+    def python_environment(cls, collected):
         """Display python environment report.
 
         This method shows the path and version of pip and python.
         """
-        cls._print_path_and_version('python')
-        cls._print_path_and_version('pip')
+        if not cls._print_failure(collected):
+            cls._print_path_and_version('python', collected.data)
+            cls._print_path_and_version('pip', collected.data)
 
     @classmethod
-    def _print_path_and_version(cls, package):
+    def _print_path_and_version(cls, package, data):
         """Display a package path and version."""
         print('## '+package.title())
-        path = cls._execute(f'which {package}')
-        version = cls._execute(f'{package} --version')
-        print(f'path={path}')
-        print(f'version={version}')
+        print(f"path={data[package]['path']}")
+        print(f"version={data[package]['version']}")
 
     @classmethod
-    def python_packages_report(cls):
-        """Display all installed packages using pip freeze.
+    def python_packages_report(cls, collected):
+        """Display all installed Kytos packages.
 
-        This method will modify the output and print:
+        This method will print:
 
         pypi packages : 'Package Name | Version'
         git repository package: 'Package Name | Repository | Version'
         """
-        lines = cls._execute('pip  freeze').split('\n')
         print('# Python Packages')
-        for line in lines:
-            if 'kytos' in line or 'python-openflow' in line:
-                if '==' in line:
-                    name, version = line.split('==')
-                    print(f'{name:<30} | {version:<30}')
-                if line.startswith('-e '):
-                    url, name = line.split('#egg=')
-                    url = url.replace('-e ', '')
-                    repository, hash_number = cls._parse_github_install(url)
-                    print(f'{name:<30} | {repository:<30} | {hash_number:<30}')
-
-    @classmethod
-    def _parse_github_install(cls, url):
-        """Parse the repository url and get the github path and commit hash."""
-        pattern = "(github.com[:/].*).git@(.{8})"
-        result = re.search(pattern, url)
-        if result:
-            return result.groups()
-        return (url, '')
+        if cls._print_failure(collected):
+            return
+        for package in collected.data:
+            name = package['name']
+            if 'repository' in package:
+                repository, commit = package['repository'], package['commit']
+                print(f'{name:<30} | {repository:<30} | {commit:<30}')
+            else:
+                print(f"{name:<30} | {package['version']:<30}")
 
     @classmethod
-    def kytos_environment_report(cls):
+    def kytos_environment_report(cls, collected, napps):
         """Display the kytos environment.
 
         This method shows the path and version of kytos and kytosd.
         After that shows all installed napps.
         """
         print('# Kytos environment')
-        cls._print_path_and_version('kytosd')
-        cls._print_path_and_version('kytos')
+        if not cls._print_failure(collected):
+            cls._print_path_and_version('kytosd', collected.data)
+            cls._print_path_and_version('kytos', collected.data)
         print('## Installed napps')
-        napps = cls._execute('kytos napps list')
-        print(napps)
-
-    @classmethod
-    def _execute(cls, command):
-        """Call a subprocess and return the result."""
-        return subprocess.check_output(command, shell=True).decode().strip()
+        if cls._print_failure(napps):
+            return
+        for napp in napps.data:
+            status = '[ie]' if napp['enabled'] else '[i-]'
+            print(f"{status} {napp['napp']}")
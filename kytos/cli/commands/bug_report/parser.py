@@ -3,12 +3,16 @@
 You are at the "bug-report" command.
 
 Usage:
-       kytos bug-report
+       kytos bug-report [--json] [--timeout=<seconds>]
        kytos bug-report -h | --help
 
 Options:
 
-  -h, --help    Show this screen.
+  -h, --help              Show this screen.
+  --json                  Print a JSON document, including how long each
+                          piece of information took and kytosd latencies.
+  --timeout=<seconds>     Give up any information that takes longer to
+                          collect [default: 5].
 """
 
 import sys
@@ -0,0 +1 @@
+"""COMPLETION CLI Commands."""
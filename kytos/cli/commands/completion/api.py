@@ -0,0 +1,21 @@
+"""Translate cli commands to non-cli code."""
+from kytos.utils.completion import CompletionIndex, render_script
+
+
+class CompletionAPI:
+    """An API for the command-line interface."""
+
+    @staticmethod
+    def bash(args):  # pylint: disable=unused-argument
+        """Print the bash completion script."""
+        print(render_script('bash'))
+
+    @staticmethod
+    def zsh(args):  # pylint: disable=unused-argument
+        """Print the zsh completion script."""
+        print(render_script('zsh'))
+
+    @staticmethod
+    def refresh(args):  # pylint: disable=unused-argument
+        """Refresh the completion index."""
+        CompletionIndex().refresh()
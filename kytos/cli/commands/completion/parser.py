@@ -0,0 +1,49 @@
+"""kytos - The kytos command line.
+
+You are at the "completion" command.
+
+Usage:
+       kytos completion bash
+       kytos completion zsh
+       kytos completion refresh
+       kytos completion -h | --help
+
+Options:
+
+  -h, --help    Show this screen.
+
+Common completion subcommands:
+
+  bash          Print the bash completion script.
+  zsh           Print the zsh completion script.
+  refresh       Refresh the local index of NApp IDs used for completion.
+
+To enable completion, add this line to your ~/.bashrc (or ~/.zshrc):
+
+  eval "$(kytos completion bash)"
+
+"""
+import sys
+
+from docopt import docopt
+
+from kytos.utils.exceptions import KytosException
+
+
+def parse(argv):
+    """Parse cli args."""
+    args = docopt(__doc__, argv=argv)
+    try:
+        call(sys.argv[2], args)
+    except KytosException as exception:
+        print("Error parsing args: {}".format(exception))
+        sys.exit()
+
+
+def call(subcommand, args):
+    """Call a subcommand passing the args."""
+    # Imported here because the API module needs this module's docstring.
+    # pylint: disable=import-outside-toplevel
+    from kytos.cli.commands.completion.api import CompletionAPI
+    func = getattr(CompletionAPI, subcommand)
+    func(args)
@@ -0,0 +1 @@
+"""Doctor CLI Commands."""
@@ -0,0 +1,90 @@
+"""Translate cli commands to non-cli code."""
+from kytos.utils.config import KytosConfig
+from kytos.utils.diagnostics import (time_connection, time_download,
+                                     time_package_build)
+from kytos.utils.exceptions import KytosException
+
+
+class DoctorAPI:
+    """Tell which part of the environment makes the CLI slow."""
+
+    #: Configuration options with the URLs that are checked.
+    URLS = (('kytos', 'api'), ('napps', 'api'), ('napps', 'repo'))
+
+    #: Connection phases, as named by time_connection, and their labels.
+    PHASES = (('dns', 'DNS'), ('tcp', 'TCP'), ('tls', 'TLS'),
+              ('first_byte', 'First byte'))
+
+    @classmethod
+    def doctor(cls, args):
+        """Time connections and, with --perf, rank the bottlenecks."""
+        try:
+            timeout = float(args['--timeout'])
+        except ValueError:
+            raise KytosException('--timeout must be a number of seconds.')
+
+        config = KytosConfig().config
+        urls = {f'{section}.{option}': config.get(section, option)
+                for section, option in cls.URLS}
+        connections = {name: time_connection(url, timeout)
+                       for name, url in urls.items()}
+        cls.print_connections(connections)
+        if not args['--perf']:
+            return
+
+        catalog = time_download(urls['napps.api'] + 'napps/', timeout)
+        package = time_package_build()
+        cls.print_throughput(catalog, package)
+        cls.print_bottlenecks(cls.rank(connections, catalog, package))
+
+    @classmethod
+    def print_connections(cls, connections):
+        """Print the time of each phase of each connection in ms."""
+        print('# Connections (ms)')
+        header = ['URL'] + [label for _, label in cls.PHASES]
+        print('{:<12} {:>8} {:>8} {:>8} {:>10}'.format(*header))
+        for name, result in connections.items():
+            times = [cls._ms(result[phase]) for phase, _ in cls.PHASES]
+            print('{:<12} {:>8} {:>8} {:>8} {:>10}'.format(name, *times))
+            if result['error']:
+                print(f"  {result['url']}: {result['error']}")
+
+    @staticmethod
+    def print_throughput(catalog, package):
+        """Print the catalog download and the package build results."""
+        print('# Throughput')
+        if catalog['error']:
+            print(f"Catalog download: {catalog['error']}")
+        else:
+            print('Catalog download: {} KiB in {:.0f} ms ({:.0f} KiB/s)'
+                  .format(catalog['bytes'] // 1024, catalog['seconds'] * 1000,
+                          catalog['throughput'] / 1024))
+        print('Package build: {} files, {} KiB -> {} KiB in {:.0f} ms'.format(
+            package['files'], package['bytes'] // 1024,
+            package['compressed'] // 1024, package['seconds'] * 1000))
+
+    @classmethod
+    def rank(cls, connections, catalog, package):
+        """Return (seconds, description) of every measure, slowest first."""
+        measures = []
+        for name, result in connections.items():
+            for phase, label in cls.PHASES:
+                if result[phase] is not None:
+                    measures.append((result[phase], f'{label} of {name}'))
+        if catalog['seconds'] is not None:
+            measures.append((catalog['seconds'], 'Catalog download'))
+        measures.append((package['seconds'], 'Package build'))
+        return sorted(measures, reverse=True)
+
+    @staticmethod
+    def print_bottlenecks(measures):
+        """Print the measures and their share of the total time."""
+        print('# Bottlenecks')
+        total = sum(seconds for seconds, _ in measures) or 1
+        for position, (seconds, name) in enumerate(measures, 1):
+            print('{:>2}. {:<30} {:>9.1f} ms {:>5.1f}%'.format(
+                position, name, seconds * 1000, 100 * seconds / total))
+
+    @staticmethod
+    def _ms(seconds):
+        return '-' if seconds is None else '{:.1f}'.format(seconds * 1000)
@@ -0,0 +1,36 @@
+"""kytos - The kytos command line.
+
+You are at the "doctor" command.
+
+Usage:
+       kytos doctor [--perf] [--timeout=<seconds>]
+       kytos doctor -h | --help
+
+Options:
+
+  -h, --help              Show this screen.
+  --perf                  Also measure the catalog download throughput and
+                          a scratch package build, and rank bottlenecks.
+  --timeout=<seconds>     Give up each connection after this time
+                          [default: 5].
+
+Without options, the doctor times name resolution, TCP connection, TLS
+handshake and first byte for the kytos.api, napps.api and napps.repo URLs of
+your configuration.
+"""
+import sys
+
+from docopt import docopt
+
+from kytos.cli.commands.doctor.api import DoctorAPI
+from kytos.utils.exceptions import KytosException
+
+
+def parse(argv):
+    """Parse cli args."""
+    args = docopt(__doc__, argv=argv)
+    try:
+        DoctorAPI.doctor(args)
+    except KytosException as exception:
+        print("Error parsing args: {}".format(exception))
+        sys.exit(-1)
@@ -0,0 +1 @@
+"""HELPER CLI Commands."""
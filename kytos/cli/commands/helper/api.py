@@ -0,0 +1,66 @@
+"""Translate cli commands to non-cli code."""
+import logging
+import subprocess
+import sys
+import time
+
+from kytos.utils.exceptions import KytosException
+from kytos.utils.helper import send, socket_path
+
+LOG = logging.getLogger(__name__)
+
+
+class HelperAPI:
+    """An API for the command-line interface."""
+
+    @staticmethod
+    def _ping():
+        """Return the helper status or None if it isn't running."""
+        try:
+            return send({'command': 'status'}, timeout=2)
+        except (OSError, ValueError):
+            return None
+
+    @classmethod
+    def start(cls, args):
+        """Start the helper in background, unless it is already running."""
+        if cls._ping():
+            LOG.info('Helper already running.')
+            return
+
+        try:
+            idle = float(args['--idle'])
+        except ValueError:
+            raise KytosException('--idle must be a number of seconds.')
+
+        cmd = [sys.executable, '-m', 'kytos.utils.helper_server', str(idle)]
+        subprocess.Popen(cmd, stdin=subprocess.DEVNULL,
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                         start_new_session=True)
+
+        for _ in range(50):
+            if cls._ping():
+                LOG.info('Helper listening on %s.', socket_path())
+                return
+            time.sleep(0.1)
+        LOG.error('Helper did not start.')
+
+    @classmethod
+    def stop(cls, args):  # pylint: disable=unused-argument
+        """Stop the helper."""
+        if not cls._ping():
+            LOG.info('Helper is not running.')
+            return
+        send({'command': 'stop'}, timeout=2)
+        LOG.info('Helper stopped.')
+
+    @classmethod
+    def status(cls, args):  # pylint: disable=unused-argument
+        """Print whether the helper is running."""
+        status = cls._ping()
+        if not status:
+            print('Helper is not running.')
+            return
+        uptime = time.time() - status['started']
+        print(f"Helper running (pid {status['pid']}) on {socket_path()}, "
+              f"up {uptime:.0f}s, {status['requests']} commands served.")
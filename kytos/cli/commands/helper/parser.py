@@ -0,0 +1,45 @@
+"""kytos - The kytos command line.
+
+You are at the "helper" command.
+
+Usage:
+       kytos helper start [--idle=<seconds>]
+       kytos helper stop
+       kytos helper status
+       kytos helper -h | --help
+
+Options:
+
+  -h, --help          Show this screen.
+  --idle=<seconds>    Stop the helper after this idle time [default: 1800].
+
+Common helper subcommands:
+
+  start         Start a background helper that answers napps and web
+                commands without starting a new Python process.
+  stop          Stop the background helper.
+  status        Show whether the background helper is running.
+
+"""
+import sys
+
+from docopt import docopt
+
+from kytos.cli.commands.helper.api import HelperAPI
+from kytos.utils.exceptions import KytosException
+
+
+def parse(argv):
+    """Parse cli args."""
+    args = docopt(__doc__, argv=argv)
+    try:
+        call(sys.argv[2], args)
+    except KytosException as exception:
+        print("Error parsing args: {}".format(exception))
+        sys.exit()
+
+
+def call(subcommand, args):
+    """Call a subcommand passing the args."""
+    func = getattr(HelperAPI, subcommand)
+    func(args)
@@ -1,18 +1,34 @@
 """Translate cli commands to non-cli code."""
 import json
 import logging
-import os
 import re
+import shutil
+import time
 from urllib.error import HTTPError, URLError
 
 import requests
 
+from kytos.utils.client import NAppsClient
+from kytos.utils.dependencies import closure, discover, levels
 from kytos.utils.exceptions import KytosException
+from kytos.utils.lock import (fetch_lock, lock_catalog, lock_desired,
+                              read_lock, resolve, verify_lock, write_lock)
+from kytos.utils.mirror import make_server, sync
 from kytos.utils.napps import NAppsManager
+from kytos.utils.state import apply_plan, fetch_plan, print_plan, read_state
+from kytos.utils.tracing import span
+from kytos.utils.versions import MetadataCache, satisfies
+from kytos.utils.watcher import NAppsWatcher
 
 LOG = logging.getLogger(__name__)
 
 
+def _napp_span(mgr, action):
+    """Return a tracing span of ``action`` on the NApp of ``mgr``."""
+    return span(mgr.napp_id, **{'kytos.napp': mgr.napp_id,
+                                'kytos.action': action})
+
+
 class NAppsAPI:
     """An API for the command-line interface.
 
@@ -34,7 +50,8 @@ class NAppsAPI:
         for napp in napps:
             mgr.set_napp(*napp)
             LOG.info('NApp %s:', mgr.napp_id)
-            cls.disable_napp(mgr)
+            with _napp_span(mgr, 'disable'):
+                cls.disable_napp(mgr)
 
     @staticmethod
     def disable_napp(mgr):
@@ -85,12 +102,23 @@ class NAppsAPI:
         for napp in napps:
             mgr.set_napp(*napp)
             LOG.info('NApp %s:', mgr.napp_id)
-            cls.enable_napp(mgr)
+            with _napp_span(mgr, 'enable'):
+                cls.enable_napp(mgr)
 
     @classmethod
-    def create(cls, args):  # pylint: disable=unused-argument
+    def create(cls, args):
         """Bootstrap a basic NApp structure on the current folder."""
-        NAppsManager.create_napp(meta_package=args.get('--meta', False))
+        if not args.get('--from'):
+            NAppsManager.create_napp(meta_package=args.get('--meta', False))
+            return
+
+        napps = NAppsManager.read_manifest(args['--from'])
+        LOG.info('Creating %d NApps...', len(napps))
+        for napp_id, error in NAppsManager.create_napps(napps).items():
+            if error is None:
+                LOG.info('  %s created.', napp_id)
+            else:
+                LOG.error('  %s not created: %s', napp_id, error)
 
     @classmethod
     def upload(cls, args):  # pylint: disable=unused-argument
@@ -102,6 +130,8 @@ class NAppsAPI:
             NAppsManager().upload()
         except FileNotFoundError as err:
             LOG.error("Couldn't find %s in current directory.", err.filename)
+        except requests.HTTPError as exception:
+            LOG.error("NApps server refused the upload: %s", exception)
 
     @classmethod
     def uninstall(cls, args):
@@ -114,52 +144,136 @@ class NAppsAPI:
         for napp in args['<napp>']:
             mgr.set_napp(*napp)
             LOG.info('NApp %s:', mgr.napp_id)
-            if mgr.is_installed():
-                if mgr.is_enabled():
-                    cls.disable_napp(mgr)
-                LOG.info('  Uninstalling...')
-                mgr.remote_uninstall()
-                LOG.info('  Uninstalled.')
-            else:
-                LOG.error("  NApp isn't installed.")
+            with _napp_span(mgr, 'uninstall'):
+                if mgr.is_installed():
+                    if mgr.is_enabled():
+                        cls.disable_napp(mgr)
+                    LOG.info('  Uninstalling...')
+                    mgr.remote_uninstall()
+                    LOG.info('  Uninstalled.')
+                else:
+                    LOG.error("  NApp isn't installed.")
 
     @classmethod
     def install(cls, args):
         """Install local or remote NApps."""
-        cls.install_napps(args['<napp>'])
+        if args.get('--lock'):
+            cls.install_lock(args['--lock'])
+        else:
+            cls.install_napps(args['<napp>'])
 
     @classmethod
-    def install_napps(cls, napps):
-        """Install local or remote NApps.
+    def install_lock(cls, lock_file):
+        """Install and enable exactly the NApps of a lockfile.
 
-        This method is recursive, it will install each napps and your
-        dependencies.
+        Dependencies come from the lockfile and packages to be installed
+        are checked against its digests before kytosd downloads them.
         """
-        mgr = NAppsManager()
-        for napp in napps:
-            mgr.set_napp(*napp)
-            LOG.info('  NApp %s:', mgr.napp_id)
+        lock = read_lock(lock_file)
+        plan = fetch_plan(lock_desired(lock), False, lock_catalog(lock))
+        if plan.install:
+            LOG.info('Checking %d packages...', len(plan.install))
+            verify_lock(lock, plan.install)
+        print_plan(plan)
+        cls._apply_plan(plan)
 
-            try:
-                if not mgr.is_installed():
-                    # Try to install all NApps, even if
-                    # some of them fail.
-                    cls.install_napp(mgr)
-
-                    # Enable the NApp
-                    if not mgr.is_enabled():
-                        cls.enable_napp(mgr)
-                        napp_dependencies = mgr.dependencies()
-                        if napp_dependencies:
-                            LOG.info('Installing Dependencies:')
-                            cls.install_napps(napp_dependencies)
+    @classmethod
+    def lock(cls, args):
+        """Write a lockfile with NApps and their dependencies."""
+        LOG.info('Resolving NApps and downloading packages...')
+        lock = fetch_lock(args['<napp>'])
+        write_lock(lock, args['--output'])
+        LOG.info('%d NApps locked in %s.', len(lock['napps']),
+                 args['--output'])
+
+    @classmethod
+    def install_napps(cls, napps, cache=None):
+        """Install local or remote NApps and their dependencies.
+
+        Dependencies are discovered from the NApps server, with concurrent
+        requests, before anything is installed, and NApps are installed
+        dependencies first. The dependencies of NApps unknown to the NApps
+        server, such as local ones, are read from kytosd once installed.
+
+        Versions, as in ``username/name:version``, are constraints checked
+        against the NApps server metadata, kept in ``cache``, before
+        installing and against kytosd after installing.
+        """
+        cache = cache or MetadataCache()
+        constraints = {tuple(napp[:2]): napp[2] if len(napp) > 2 else None
+                       for napp in napps}
+        try:
+            graph = discover(constraints, cache.get)
+            ordered = [napp for level in levels(closure(constraints, graph),
+                                                graph) for napp in level]
+        except KytosException as exception:
+            LOG.error('Error resolving dependencies: %s', exception)
+            return
+
+        mgr = NAppsManager()
+        for napp in ordered:
+            constraint = constraints.get(napp)
+            mgr.set_napp(*napp, constraint)
+            with _napp_span(mgr, 'install') as current:
+                try:
+                    installed = mgr.is_installed()
+                    if napp not in constraints and installed:
+                        continue
+                    LOG.info('  NApp %s:', mgr.napp_id)
+                    if not installed:
+                        if constraint:
+                            version = cache.resolve(mgr.user, mgr.napp,
+                                                    constraint)
+                            LOG.info('    Version %s satisfies %s.', version,
+                                     constraint)
+                        # Try to install all NApps, even if
+                        # some of them fail.
+                        cls.install_napp(mgr)
+                        if constraint:
+                            cls.check_installed_version(mgr, constraint,
+                                                        cache)
+
+                        # Enable the NApp
+                        if not mgr.is_enabled():
+                            cls.enable_napp(mgr)
+                            napp_dependencies = [] if napp in graph \
+                                else mgr.dependencies()
+                            if napp_dependencies:
+                                LOG.info('Installing Dependencies:')
+                                cls.install_napps(napp_dependencies, cache)
+                        else:
+                            LOG.info('    Enabled.')
                     else:
-                        LOG.info('    Enabled.')
-                else:
-                    LOG.warning('  Napp already installed.')
-            except KytosException:
-                LOG.error('Error installing NApp.')
-                continue
+                        LOG.warning('  Napp already installed.')
+                        if constraint and not satisfies(mgr.get_version(),
+                                                        constraint):
+                            LOG.error('    Installed version %s does not '
+                                      'satisfy %s. Uninstall it first.',
+                                      mgr.get_version(), constraint)
+                except KytosException as exception:
+                    current.set_error(str(exception))
+                    LOG.error('Error installing NApp: %s', exception)
+                    continue
+
+    @staticmethod
+    def check_installed_version(mgr, constraint, cache):
+        """Uninstall a just installed NApp if its version is not allowed.
+
+        kytosd has no version parameter and installs the NApps server
+        version, which may have changed since it was cached.
+
+        Raises:
+            KytosException: If the installed version doesn't satisfy
+                ``constraint``.
+
+        """
+        version = mgr.get_version()
+        if satisfies(version, constraint):
+            return
+        cache.forget(mgr.user, mgr.napp)
+        mgr.remote_uninstall()
+        raise KytosException(f'kytosd installed version {version}, which '
+                             f'does not satisfy {constraint}; uninstalled.')
 
     @classmethod
     def install_napp(cls, mgr):
@@ -250,8 +364,8 @@ class NAppsAPI:
         stat_w = 6  # We already know the size of Status col
         name_w = max(len(n[1]) for n in napps)
         desc_w = max(len(n[2]) for n in napps)
-        term_w = os.popen('stty size', 'r').read().split()[1]
-        remaining = max(0, int(term_w) - stat_w - name_w - 6)
+        term_w = shutil.get_terminal_size().columns
+        remaining = max(0, term_w - stat_w - name_w - 6)
         desc_w = min(desc_w, remaining)
         widths = (stat_w, name_w, desc_w)
 
@@ -273,7 +387,8 @@ class NAppsAPI:
             mgr.set_napp(*napp)
             LOG.info('Deleting NApp %s from server...', mgr.napp_id)
             try:
-                mgr.delete()
+                with _napp_span(mgr, 'delete'):
+                    mgr.delete()
                 LOG.info('  Deleted.')
             except requests.HTTPError as exception:
                 if exception.response.status_code == 405:
@@ -283,10 +398,10 @@ class NAppsAPI:
                     LOG.error('  Server error: %s - ', msg['error'])
 
     @classmethod
-    def prepare(cls, args):  # pylint: disable=unused-argument
-        """Create OpenAPI v3.0 spec skeleton."""
+    def prepare(cls, args):
+        """Create or update the OpenAPI v3.0 spec skeleton."""
         mgr = NAppsManager()
-        mgr.prepare()
+        mgr.prepare(incremental=args.get('--incremental', False))
 
     @classmethod
     def reload(cls, args):
@@ -306,3 +421,106 @@ class NAppsAPI:
             if exception.response.status_code != 200:
                 msg = json.loads(exception.response.content)
                 LOG.error('\tServer error: %s - ', msg['error'])
+
+    @classmethod
+    def mirror(cls, args):
+        """Sync NApps to a local repository mirror or serve it."""
+        if args['--serve']:
+            cls.serve_mirror(args['<dir>'], args['--bind'], args['--port'])
+            return
+
+        if args['--lock']:
+            lock = read_lock(args['--lock'])
+        else:
+            lock = resolve(args['<napp>'], NAppsClient().get_napps())
+        LOG.info('Syncing %d NApps to %s...', len(lock['napps']),
+                 args['<dir>'])
+        results = sync(args['<dir>'], lock)
+        for synced in results:
+            napp = f'{synced.napp_id}:{synced.version}'
+            if synced.error:
+                LOG.error('  %s: %s', napp, synced.error)
+            elif synced.downloaded:
+                LOG.info('  %s: downloaded.', napp)
+            else:
+                LOG.info('  %s: up to date.', napp)
+        failed = sum(synced.error is not None for synced in results)
+        if failed:
+            LOG.error('%d of %d NApps failed.', failed, len(results))
+
+    @staticmethod
+    def serve_mirror(directory, host, port):
+        """Serve a mirror directory until interrupted."""
+        try:
+            server = make_server(directory, host, int(port))
+        except ValueError:
+            raise KytosException('--port must be a number.')
+        url = 'http://{}:{}/'.format(*server.server_address[:2])
+        LOG.info('Serving %s at %s. Set napps.repo (NAPPS_REPO_URI) of kytosd '
+                 'to this URL. Press Ctrl+C to stop.', directory, url)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+
+    @classmethod
+    def apply(cls, args):
+        """Converge the NApps of kytosd to the state in a YAML file."""
+        desired, prune = read_state(args['<file>'])
+        plan = fetch_plan(desired, prune)
+        print_plan(plan)
+        if not args.get('--dry-run'):
+            cls._apply_plan(plan)
+
+    @staticmethod
+    def _apply_plan(plan):
+        """Apply a plan, if there is anything to do, and log the outcome."""
+        if not any(plan[:4]):
+            return
+        LOG.info('Applying...')
+        results = apply_plan(plan)
+        failed = sum(error is not None for error in results.values())
+        if failed:
+            LOG.error('%d of %d NApps failed.', failed, len(results))
+        else:
+            LOG.info('%d NApps converged.', len(results))
+
+    @classmethod
+    def watch(cls, args):
+        """Reload NApps whenever their source code changes."""
+        try:
+            debounce = float(args['--debounce'])
+        except ValueError:
+            raise KytosException('--debounce must be a number of seconds.')
+
+        watcher = NAppsWatcher(args['<path>'] or '.', debounce)
+        if not watcher.napps:
+            LOG.error('No NApp (kytos.json) found in %s.', watcher.path)
+            return
+
+        for napp in sorted(watcher.napps.values()):
+            LOG.info('Watching NApp %s/%s...', *napp)
+        LOG.info('Press Ctrl+C to stop.')
+        watcher.watch(cls.reload_changed)
+
+    @staticmethod
+    def reload_changed(napps):
+        """Reload each NApp in ``napps`` and report how long it took."""
+        mgr = NAppsManager()
+        for napp in napps:
+            start = time.monotonic()
+            try:
+                mgr.reload([napp])
+            except (KytosException, requests.RequestException) as exception:
+                LOG.error('NApp %s/%s: error reloading: %s', *napp, exception)
+                continue
+            # make_request exits when kytosd can't be reached, as when it
+            # restarts, but watching goes on.
+            except SystemExit:
+                LOG.error('NApp %s/%s: error reloading: kytosd could not be '
+                          'reached.', *napp)
+                continue
+            elapsed = time.monotonic() - start
+            LOG.info('NApp %s/%s reloaded in %.3fs.', *napp, elapsed)
@@ -3,22 +3,43 @@
 You are at the "napps" command.
 
 Usage:
-       kytos napps create [--meta]
-       kytos napps prepare
+       kytos napps create    [--meta | --from=<manifest>]
+       kytos napps prepare   [--incremental]
        kytos napps upload
        kytos napps delete    <napp>...
-       kytos napps list
-       kytos napps install   <napp>...
-       kytos napps uninstall <napp>...
-       kytos napps enable    (all| <napp>...)
-       kytos napps disable   (all| <napp>...)
-       kytos napps reload    (all| <napp>...)
+       kytos napps list      [--controllers=<names>]
+       kytos napps install   <napp>... [--controllers=<names>]
+       kytos napps install   --lock=<file> [--controllers=<names>]
+       kytos napps uninstall <napp>... [--controllers=<names>]
+       kytos napps enable    (all| <napp>...) [--controllers=<names>]
+       kytos napps disable   (all| <napp>...) [--controllers=<names>]
+       kytos napps reload    (all| <napp>...) [--controllers=<names>]
+       kytos napps apply     <file> [--dry-run] [--controllers=<names>]
+       kytos napps lock      <napp>... [--output=<file>]
+       kytos napps mirror    <dir> (<napp>... | --lock=<file>)
+       kytos napps mirror    <dir> --serve [--bind=<address>] [--port=<port>]
        kytos napps search    <pattern>
+       kytos napps watch     [<path>] [--debounce=<seconds>]
        kytos napps -h | --help
 
 Options:
 
-  -h, --help    Show this screen.
+  -h, --help              Show this screen.
+  --meta                  Create a meta-package, without main.py.
+  --from=<manifest>       Create all NApps listed in a YAML manifest,
+                          without asking questions.
+  --debounce=<seconds>    Quiet period before reloading changed NApps
+                          [default: 0.5].
+  --incremental           Update openapi.yml with the endpoints of changed
+                          modules, keeping manual edits.
+  --controllers=<names>   Run on these controllers and controller groups
+                          of your configuration, or "all", in parallel.
+  --dry-run               Only print what would be done.
+  --lock=<file>           Install exactly the NApps of a lockfile.
+  --output=<file>         Lockfile to be written [default: napps.lock].
+  --serve                 Serve a mirror directory over HTTP.
+  --bind=<address>        Address of the mirror server [default: 127.0.0.1].
+  --port=<port>           Port of the mirror server [default: 8080].
 
 Common napps subcommands:
 
@@ -32,7 +53,14 @@ Common napps subcommands:
   enable        Enable a installed NApp.
   disable       Disable a NApp.
   reload        Reload NApps code.
+  apply         Install, enable, disable and uninstall NApps to reach the
+                state described in a YAML file.
+  lock          Write the versions, dependencies and package digests of
+                NApps to a lockfile.
+  mirror        Sync NApps and their dependencies to a local repository
+                mirror, or serve it.
   search        Search for NApps in NApps Server.
+  watch         Reload NApps whenever their source code changes.
 
 """
 import re
@@ -43,6 +71,7 @@ from docopt import docopt
 from kytos.cli.commands.napps.api import NAppsAPI
 from kytos.utils.config import KytosConfig
 from kytos.utils.exceptions import KytosException
+from kytos.utils.fanout import run_on_controllers
 
 
 def parse(argv):
@@ -57,9 +86,19 @@ def parse(argv):
 
 def call(subcommand, args):
     """Call a subcommand passing the args."""
-    KytosConfig.check_versions()
     args['<napp>'] = parse_napps(args['<napp>'])
     func = getattr(NAppsAPI, subcommand)
+    if args.get('--controllers'):
+        if not run_on_controllers(args['--controllers'], check_and_call,
+                                  func, args):
+            sys.exit(1)
+    else:
+        check_and_call(func, args)
+
+
+def check_and_call(func, args):
+    """Check kytos and kytos-utils versions before calling func."""
+    KytosConfig.check_versions()
     func(args)
 
 
@@ -1,6 +1,8 @@
 """Translate cli commands to non-cli code."""
 import logging
+import sys
 
+from kytos.utils.exceptions import KytosException
 from kytos.utils.users import UsersManager
 
 LOG = logging.getLogger(__name__)
@@ -17,7 +19,32 @@ class UsersAPI:
     user_manager = UsersManager()
 
     @classmethod
-    def register(cls, args):  # pylint: disable=unused-argument
-        """Create a new user and register it on the Napps server."""
-        result = cls.user_manager.register()
-        print(result)
+    def register(cls, args):
+        """Create a new user and register it on the Napps server.
+
+        With ``--from``, register all users of a CSV file instead, after
+        checking all of them, and exit with status 1 if any of them fails.
+        """
+        if not (args and args.get('--from')):
+            result = cls.user_manager.register()
+            print(result)
+            return
+
+        try:
+            rate = float(args['--rate'])
+        except ValueError:
+            rate = -1
+        if rate < 0:
+            raise KytosException(f'Invalid rate: {args["--rate"]}')
+        users = UsersManager.read_users(args['--from'])
+        LOG.info('Registering %d users...', len(users))
+        results = cls.user_manager.register_users(users, rate=rate)
+        for username, error in results.items():
+            if error is None:
+                LOG.info('  %s registered.', username)
+            else:
+                LOG.error('  %s not registered: %s', username, error)
+        failed = sum(error is not None for error in results.values())
+        if failed:
+            LOG.error('%d of %d users failed.', failed, len(results))
+            sys.exit(1)
@@ -3,12 +3,17 @@
 You are at the "users" command.
 
 Usage:
-       kytos users register
+       kytos users register [--from=<file> [--rate=<requests>]]
        kytos users -h | --help
 
 Options:
 
-  -h, --help    Show this screen.
+  -h, --help            Show this screen.
+  --from=<file>         Register all users of a CSV file, without asking
+                        questions. The header names the fields: username,
+                        first_name, last_name, password, email, phone,
+                        city, state and country.
+  --rate=<requests>     Maximum registrations per second [default: 5].
 
 Common user subcommands:
 
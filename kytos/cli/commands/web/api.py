@@ -5,6 +5,7 @@ from urllib.error import HTTPError, URLError
 import requests
 
 from kytos.utils.config import KytosConfig
+from kytos.utils.journal import journaled
 
 LOG = logging.getLogger(__name__)
 
@@ -15,14 +16,17 @@ class WebAPI:  # pylint: disable=too-few-public-methods
     @classmethod
     def update(cls, args):
         """Call the method to update the Web UI."""
-        kytos_api = KytosConfig().config.get('kytos', 'api')
+        config = KytosConfig().config
+        kytos_api = config.get('kytos', 'api')
         url = f"{kytos_api}api/kytos/core/web/update"
         version = args["<version>"]
         if version:
             url += f"/{version}"
 
         try:
-            result = requests.post(url)
+            with journaled(config, 'web update', url) as entry:
+                result = requests.post(url)
+                entry['status'] = result.status_code
         except(HTTPError, URLError, requests.exceptions.ConnectionError):
             LOG.error("Can't connect to server: %s", kytos_api)
             return
@@ -3,12 +3,13 @@
 You are at the "web" command.
 
 Usage:
-       kytos web update
-       kytos web update <version>
+       kytos web update [<version>] [--controllers=<names>]
 
 Options:
 
-  -h, --help    Show this screen.
+  -h, --help              Show this screen.
+  --controllers=<names>   Run on these controllers and controller groups
+                          of your configuration, or "all", in parallel.
 
 Common web subcommands:
 
@@ -22,6 +23,7 @@ from docopt import docopt
 from kytos.cli.commands.web.api import WebAPI
 from kytos.utils.config import KytosConfig
 from kytos.utils.exceptions import KytosException
+from kytos.utils.fanout import run_on_controllers
 
 
 def parse(argv):
@@ -34,8 +36,18 @@ def parse(argv):
         sys.exit()
 
 
-def call(subcommand, args):  # pylint: disable=unused-argument
+def call(subcommand, args):
     """Call a subcommand passing the args."""
-    KytosConfig.check_versions()
     func = getattr(WebAPI, subcommand)
+    if args.get('--controllers'):
+        if not run_on_controllers(args['--controllers'], check_and_call,
+                                  func, args):
+            sys.exit(1)
+    else:
+        check_and_call(func, args)
+
+
+def check_and_call(func, args):
+    """Check kytos and kytos-utils versions before calling func."""
+    KytosConfig.check_versions()
     func(args)
@@ -10,12 +10,15 @@ import json
 import logging
 import os
 import sys
+import time
 
 import requests
 
 from kytos.utils.config import KytosConfig
 from kytos.utils.decorators import kytos_auth
 from kytos.utils.exceptions import KytosException
+from kytos.utils.journal import journaled
+from kytos.utils.tracing import http_span, set_status
 
 LOG = logging.getLogger(__name__)
 
@@ -23,6 +26,9 @@ LOG = logging.getLogger(__name__)
 class CommonClient:
     """Generic class used to make request the NApps server."""
 
+    #: Optional ``requests.Session`` to reuse connections between requests.
+    session = None
+
     def __init__(self, config=None):
         """Set Kytos config."""
         if config is None:
@@ -36,14 +42,16 @@ class CommonClient:
         package = kwargs.get('package', None)
         method = kwargs.get('method', 'GET')
 
-        function = getattr(requests, method.lower())
+        function = getattr(CommonClient.session or requests, method.lower())
 
         try:
-            if package:
-                response = function(endpoint, data=data,
-                                    files={'file': package})
-            else:
-                response = function(endpoint, json=data)
+            with http_span(method.upper(), endpoint) as current:
+                if package:
+                    response = function(endpoint, data=data,
+                                        files={'file': package})
+                else:
+                    response = function(endpoint, json=data)
+                set_status(current, response.status_code)
         except requests.exceptions.ConnectionError:
             LOG.error("Couldn't connect to NApps server %s.", endpoint)
             sys.exit(1)
@@ -54,8 +62,17 @@ class CommonClient:
 class NAppsClient(CommonClient):
     """Client for the NApps Server."""
 
+    #: Seconds to reuse the NApps catalog. Zero disables the cache.
+    catalog_ttl = 0
+    _catalog = (0, None)
+
     def get_napps(self):
         """Get all NApps from the server."""
+        fetched_at, napps = NAppsClient._catalog
+        if napps is not None and time.monotonic() - fetched_at < \
+                self.catalog_ttl:
+            return napps
+
         endpoint = os.path.join(self._config.get('napps', 'api'), 'napps', '')
         res = self.make_request(endpoint)
 
@@ -64,7 +81,10 @@ class NAppsClient(CommonClient):
             LOG.error(msg, res.status_code, res.reason)
             sys.exit(1)
 
-        return json.loads(res.content.decode('utf-8'))['napps']
+        napps = json.loads(res.content.decode('utf-8'))['napps']
+        if self.catalog_ttl:
+            NAppsClient._catalog = (time.monotonic(), napps)
+        return napps
 
     def get_napp(self, username, name):
         """Return napp metadata or None if not found."""
@@ -93,13 +113,18 @@ class NAppsClient(CommonClient):
             api = self._config.get('kytos', 'api')
             endpoint = os.path.join(api, 'api', 'kytos', 'core', 'reload',
                                     'all')
-            response = self.make_request(endpoint)
+            with journaled(self._config, 'reload', endpoint) as entry:
+                response = self.make_request(endpoint)
+                entry['status'] = response.status_code
 
         for napp in napps:
             api = self._config.get('kytos', 'api')
             endpoint = os.path.join(api, 'api', 'kytos', 'core', 'reload',
                                     napp[0], napp[1])
-            response = self.make_request(endpoint)
+            with journaled(self._config, 'reload', endpoint,
+                           f'{napp[0]}/{napp[1]}') as entry:
+                response = self.make_request(endpoint)
+                entry['status'] = response.status_code
 
         if response.status_code != 200:
             raise KytosException('Error reloading the napp: Module not founded'
@@ -112,8 +137,18 @@ class NAppsClient(CommonClient):
         """Upload the napp from the current directory to the napps server."""
         endpoint = os.path.join(self._config.get('napps', 'api'), 'napps', '')
         metadata['token'] = self._config.get('auth', 'token')
-        response = self.make_request(endpoint, json=metadata, package=package,
-                                     method="POST")
+        napp_id = '{}/{}'.format(metadata.get('username',
+                                              metadata.get('author')),
+                                 metadata.get('name'))
+        # kytos_auth sends the same package again when the token is refused.
+        if hasattr(package, 'seek'):
+            package.seek(0)
+        with journaled(self._config, 'upload', endpoint, napp_id) as entry:
+            response = self.make_request(endpoint, json=metadata,
+                                         package=package, method="POST")
+            entry['status'] = response.status_code
+        if response.status_code == 401:
+            response.raise_for_status()  # kytos_auth retries with new token
         if response.status_code != 201:
             KytosConfig().clear_token()
             LOG.error("%s: %s - %s", response.status_code, response.reason,
@@ -138,7 +173,11 @@ class NAppsClient(CommonClient):
         api = self._config.get('napps', 'api')
         endpoint = os.path.join(api, 'napps', username, napp, '')
         content = {'token': self._config.get('auth', 'token')}
-        response = self.make_request(endpoint, json=content, method='DELETE')
+        with journaled(self._config, 'delete', endpoint,
+                       f'{username}/{napp}') as entry:
+            response = self.make_request(endpoint, json=content,
+                                         method='DELETE')
+            entry['status'] = response.status_code
         response.raise_for_status()
 
 
@@ -159,3 +198,16 @@ class UsersClient(CommonClient):
         res = self.make_request(endpoint, method='POST', json=user_dict)
 
         return res.content.decode('utf-8')
+
+    def register_user(self, user_dict):
+        """Register an user in NApps server and check the response.
+
+        Raises:
+            KytosException: If NApps server didn't register the user.
+
+        """
+        endpoint = os.path.join(self._config.get('napps', 'api'), 'users', '')
+        res = self.make_request(endpoint, method='POST', json=user_dict)
+        if res.status_code not in (200, 201):
+            raise KytosException(f'({res.status_code}) - '
+                                 f'{res.content.decode("utf-8")}')
@@ -0,0 +1,151 @@
+"""Shell completion for the kytos command line.
+
+Completion scripts never call Python while completing: they read plain text
+files from a local index, which ``kytos completion refresh`` rebuilds in
+background from the NApps server catalog and from kytosd.
+"""
+import logging
+import os
+import re
+import time
+from pathlib import Path
+
+from kytos.cli.commands.completion import parser as completion_parser
+from kytos.cli.commands.helper import parser as helper_parser
+from kytos.cli.commands.napps import parser as napps_parser
+from kytos.cli.commands.users import parser as users_parser
+from kytos.cli.commands.web import parser as web_parser
+from kytos.utils.client import NAppsClient
+from kytos.utils.exceptions import KytosException
+from kytos.utils.napps import NAppsManager
+from kytos.utils.settings import CACHE_PATH
+
+LOG = logging.getLogger(__name__)
+
+#: Commands and the parser modules documenting their subcommands.
+COMMANDS = {'napps': napps_parser, 'users': users_parser, 'web': web_parser,
+            'bug-report': None, 'doctor': None, 'helper': helper_parser,
+            'completion': completion_parser}
+
+#: NApp arguments: "command subcommand" -> (extra words, index file).
+NAPP_ARGS = {'napps install': ('', 'catalog'),
+             'napps delete': ('', 'catalog'),
+             'napps uninstall': ('', 'installed'),
+             'napps enable': ('all', 'disabled'),
+             'napps disable': ('all', 'enabled'),
+             'napps reload': ('all', 'installed')}
+
+TEMPLATES_PATH = Path(__file__).resolve().parent.parent / 'templates' / \
+    'completion'
+
+
+def get_subcommands(command, parser):
+    """Return the subcommands found in the usage of a parser module."""
+    if parser is None:
+        return []
+    found = re.findall(r'^\s+kytos {} ([a-z][\w-]*)'.format(command),
+                       parser.__doc__, re.MULTILINE)
+    return list(dict.fromkeys(found))
+
+
+def render_script(shell, max_age=5):
+    """Return the completion script for ``shell`` (bash or zsh)."""
+    subcommands = {command: get_subcommands(command, parser)
+                   for command, parser in COMMANDS.items()}
+    context = {'cache_dir': CompletionIndex().path, 'max_age': max_age,
+               'commands': list(COMMANDS),
+               'subcommands': {cmd: subs for cmd, subs in subcommands.items()
+                               if subs},
+               'napp_args': NAPP_ARGS}
+    return NAppsManager.render_template(TEMPLATES_PATH,
+                                        f'kytos.{shell}.template', context)
+
+
+class CompletionIndex:
+    """Plain text files with one NApp ID per line.
+
+    - ``catalog``: NApps in the NApps server, as ``user/name`` and
+      ``user/name:version``;
+    - ``installed``, ``enabled`` and ``disabled``: NApps in kytosd.
+    """
+
+    #: A refresh holding the lock for longer than this is considered dead.
+    LOCK_TIMEOUT = 60
+
+    def __init__(self, path=None):
+        """Set the index directory, by default inside the user cache."""
+        self.path = Path(path or CACHE_PATH / 'completion')
+
+    def read(self, name):
+        """Return the words of the index file ``name``."""
+        try:
+            return (self.path / name).read_text().split()
+        except FileNotFoundError:
+            return []
+
+    def _write(self, name, words):
+        """Replace the index file ``name`` atomically."""
+        tmp_file = self.path / f'.{name}.tmp'
+        tmp_file.write_text(''.join(f'{word}\n' for word in words))
+        os.replace(tmp_file, self.path / name)
+
+    def _acquire(self):
+        """Return whether no other refresh is running."""
+        lock = self.path / 'refresh.lock'
+        try:
+            os.close(os.open(lock, os.O_CREAT | os.O_EXCL))
+            return True
+        except FileExistsError:
+            if time.time() - lock.stat().st_mtime < self.LOCK_TIMEOUT:
+                return False
+            lock.touch()
+            return True
+
+    def refresh(self):
+        """Fetch NApp IDs and rewrite the index files.
+
+        Each source is optional: if the NApps server or kytosd can't be
+        reached, the corresponding files keep their previous content.
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+        if not self._acquire():
+            LOG.debug('Completion index is already being refreshed.')
+            return
+        try:
+            self._refresh_catalog()
+            self._refresh_local()
+        finally:
+            (self.path / 'refresh.lock').unlink()
+
+    def _refresh_catalog(self):
+        try:
+            napps = NAppsClient().get_napps()
+        # The client exits when it can't reach the NApps server.
+        except (KytosException, SystemExit):
+            LOG.warning('Could not fetch the NApps catalog.')
+            return
+
+        words = set()
+        for napp in napps:
+            # WARNING: This will change for future versions, when 'author'
+            # will be removed.
+            username = napp.get('username', napp.get('author'))
+            napp_id = '{}/{}'.format(username, napp.get('name'))
+            words.add(napp_id)
+            if napp.get('version'):
+                words.add('{}:{}'.format(napp_id, napp['version']))
+        self._write('catalog', sorted(words))
+
+    def _refresh_local(self):
+        mgr = NAppsManager()
+        try:
+            installed = mgr.get_installed()
+            enabled = mgr.get_enabled()
+        except KytosException:
+            LOG.warning('Could not list the NApps in kytosd.')
+            return
+
+        self._write('installed', ('/'.join(napp) for napp in installed))
+        self._write('enabled', ('/'.join(napp) for napp in enabled))
+        disabled = sorted(set(installed) - set(enabled))
+        self._write('disabled', ('/'.join(napp) for napp in disabled))
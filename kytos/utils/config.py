@@ -11,8 +11,10 @@ import logging
 import os
 import re
 import shutil
+import threading
 from collections import namedtuple
 from configparser import ConfigParser
+from contextlib import contextmanager
 from pathlib import Path
 from urllib.error import URLError
 from urllib.request import urlopen
@@ -51,6 +53,13 @@ class KytosConfig():
     order to get the correct paths and links.
     """
 
+    #: Long-lived processes set it to check versions only once.
+    check_versions_once = False
+    _versions_checked = False
+
+    #: Options replaced in the current thread, see :meth:`override`.
+    _overrides = threading.local()
+
     def __init__(self, config_file='~/.kytosrc'):
         """Init method.
 
@@ -79,6 +88,35 @@ class KytosConfig():
                 os.chmod(self.config_file, 0o0600)
                 self.config.write(output_file)
 
+        # Applied after saving: overrides are never written to the file.
+        for (section, name), value in self._get_overrides().items():
+            self.config.set(section, name, value)
+
+    @classmethod
+    def _get_overrides(cls):
+        if not hasattr(cls._overrides, 'options'):
+            cls._overrides.options = {}
+        return cls._overrides.options
+
+    @classmethod
+    @contextmanager
+    def override(cls, section, name, value):
+        """Make new configs of the current thread use ``value``.
+
+        It lets threads run commands against different controllers, e.g.
+        ``with KytosConfig.override('kytos', 'api', url):``.
+        """
+        overrides = cls._get_overrides()
+        previous = overrides.get((section, name))
+        overrides[(section, name)] = value
+        try:
+            yield
+        finally:
+            if previous is None:
+                del overrides[(section, name)]
+            else:
+                overrides[(section, name)] = previous
+
     def log_configs(self):
         """Log the read configs if debug is enabled."""
         for sec in self.config.sections():
@@ -100,7 +138,11 @@ class KytosConfig():
                    option('napps', 'repo', 'NAPPS_REPO_URI',
                           'https://napps.kytos.io/repo'),
                    option('kytos', 'api', 'KYTOS_API',
-                          'http://localhost:8181/')]
+                          'http://localhost:8181/'),
+                   option('global', 'journal', 'KYTOS_JOURNAL', None),
+                   option('global', 'trace', 'KYTOS_TRACE', None),
+                   option('global', 'trace_endpoint',
+                          'OTEL_EXPORTER_OTLP_TRACES_ENDPOINT', None)]
 
         for option in options:
             if not self.config.has_option(option.section, option.name):
@@ -119,8 +161,15 @@ class KytosConfig():
             if not config.has_section(section):
                 config.add_section(section)
 
-    def save_token(self, user, token):
-        """Save the token on the config file."""
+    def save_token(self, user, token, expires=None):
+        """Save the token on the config file.
+
+        Args:
+            user (str): NApps server username.
+            token (str): Token of ``user``.
+            expires (float): When the token expires, as a Unix timestamp.
+
+        """
         self.config.set('auth', 'user', user)
         self.config.set('auth', 'token', token)
         # allow_no_value=True is used to keep the comments on the config file.
@@ -133,10 +182,20 @@ class KytosConfig():
 
         new_config.set('auth', 'user', user)
         new_config.set('auth', 'token', token)
+        if expires is None:
+            new_config.remove_option('auth', 'token_expires')
+        else:
+            new_config.set('auth', 'token_expires', str(int(expires)))
+        self._write(new_config)
+
+    def _write(self, new_config):
+        """Replace the config file at once, never leaving it half written."""
         filename = os.path.expanduser(self.config_file)
-        with open(filename, 'w') as out_file:
-            os.chmod(filename, 0o0600)
+        tmp_name = f'{filename}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp_name, 'w') as out_file:
+            os.chmod(tmp_name, 0o0600)
             new_config.write(out_file)
+        os.replace(tmp_name, filename)
 
     def clear_token(self):
         """Clear Token information on config file."""
@@ -150,10 +209,8 @@ class KytosConfig():
 
         new_config.remove_option('auth', 'user')
         new_config.remove_option('auth', 'token')
-        filename = os.path.expanduser(self.config_file)
-        with open(filename, 'w') as out_file:
-            os.chmod(filename, 0o0600)
-            new_config.write(out_file)
+        new_config.remove_option('auth', 'token_expires')
+        self._write(new_config)
 
     @classmethod
     def get_metadata(cls):
@@ -175,6 +232,10 @@ class KytosConfig():
     @classmethod
     def check_versions(cls):
         """Check if kytos and kytos-utils metadata are compatible."""
+        if cls.check_versions_once and cls._versions_checked:
+            return
+        cls._versions_checked = True
+
         try:
             kytos_metadata = cls.get_remote_metadata()
             kytos_version = kytos_metadata.get('__version__')
@@ -1,19 +1,55 @@
 """Decorators for Kytos-utils."""
+import fcntl
 import logging
 import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import partial
 from getpass import getpass
 
 import requests
 
 from kytos.utils.config import KytosConfig
+from kytos.utils.exceptions import KytosException
 
 LOG = logging.getLogger(__name__)
 
+#: Seconds a new token is assumed to be valid, as NApps server doesn't say.
+TOKEN_LIFETIME = 12 * 3600
+
+#: Tokens expiring within these seconds are renewed before being used.
+REFRESH_MARGIN = 300
+
+#: Password prompts before giving up authenticating.
+MAX_ATTEMPTS = 3
+
+_THREAD_LOCK = threading.Lock()
+
+
+@contextmanager
+def token_lock(config_file):
+    """Hold the token of ``config_file`` among threads and processes.
+
+    Whoever holds it checks, and if needed renews, the saved token, so that
+    parallel uploads and fan-out jobs authenticate only once.
+    """
+    with _THREAD_LOCK, open(f'{config_file}.lock', 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
 
 # This class is used as decorator, so this class name is lowercase and the
 # invalid-name warning from pylint is disabled below.
 class kytos_auth:  # pylint: disable=invalid-name
-    """Class to be used as decorator to require authentication."""
+    """Class to be used as decorator to require authentication.
+
+    A call whose token is refused with HTTP 401, raised as
+    ``requests.HTTPError``, is retried once with a new token.
+    """
 
     def __init__(self, func):
         """Init method.
@@ -21,12 +57,27 @@ class kytos_auth:  # pylint: disable=invalid-name
         Save the function on the func attribute and bootstrap a new config.
         """
         self.func = func
-        self.config = KytosConfig().config
+        kytos_config = KytosConfig()
+        self.config = kytos_config.config
+        self.config_file = kytos_config.config_file
         self.cls = None
         self.obj = None
 
     def __call__(self, *args, **kwargs):
         """Code run when func is called."""
+        return self.call(self.obj, *args, **kwargs)
+
+    def __get__(self, instance, owner):
+        """Deal with owner class."""
+        self.cls = owner
+        self.obj = instance
+
+        # Bound to the instance, as other threads may get the decorator
+        # of other instances meanwhile.
+        return partial(self.call, instance)
+
+    def call(self, obj, *args, **kwargs):
+        """Authenticate, if needed, and call func on ``obj``."""
         if not (self.config.has_option('napps', 'api') and
                 self.config.has_option('napps', 'repo')):
             uri = input("Enter the kytos napps server address: ")
@@ -36,50 +87,76 @@ class kytos_auth:  # pylint: disable=invalid-name
         if not self.config.has_option('auth', 'user'):
             user = input("Enter the username: ")
             self.config.set('auth', 'user', user)
-        else:
-            user = self.config.get('auth', 'user')
-
-        if not self.config.has_option('auth', 'token'):
-            token = self.authenticate()
-        else:
-            token = self.config.get('auth', 'token')
 
+        token = self.get_token()
+        try:
+            return self._call_with(obj, token, *args, **kwargs)
+        except requests.HTTPError as exception:
+            if getattr(exception.response, 'status_code', None) != 401:
+                raise
+            LOG.info('Token refused by NApps server, authenticating again.')
+        return self._call_with(obj, self.get_token(refused=token), *args,
+                               **kwargs)
+
+    def _call_with(self, obj, token, *args, **kwargs):
         # Ignore private attribute warning. We don't wanna make it public only
         # because of a decorator.
-        config = self.obj._config  # pylint: disable=protected-access
-        config.set('auth', 'user', user)
+        config = obj._config  # pylint: disable=protected-access
+        config.set('auth', 'user', self.config.get('auth', 'user'))
         config.set('auth', 'token', token)
-        self.func.__call__(self.obj, *args, **kwargs)
+        return self.func.__call__(obj, *args, **kwargs)
 
-    def __get__(self, instance, owner):
-        """Deal with owner class."""
-        self.cls = owner
-        self.obj = instance
+    def get_token(self, refused=None):
+        """Return the saved token, unless it is about to expire.
+
+        The config file is read again, as another thread or process may
+        have renewed the token, and a new one is requested otherwise.
 
-        return self.__call__
+        Args:
+            refused (str): Token refused by NApps server, not to be used.
+
+        """
+        with token_lock(self.config_file):
+            saved = KytosConfig(self.config_file).config
+            if saved.has_option('auth', 'token'):
+                token = saved.get('auth', 'token')
+                expires = saved.get('auth', 'token_expires', fallback=None)
+                if token and token != refused and (
+                        expires is None or
+                        float(expires) - time.time() > REFRESH_MARGIN):
+                    return token
+            return self.authenticate()
 
-    # pylint: disable=inconsistent-return-statements
     def authenticate(self):
-        """Check the user authentication."""
-        endpoint = os.path.join(self.config.get('napps', 'api'), 'auth', '')
-        username = self.config.get('auth', 'user')
-        password = getpass('Enter the password for {}: '.format(username))
-        response = requests.get(endpoint, auth=(username, password))
+        """Ask for the password and return a new token.
+
+        The token is saved with its expiry time.
 
-        # Check if it is unauthorized
-        if response.status_code == 401:
-            print(f'Error with status code: {response.status_code}.\n'
-                  'Possible causes: incorrect credentials, the token was '
-                  'not set or was expired.')
+        Raises:
+            KytosException: If the authentication fails MAX_ATTEMPTS times.
 
-        if response.status_code != 201:
+        """
+        endpoint = os.path.join(self.config.get('napps', 'api'), 'auth', '')
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            username = self.config.get('auth', 'user')
+            password = getpass('Enter the password for {}: '.format(username))
+            response = requests.get(endpoint, auth=(username, password))
+
+            if response.status_code == 201:
+                token = response.json().get('hash')
+                KytosConfig(self.config_file).save_token(
+                    username, token, time.time() + TOKEN_LIFETIME)
+                return token
+
+            # Check if it is unauthorized
+            if response.status_code == 401:
+                print(f'Error with status code: {response.status_code}.\n'
+                      'Possible causes: incorrect credentials, the token was '
+                      'not set or was expired.')
             LOG.error(response.content)
             LOG.error('ERROR: %s: %s', response.status_code, response.reason)
-            print('Press Ctrl+C or CTRL+Z to stop the process.')
-            user = input('Enter the username: ')
-            self.config.set('auth', 'user', user)
-            self.authenticate()
-        else:
-            data = response.json()
-            KytosConfig().save_token(username, data.get('hash'))
-            return data.get('hash')
+            if attempt < MAX_ATTEMPTS:
+                print('Press Ctrl+C or CTRL+Z to stop the process.')
+                user = input('Enter the username: ')
+                self.config.set('auth', 'user', user)
+        raise KytosException(f'Authentication failed {MAX_ATTEMPTS} times.')
@@ -0,0 +1,133 @@
+"""Dependency graphs of NApps.
+
+Graphs are dicts mapping a NApp to the NApps it depends on, both as
+``(username, name)`` tuples, as given by the ``napp_dependencies`` of
+``kytos.json``.
+"""
+import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import requests
+
+from kytos.utils.exceptions import KytosException
+
+LOG = logging.getLogger(__name__)
+
+#: Default number of metadata requests made at the same time.
+MAX_WORKERS = 8
+
+
+def parse_napp_id(napp_id):
+    """Return (username, name) of a "username/name" string."""
+    username, name = napp_id.split('/')
+    return username, name
+
+
+def catalog_graph(catalog):
+    """Return the dependency graph of the NApps in a NApps server catalog.
+
+    Args:
+        catalog (list): NApps metadata, as in ``NAppsClient.get_napps``.
+
+    """
+    graph = {}
+    for napp in catalog:
+        # WARNING: This will change for future versions, when 'author' will
+        # be removed.
+        username = napp.get('username', napp.get('author'))
+        graph[(username, napp['name'])] = [
+            parse_napp_id(dependency)
+            for dependency in napp.get('napp_dependencies') or []]
+    return graph
+
+
+def discover(napps, fetch, max_workers=MAX_WORKERS):
+    """Return the dependency graph of ``napps`` and all their dependencies.
+
+    Metadata is requested concurrently and the dependencies of each NApp are
+    requested as soon as its metadata arrives, so discovery takes about as
+    long as the deepest dependency chain instead of one request per NApp.
+
+    Args:
+        napps (iterable): (username, name) of the NApps.
+        fetch (callable): Return the metadata of ``fetch(username, name)``,
+            or None if it is unknown, as ``MetadataCache.get``.
+        max_workers (int): Maximum number of simultaneous requests.
+
+    Returns:
+        dict: Dependency graph. NApps without metadata, including those
+            whose metadata couldn't be requested, as when the NApps server
+            is unreachable, are left out.
+
+    """
+    graph = {}
+    seen = set(napps)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {executor.submit(fetch, *napp): napp for napp in seen}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                napp = pending.pop(future)
+                try:
+                    metadata = future.result()
+                # make_request exits when the server can't be reached.
+                except (KytosException, SystemExit,
+                        requests.RequestException) as exception:
+                    LOG.warning('Could not get metadata of %s/%s: %s',
+                                *napp, exception)
+                    continue
+                if metadata is None:
+                    continue
+                graph[napp] = [parse_napp_id(dependency) for dependency
+                               in metadata.get('napp_dependencies') or []]
+                for dependency in graph[napp]:
+                    if dependency not in seen:
+                        seen.add(dependency)
+                        pending[executor.submit(fetch, *dependency)] = \
+                            dependency
+    return graph
+
+
+def closure(napps, graph):
+    """Return ``napps`` and all their transitive dependencies.
+
+    Dependencies missing from ``graph`` are included, with no dependencies
+    of their own.
+    """
+    found = set()
+    pending = list(napps)
+    while pending:
+        napp = pending.pop()
+        if napp not in found:
+            found.add(napp)
+            pending.extend(graph.get(napp, ()))
+    return found
+
+
+def levels(napps, graph):
+    """Split ``napps`` in levels that depend only on previous levels.
+
+    NApps in the same level don't depend on each other, so they can be
+    handled concurrently. Dependencies outside ``napps`` are ignored.
+
+    Returns:
+        list: Sorted lists of NApps, dependencies first.
+
+    Raises:
+        KytosException: If there is a dependency cycle.
+
+    """
+    napps = set(napps)
+    pending = {napp: set(graph.get(napp, ())) & napps for napp in napps}
+    result = []
+    while pending:
+        level = sorted(napp for napp, deps in pending.items() if not deps)
+        if not level:
+            cycle = ', '.join('/'.join(napp) for napp in sorted(pending))
+            raise KytosException(f'Dependency cycle among: {cycle}')
+        result.append(level)
+        for napp in level:
+            del pending[napp]
+        for deps in pending.values():
+            deps.difference_update(level)
+    return result
@@ -0,0 +1,238 @@
+"""Measure how the servers the CLI depends on answer."""
+import json
+import os
+import socket
+import ssl
+import statistics
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from kytos.utils.config import KytosConfig
+from kytos.utils.napps import NAppsManager
+
+#: kytosd endpoints requested by most commands.
+KYTOSD_ENDPOINTS = ('api/kytos/core/config/',
+                    'api/kytos/core/metadata/',
+                    'api/kytos/core/napps_enabled',
+                    'api/kytos/core/napps_installed')
+
+
+def probe(url, samples=3, timeout=2, deadline=None):
+    """Request ``url`` a few times and return how long each request took.
+
+    A new connection is opened for every request, as the CLI does.
+
+    Args:
+        url (str): URL requested with GET.
+        samples (int): Number of requests.
+        timeout (float): Seconds to wait for each answer.
+        deadline (float): ``time.monotonic()`` value after which no request
+            is made or waited for. The samples taken until then are kept.
+
+    Returns:
+        dict: The ``url``, the last HTTP ``status``, the ``seconds`` of each
+            request, their ``median`` and the ``error`` that stopped the
+            probe, if any.
+
+    """
+    result = {'url': url, 'status': None, 'seconds': [], 'median': None,
+              'error': None}
+    for _ in range(samples):
+        wait = timeout
+        if deadline is not None:
+            wait = min(timeout, deadline - time.monotonic())
+            if wait <= 0:
+                if not result['seconds']:
+                    result['error'] = 'timed out'
+                break
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(url, timeout=wait) as response:
+                response.read()
+                result['status'] = response.status
+        except urllib.error.HTTPError as exception:
+            result['status'] = exception.code
+        except (urllib.error.URLError, OSError) as exception:
+            result['error'] = str(getattr(exception, 'reason', exception))
+            break
+        result['seconds'].append(round(time.perf_counter() - start, 6))
+    if result['seconds']:
+        result['median'] = statistics.median(result['seconds'])
+    return result
+
+
+def probe_kytosd(api=None, samples=3, timeout=2, total=None):
+    """Return the probes of KYTOSD_ENDPOINTS.
+
+    The endpoints are probed concurrently. With ``total``, probes stop
+    sampling when it runs out, and those still waiting for a connection
+    are given up, so a slow endpoint can't hide the others.
+
+    Args:
+        api (str): kytosd URL. Defaults to the configured one.
+        samples (int): Requests to each endpoint.
+        timeout (float): Seconds to wait for each answer.
+        total (float): Seconds for all probes. Unlimited by default.
+
+    """
+    api = api or KytosConfig().config.get('kytos', 'api')
+    deadline = None if total is None else time.monotonic() + total
+    urls = [api + endpoint for endpoint in KYTOSD_ENDPOINTS]
+    results = {}
+
+    def run(url):
+        results[url] = probe(url, samples, timeout, deadline)
+
+    threads = [threading.Thread(target=run, args=(url,), daemon=True)
+               for url in urls]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(None if deadline is None
+                    else max(0, deadline - time.monotonic()))
+    return [results.get(url) or {'url': url, 'status': None, 'seconds': [],
+                                 'median': None,
+                                 'error': f'no answer in {total}s'}
+            for url in urls]
+
+
+def _resolve(host, port, timeout):
+    """Return the first TCP address of ``host``, within ``timeout`` seconds.
+
+    getaddrinfo can't be given a timeout, so it is left behind in a daemon
+    thread when it takes too long.
+    """
+    resolved = {}
+
+    def resolve():
+        try:
+            resolved['address'] = socket.getaddrinfo(
+                host, port, type=socket.SOCK_STREAM)[0]
+        except OSError as exception:
+            resolved['error'] = exception
+
+    thread = threading.Thread(target=resolve, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if 'error' in resolved:
+        raise resolved['error']
+    if 'address' not in resolved:
+        raise socket.timeout(f'name resolution timed out after {timeout}s')
+    return resolved['address']
+
+
+def time_connection(url, timeout=5):
+    """Return the seconds spent in each phase of a GET request to ``url``.
+
+    The phases are name resolution (``dns``), TCP connection (``tcp``), TLS
+    handshake (``tls``, None for plain HTTP) and waiting for the first byte
+    of the answer (``first_byte``). Each phase may take up to ``timeout``
+    seconds. Phases after a failure are None and the failure is in
+    ``error``.
+    """
+    parts = urlsplit(url)
+    https = parts.scheme == 'https'
+    port = parts.port or (443 if https else 80)
+    result = {'url': url, 'dns': None, 'tcp': None, 'tls': None,
+              'first_byte': None, 'error': None}
+
+    sock = None
+    try:
+        start = time.perf_counter()
+        address = _resolve(parts.hostname, port, timeout)
+        result['dns'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        sock = socket.socket(address[0], address[1], address[2])
+        sock.settimeout(timeout)
+        sock.connect(address[4])
+        result['tcp'] = time.perf_counter() - start
+
+        if https:
+            start = time.perf_counter()
+            sock = ssl.create_default_context().wrap_socket(
+                sock, server_hostname=parts.hostname)
+            result['tls'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        path = parts.path or '/'
+        sock.sendall(f'GET {path} HTTP/1.1\r\nHost: {parts.netloc}\r\n'
+                     'Connection: close\r\n\r\n'.encode())
+        if not sock.recv(1):
+            raise ConnectionError('connection closed without an answer')
+        result['first_byte'] = time.perf_counter() - start
+    except OSError as exception:
+        result['error'] = str(exception)
+    else:
+        # Let the server finish writing instead of resetting the connection,
+        # unless it keeps the connection open: the timings are taken.
+        try:
+            while sock.recv(65536):
+                pass
+        except OSError:
+            pass
+    finally:
+        if sock is not None:
+            sock.close()
+    return result
+
+
+def time_download(url, timeout=30):
+    """Download ``url`` and return its size, duration and throughput.
+
+    Returns:
+        dict: The ``url``, ``bytes``, ``seconds``, ``throughput`` in bytes
+            per second and ``error``, if the download failed.
+
+    """
+    result = {'url': url, 'bytes': 0, 'seconds': None, 'throughput': None,
+              'error': None}
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            result['bytes'] = len(response.read())
+    except (urllib.error.URLError, OSError) as exception:
+        result['error'] = str(getattr(exception, 'reason', exception))
+        return result
+    result['seconds'] = time.perf_counter() - start
+    result['throughput'] = result['bytes'] / max(result['seconds'], 1e-9)
+    return result
+
+
+def time_package_build(files=200, file_size=4096):
+    """Build a scratch NApp package and return how long it took.
+
+    The NApp is created in a temporary directory, like the ones of
+    ``kytos napps upload``, so this measures the local disk and compression.
+
+    Returns:
+        dict: Number of ``files``, uncompressed ``bytes``, package size in
+            ``compressed`` and ``seconds``.
+
+    """
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        napp_path = Path(tmp_dir, 'doctor', 'scratch')
+        napp_path.mkdir(parents=True)
+        Path(tmp_dir, '.gitignore').write_text('*.pyc\n__pycache__\n')
+        napp_path.joinpath('kytos.json').write_text(json.dumps(
+            {'username': 'doctor', 'name': 'scratch', 'version': '1.0'}))
+        for index in range(files):
+            napp_path.joinpath(f'module{index}.py').write_text(
+                os.urandom(file_size // 2).hex())
+
+        os.chdir(tmp_dir)
+        try:
+            start = time.perf_counter()
+            with NAppsManager.build_napp_package('scratch') as package:
+                compressed = len(package.read())
+            seconds = time.perf_counter() - start
+        finally:
+            os.chdir(cwd)
+    return {'files': files, 'bytes': files * (file_size // 2) * 2,
+            'compressed': compressed, 'seconds': seconds}
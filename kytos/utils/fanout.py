@@ -0,0 +1,200 @@
+"""Run CLI commands against several controllers at once.
+
+Controllers and groups of controllers are named in ``~/.kytosrc``::
+
+    [controllers]
+    core1 = http://10.0.0.1:8181/
+    core2 = http://10.0.0.2:8181/
+    edge1 = http://10.0.1.1:8181/
+
+    [controller_groups]
+    core = core1, core2
+
+Commands given ``--controllers=core,edge1`` (or ``all``) run once per
+controller, in parallel threads. In each thread, KytosConfig returns the
+controller's URL as ``kytos.api`` and the output of the command is captured,
+so it can be printed per controller when all of them finish.
+"""
+import io
+import logging
+import sys
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from kytos.utils.config import KytosConfig
+from kytos.utils.exceptions import KytosException
+from kytos.utils.tracing import span
+
+LOG = logging.getLogger(__name__)
+
+#: Default number of controllers handled at the same time.
+MAX_WORKERS = 8
+
+#: Outcome of a command in a controller.
+Result = namedtuple('Result', ['controller', 'url', 'ok', 'seconds',
+                               'output', 'error'])
+
+
+def select_controllers(selector, config=None):
+    """Return {name: url} of the controllers chosen by ``selector``.
+
+    Args:
+        selector (str): Comma-separated controller and group names, or
+            "all" for every controller.
+        config (ConfigParser): Configuration. Defaults to ~/.kytosrc.
+
+    Raises:
+        KytosException: If a name is neither a controller nor a group.
+
+    """
+    config = config or KytosConfig().config
+    controllers = dict(config.items('controllers')) \
+        if config.has_section('controllers') else {}
+    groups = dict(config.items('controller_groups')) \
+        if config.has_section('controller_groups') else {}
+
+    selected = []
+    for name in (name.strip() for name in selector.split(',')):
+        if name == 'all':
+            selected.extend(controllers)
+        elif name in groups:
+            selected.extend(item.strip() for item in groups[name].split(','))
+        else:
+            selected.append(name)
+
+    unknown = [name for name in selected if name not in controllers]
+    if unknown or not selected:
+        raise KytosException('Unknown controllers or groups: {}. Check the '
+                             '[controllers] and [controller_groups] sections '
+                             'of your configuration.'.format(
+                                 ', '.join(unknown) or selector))
+    return {name: controllers[name] for name in dict.fromkeys(selected)}
+
+
+class _Capture(threading.local):
+    """Output and error count of the command running in each thread."""
+
+    buffer = None
+    errors = 0
+
+
+class _ThreadStream:
+    """Stream writing to the capture buffer of the current thread, if any."""
+
+    def __init__(self, capture, stream):
+        self._capture = capture
+        self._stream = stream
+
+    def write(self, data):
+        """Write to the thread buffer or to the original stream."""
+        target = self._capture.buffer
+        return (self._stream if target is None else target).write(data)
+
+    def flush(self):
+        """Flush the original stream."""
+        self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+class _ErrorCounter(logging.Handler):
+    """Count the errors logged by the command of each thread."""
+
+    def __init__(self, capture):
+        super().__init__(logging.ERROR)
+        self._capture = capture
+
+    def emit(self, record):
+        if self._capture.buffer is not None:
+            self._capture.errors += 1
+
+
+def fan_out(controllers, func, *args, max_workers=MAX_WORKERS):
+    """Run ``func(*args)`` once for each controller.
+
+    A command is successful if it neither raises nor logs errors.
+
+    Args:
+        controllers (dict): URL of each controller name.
+        func (callable): Command to be run.
+        max_workers (int): Maximum number of concurrent controllers.
+
+    Returns:
+        list: A Result for each controller, in the given order.
+
+    """
+    capture = _Capture()
+    root = logging.getLogger()
+    counter = _ErrorCounter(capture)
+    streams = [handler for handler in root.handlers
+               if isinstance(handler, logging.StreamHandler)]
+    saved = (sys.stdout, sys.stderr, [h.stream for h in streams])
+
+    def run(name, url):
+        capture.buffer, capture.errors = io.StringIO(), 0
+        error = None
+        start = time.perf_counter()
+        try:
+            with KytosConfig.override('kytos', 'api', url), \
+                    span(f'controller {name}', **{'kytos.controller': name,
+                                                  'url.full': url}):
+                func(*args)
+        except SystemExit as exception:
+            if exception.code not in (None, 0):
+                error = f'exit status {exception.code}'
+        # The other controllers must go on whatever happens in this one.
+        except Exception as exception:  # pylint: disable=broad-except
+            error = repr(exception)
+        seconds = time.perf_counter() - start
+        output, errors = capture.buffer.getvalue(), capture.errors
+        capture.buffer = None
+        return Result(name, url, error is None and not errors, seconds,
+                      output, error)
+
+    sys.stdout = _ThreadStream(capture, saved[0])
+    sys.stderr = _ThreadStream(capture, saved[1])
+    for handler in streams:
+        handler.stream = _ThreadStream(capture, handler.stream)
+    root.addHandler(counter)
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(run, controllers, controllers.values()))
+    finally:
+        root.removeHandler(counter)
+        sys.stdout, sys.stderr = saved[0], saved[1]
+        for handler, stream in zip(streams, saved[2]):
+            handler.stream = stream
+
+
+def print_results(results):
+    """Print the output of each controller and then a result matrix."""
+    for result in results:
+        print(f'## {result.controller} ({result.url})')
+        print(result.output.rstrip('\n') or '(no output)')
+    print()
+    width = max([len('Controller')] + [len(r.controller) for r in results])
+    print('{:<{}}  {:<6}  {:>8}'.format('Controller', width, 'Result',
+                                        'Time (s)'))
+    for result in results:
+        print('{:<{}}  {:<6}  {:>8.3f}  {}'.format(
+            result.controller, width, 'ok' if result.ok else 'FAILED',
+            result.seconds, result.error or '').rstrip())
+    failed = sum(not result.ok for result in results)
+    print(f'{len(results) - failed} succeeded, {failed} failed.')
+
+
+def run_on_controllers(selector, func, *args, max_workers=MAX_WORKERS):
+    """Run a command on the selected controllers and print the results.
+
+    Returns:
+        bool: Whether the command succeeded in all controllers.
+
+    """
+    controllers = select_controllers(selector)
+    LOG.info('Running on %d controllers...', len(controllers))
+    results = fan_out(controllers, func, *args, max_workers=max_workers)
+    print_results(results)
+    return all(result.ok for result in results)
@@ -0,0 +1,82 @@
+"""Long-lived helper process that runs CLI commands with a warm state.
+
+The ``kytos`` script forwards eligible commands to the helper through a Unix
+socket, so it doesn't pay for imports, config parsing, the version check and
+new TCP connections on every invocation. This module is imported before
+anything else by ``bin/kytos``, so the client side must stay cheap to import.
+"""
+import json
+import os
+import shutil
+import socket
+import sys
+
+#: Non-interactive (command, subcommand) pairs that may run in the helper.
+HELPER_COMMANDS = {('napps', 'list'), ('napps', 'search'),
+                   ('napps', 'install'), ('napps', 'uninstall'),
+                   ('napps', 'enable'), ('napps', 'disable'),
+                   ('napps', 'reload'), ('web', 'update')}
+
+
+def socket_path():
+    """Return the path of the helper Unix socket."""
+    if os.environ.get('KYTOS_HELPER_SOCKET'):
+        return os.environ['KYTOS_HELPER_SOCKET']
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        return os.path.join(runtime_dir, 'kytos', 'helper.sock')
+    return os.path.join(os.path.expanduser('~'), '.kytos', 'helper.sock')
+
+
+def is_eligible(argv):
+    """Whether the command line in ``argv`` may be run by the helper."""
+    if os.environ.get('KYTOS_NO_HELPER') or len(argv) < 2:
+        return False
+    if any(arg in ('-h', '--help') for arg in argv):
+        return False
+    return (argv[0], argv[1]) in HELPER_COMMANDS
+
+
+def send(request, path=None, timeout=None):
+    """Send ``request`` to the helper and return its decoded answer.
+
+    Raises:
+        OSError: If the helper is not running or the connection fails.
+
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(path or socket_path())
+        sock.sendall(json.dumps(request).encode('utf-8'))
+        sock.shutdown(socket.SHUT_WR)
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    return json.loads(b''.join(chunks).decode('utf-8'))
+
+
+def forward(argv):
+    """Run ``argv`` in the helper, if one is running.
+
+    Returns:
+        int: The command exit status, or None if the command must run in
+            the current process.
+
+    """
+    path = socket_path()
+    if not (is_eligible(argv) and os.path.exists(path)):
+        return None
+    # The helper has no terminal: it gets the width in COLUMNS, read by
+    # shutil.get_terminal_size().
+    env = dict(os.environ,
+               COLUMNS=str(shutil.get_terminal_size().columns))
+    try:
+        answer = send({'argv': argv, 'cwd': os.getcwd(), 'env': env}, path)
+    except (OSError, ValueError):
+        return None
+    sys.stdout.write(answer.get('stdout', ''))
+    sys.stderr.write(answer.get('stderr', ''))
+    return answer.get('status', 0)
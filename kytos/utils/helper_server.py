@@ -0,0 +1,188 @@
+"""Server side of the kytos CLI helper process.
+
+Run it with ``kytos helper start``. See :mod:`kytos.utils.helper` for the
+client side used by ``bin/kytos``.
+"""
+import io
+import json
+import logging
+import os
+import socketserver
+import sys
+import time
+from contextlib import redirect_stderr, redirect_stdout
+
+import requests
+
+from kytos.cli.commands.napps import parser as napps_parser
+from kytos.cli.commands.web import parser as web_parser
+from kytos.utils import tracing
+from kytos.utils.client import CommonClient, NAppsClient
+from kytos.utils.config import KytosConfig
+from kytos.utils.helper import HELPER_COMMANDS, socket_path
+
+LOG = logging.getLogger(__name__)
+
+PARSERS = {'napps': napps_parser, 'web': web_parser}
+
+
+class _StderrProxy:
+    """Stream that writes to whatever ``sys.stderr`` currently is.
+
+    It lets the logging handler follow the per-request redirection.
+    """
+
+    @staticmethod
+    def write(data):
+        """Write to the current stderr."""
+        sys.stderr.write(data)
+
+    @staticmethod
+    def flush():
+        """Flush the current stderr."""
+        sys.stderr.flush()
+
+
+def run_command(argv, cwd=None, env=None):
+    """Run a CLI command in-process and return its outputs and status.
+
+    Args:
+        argv (list): Command line, without "kytos".
+        cwd (str): Working directory of the client.
+        env (dict): Environment of the client, including ``COLUMNS``.
+
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    status = 0
+    if (argv[0], argv[1]) not in HELPER_COMMANDS:
+        stderr.write(f'Command not supported by the helper: {argv[:2]}\n')
+        return {'stdout': '', 'stderr': stderr.getvalue(), 'status': 2}
+
+    saved = sys.argv, os.getcwd(), dict(os.environ)
+    sys.argv = ['kytos'] + list(argv)
+    try:
+        if env is not None:
+            os.environ.clear()
+            os.environ.update(env)
+        if cwd is not None:
+            os.chdir(cwd)
+        with redirect_stdout(stdout), redirect_stderr(stderr), \
+                tracing.command(argv, KytosConfig().config):
+            PARSERS[argv[0]].parse(list(argv))
+    except SystemExit as exit_exc:
+        if isinstance(exit_exc.code, int):
+            status = exit_exc.code
+        elif exit_exc.code is not None:
+            stderr.write(f'{exit_exc.code}\n')
+            status = 1
+    except Exception as exception:  # pylint: disable=broad-except
+        stderr.write(f'Error: {exception}\n')
+        status = 1
+    finally:
+        sys.argv = saved[0]
+        os.chdir(saved[1])
+        os.environ.clear()
+        os.environ.update(saved[2])
+    return {'stdout': stdout.getvalue(), 'stderr': stderr.getvalue(),
+            'status': status}
+
+
+class HelperRequestHandler(socketserver.StreamRequestHandler):
+    """Handle one request from ``bin/kytos``."""
+
+    def handle(self):
+        """Read a JSON request until EOF and write a JSON answer."""
+        try:
+            request = json.loads(self.rfile.read().decode('utf-8'))
+        except ValueError:
+            return
+
+        if request.get('command') == 'stop':
+            self.server.running = False
+            answer = {'status': 0}
+        elif request.get('command') == 'status':
+            answer = {'status': 0, 'pid': os.getpid(),
+                      'started': self.server.started,
+                      'requests': self.server.requests}
+        else:
+            self.server.requests += 1
+            answer = run_command(request.get('argv', []),
+                                 request.get('cwd'), request.get('env'))
+        self.wfile.write(json.dumps(answer).encode('utf-8'))
+
+
+class HelperServer(socketserver.UnixStreamServer):
+    """Serve CLI commands one at a time until stopped or idle for too long.
+
+    Commands run sequentially because they share ``sys.stdout`` and
+    ``sys.argv``; the gain comes from the warm state, not from concurrency.
+    """
+
+    def __init__(self, path=None, idle_timeout=1800):
+        """Bind the Unix socket, readable only by the current user.
+
+        Args:
+            path (str): Socket path. Defaults to :func:`socket_path`.
+            idle_timeout (float): Seconds without requests before exiting.
+
+        """
+        self.path = path or socket_path()
+        os.makedirs(os.path.dirname(self.path), mode=0o700, exist_ok=True)
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self.timeout = idle_timeout
+        self.running = True
+        self.started = time.time()
+        self.requests = 0
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(self.path, HelperRequestHandler)
+        finally:
+            os.umask(old_umask)
+
+    def handle_timeout(self):
+        """Exit when no request has arrived within ``timeout`` seconds."""
+        LOG.info('Helper idle for %ss, exiting.', self.timeout)
+        self.running = False
+
+    def serve(self):
+        """Warm up and handle requests until stopped."""
+        self.warm_up()
+        try:
+            while self.running:
+                self.handle_request()
+        finally:
+            self.server_close()
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+    @staticmethod
+    def warm_up():
+        """Prepare the state shared by all commands run by the helper.
+
+        The config is parsed and the kytosd version is checked once, HTTP
+        connections to the NApps server are pooled and the NApps catalog is
+        reused for a minute. NApps installed or enabled in kytosd are always
+        fetched again because other clients may change them.
+        """
+        handler = logging.StreamHandler(_StderrProxy())
+        handler.setFormatter(logging.Formatter('%(levelname)-5s %(message)s'))
+        root = logging.getLogger()
+        root.handlers = [handler]
+        root.setLevel(logging.INFO)
+
+        KytosConfig()
+        KytosConfig.check_versions_once = True
+        KytosConfig.check_versions()
+        CommonClient.session = requests.Session()
+        NAppsClient.catalog_ttl = 60
+
+
+def main():
+    """Run the helper in the foreground."""
+    idle_timeout = float(sys.argv[1]) if len(sys.argv) > 1 else 1800
+    HelperServer(idle_timeout=idle_timeout).serve()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""JSON-lines journal of the actions the CLI asks servers to perform.
+
+When ``journal`` is set in the ``[global]`` section of ``~/.kytosrc`` (or
+``KYTOS_JOURNAL`` in the environment), every install, uninstall, enable,
+disable, reload, upload, delete and web update request appends a line
+such as::
+
+    {"action": "enable", "napp": "kytos/of_core",
+     "endpoint": "http://localhost:8181/api/kytos/core/napps/.../enable",
+     "start": "2022-03-01T12:00:00.123456+00:00",
+     "end": "2022-03-01T12:00:00.234567+00:00", "seconds": 0.111111,
+     "result": "ok", "pid": 4242}
+
+Failed requests have ``"result": "error"`` and an ``error`` message, and
+requests answered with an HTTP status also record it in ``status``.
+
+The file is kept open in append mode and each entry is written with a
+single ``write``, so concurrent threads and processes don't interleave
+lines and the journal can stay on without slowing the CLI down.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+LOG = logging.getLogger(__name__)
+
+_FILES = {}
+_FILES_LOCK = threading.Lock()
+
+
+def _timestamp(seconds):
+    return datetime.fromtimestamp(seconds, timezone.utc).isoformat()
+
+
+def _file(path):
+    """Return a file descriptor to append to ``path``, opened only once."""
+    with _FILES_LOCK:
+        if path not in _FILES:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            _FILES[path] = os.open(path, os.O_WRONLY | os.O_APPEND |
+                                   os.O_CREAT, 0o600)
+        return _FILES[path]
+
+
+def write_entry(path, entry):
+    """Append ``entry`` to the journal in ``path`` as a JSON line.
+
+    Errors are only logged: the journal never stops a command.
+    """
+    line = json.dumps(entry, separators=(', ', ': ')) + '\n'
+    try:
+        os.write(_file(os.path.expanduser(path)), line.encode())
+    except OSError as exception:
+        LOG.debug('Could not write to journal %s: %s', path, exception)
+
+
+@contextmanager
+def journaled(config, action, endpoint, napp=None):
+    """Journal the request made inside the block, if a journal is set.
+
+    The block may set the HTTP ``status`` of the response in the yielded
+    entry: statuses from 400 on are errors. Exceptions are journaled as
+    errors and raised again.
+
+    Args:
+        config (ConfigParser): Configuration with the journal path.
+        action (str): Action requested, such as "install".
+        endpoint (str): URL of the request.
+        napp (str): "username/name" of the NApp, if any.
+
+    """
+    path = config.has_option('global', 'journal') and \
+        config.get('global', 'journal')
+    entry = {}
+    if not path:
+        yield entry
+        return
+
+    start, counter = time.time(), time.perf_counter()
+    error = None
+    try:
+        yield entry
+    except BaseException as exception:
+        error = str(exception) or type(exception).__name__
+        raise
+    finally:
+        seconds = time.perf_counter() - counter
+        if error is None and entry.get('status', 0) >= 400:
+            error = f'HTTP {entry["status"]}'
+        record = {'action': action, 'napp': napp, 'endpoint': endpoint,
+                  'start': _timestamp(start),
+                  'end': _timestamp(start + seconds),
+                  'seconds': round(seconds, 6),
+                  'result': 'ok' if error is None else 'error',
+                  'pid': os.getpid(), **entry}
+        if error is not None:
+            record['error'] = error
+        write_entry(path, record)
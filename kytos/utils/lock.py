@@ -0,0 +1,234 @@
+"""Lockfiles with the exact versions, dependencies and digests of NApps.
+
+``kytos napps lock`` resolves NApps and their dependencies with a single
+request for the NApps server catalog, downloads their packages to compute
+SHA-256 digests and writes a JSON lockfile::
+
+    {
+      "lock_version": 1,
+      "repository": "https://napps.kytos.io/repo",
+      "napps": {
+        "kytos/of_core": {"version": "2022.3", "sha256": "...",
+                          "napp_dependencies": []},
+        "kytos/of_lldp": {"version": "2022.3", "sha256": "...",
+                          "napp_dependencies": ["kytos/of_core"]}
+      },
+      "levels": [["kytos/of_core"], ["kytos/of_lldp"]]
+    }
+
+``kytos napps install --lock=<file>`` installs exactly those NApps without
+resolving dependencies again. kytosd downloads the packages itself, so the
+packages in the repository are checked against the digests beforehand and
+every controller ends up with the same bytes.
+"""
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from kytos.utils.client import NAppsClient
+from kytos.utils.config import KytosConfig
+from kytos.utils.dependencies import catalog_graph, closure, levels
+from kytos.utils.exceptions import KytosException
+from kytos.utils.state import Desired
+from kytos.utils.versions import satisfies
+
+#: Format of the lockfiles written by this version.
+LOCK_VERSION = 1
+
+#: Default lockfile name.
+LOCK_FILE = 'napps.lock'
+
+#: Default number of packages downloaded at the same time.
+MAX_WORKERS = 8
+
+
+def package_url(repo, username, name, version):
+    """Return the URL of a NApp package in a NApps repository."""
+    return os.path.join(repo, username, f'{name}-{version}.napp')
+
+
+def package_digest(url, timeout=30):
+    """Download a package and return its SHA-256 hex digest.
+
+    Raises:
+        KytosException: If the package can't be downloaded.
+
+    """
+    digest = hashlib.sha256()
+    try:
+        with requests.get(url, stream=True, timeout=timeout) as response:
+            if response.status_code != 200:
+                raise KytosException(f'{url}: HTTP {response.status_code}')
+            for chunk in response.iter_content(65536):
+                digest.update(chunk)
+    except requests.RequestException as exception:
+        raise KytosException(f'{url}: {exception}')
+    return digest.hexdigest()
+
+
+def _digests(urls, max_workers):
+    """Return the digest or KytosException of each URL, in parallel."""
+    def digest(url):
+        try:
+            return package_digest(url)
+        except KytosException as exception:
+            return exception
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(digest, urls))
+
+
+def resolve(napps, catalog):
+    """Return a lock of ``napps`` and their dependencies, without digests.
+
+    Args:
+        napps (list): (username, name, version) tuples. The version is a
+            constraint, as in :mod:`kytos.utils.versions`.
+        catalog (list): NApps metadata of the NApps server.
+
+    Returns:
+        dict: A lock whose NApps have None as ``sha256``.
+
+    Raises:
+        KytosException: If a NApp or version isn't available.
+
+    """
+    graph = catalog_graph(catalog)
+    metadata = {(meta.get('username', meta.get('author')), meta['name']):
+                meta for meta in catalog}
+    errors = []
+    for username, name, version in napps:
+        meta = metadata.get((username, name))
+        if meta is None:
+            errors.append(f'{username}/{name} not found in NApps server')
+        elif not satisfies(meta['version'], version):
+            errors.append(f'{username}/{name}:{version} not available, '
+                          f'NApps server has {meta["version"]}')
+    requested = {napp[:2] for napp in napps}
+    locked = sorted(closure(requested, graph))
+    errors += [f'{"/".join(napp)}, a dependency, not found in NApps server'
+               for napp in locked
+               if napp not in metadata and napp not in requested]
+    if errors:
+        raise KytosException('; '.join(errors))
+
+    entries = {}
+    for napp in locked:
+        entries['/'.join(napp)] = {
+            'version': metadata[napp]['version'], 'sha256': None,
+            'napp_dependencies': ['/'.join(dep) for dep in graph[napp]]}
+    return {'lock_version': LOCK_VERSION, 'repository': None,
+            'napps': entries,
+            'levels': [['/'.join(napp) for napp in level]
+                       for level in levels(locked, graph)]}
+
+
+def make_lock(napps, catalog, repo, max_workers=MAX_WORKERS):
+    """Return the lock of ``napps`` and their dependencies.
+
+    Args:
+        napps (list): (username, name, version) tuples, as in
+            :func:`resolve`.
+        catalog (list): NApps metadata of the NApps server.
+        repo (str): URL of the NApps repository with the packages.
+        max_workers (int): Maximum number of simultaneous downloads.
+
+    Raises:
+        KytosException: If a NApp or version isn't available or a package
+            can't be downloaded.
+
+    """
+    lock = resolve(napps, catalog)
+    lock['repository'] = repo
+    urls = [package_url(repo, *napp_id.split('/'), meta['version'])
+            for napp_id, meta in lock['napps'].items()]
+    digests = _digests(urls, max_workers)
+    failed = [str(digest) for digest in digests
+              if isinstance(digest, Exception)]
+    if failed:
+        raise KytosException('Could not download ' + '; '.join(failed))
+    for meta, digest in zip(lock['napps'].values(), digests):
+        meta['sha256'] = digest
+    return lock
+
+
+def fetch_lock(napps, max_workers=MAX_WORKERS):
+    """Return the lock of ``napps`` with the configured NApps server."""
+    repo = KytosConfig().config.get('napps', 'repo')
+    return make_lock(napps, NAppsClient().get_napps(), repo, max_workers)
+
+
+def write_lock(lock, lock_file):
+    """Write a lock as JSON, sorted, so that diffs are meaningful."""
+    with open(lock_file, 'w') as file:
+        json.dump(lock, file, indent=2, sort_keys=True)
+        file.write('\n')
+
+
+def read_lock(lock_file):
+    """Return the lock in ``lock_file``.
+
+    Raises:
+        KytosException: If the file can't be read or has another format.
+
+    """
+    try:
+        with open(lock_file) as file:
+            lock = json.load(file)
+    except (OSError, ValueError) as exception:
+        raise KytosException(f'Could not read {lock_file}: {exception}')
+    if not isinstance(lock, dict) or \
+            lock.get('lock_version') != LOCK_VERSION:
+        raise KytosException(f'{lock_file} is not a version {LOCK_VERSION} '
+                             'NApps lockfile.')
+    return lock
+
+
+def lock_catalog(lock):
+    """Return the locked NApps as NApps server metadata.
+
+    It replaces the catalog of the NApps server when planning installs.
+    """
+    catalog = []
+    for napp_id, meta in lock['napps'].items():
+        username, name = napp_id.split('/')
+        catalog.append({'username': username, 'name': name,
+                        'version': meta['version'],
+                        'napp_dependencies': meta['napp_dependencies']})
+    return catalog
+
+
+def lock_desired(lock):
+    """Return the desired state of having all locked NApps enabled."""
+    return {tuple(napp_id.split('/')): Desired(meta['version'], True, True)
+            for napp_id, meta in lock['napps'].items()}
+
+
+def verify_lock(lock, napps, repo=None, max_workers=MAX_WORKERS):
+    """Check that the repository packages of ``napps`` match the lock.
+
+    Args:
+        napps (list): (username, name) of the locked NApps to be installed.
+        repo (str): NApps repository. Defaults to the configured one, as
+            kytosd is expected to use the same.
+
+    Raises:
+        KytosException: If a package differs or can't be downloaded.
+
+    """
+    repo = repo or KytosConfig().config.get('napps', 'repo')
+    metas = [lock['napps']['/'.join(napp)] for napp in napps]
+    urls = [package_url(repo, *napp, meta['version'])
+            for napp, meta in zip(napps, metas)]
+    errors = []
+    for url, meta, digest in zip(urls, metas,
+                                 _digests(urls, max_workers)):
+        if isinstance(digest, Exception):
+            errors.append(str(digest))
+        elif digest != meta['sha256']:
+            errors.append(f'{url}: digest differs from the lockfile')
+    if errors:
+        raise KytosException('; '.join(errors))
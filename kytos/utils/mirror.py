@@ -0,0 +1,179 @@
+"""Local mirror of a NApps repository.
+
+A mirror is a directory with the layout of the NApps repository::
+
+    mirror/
+        SHA256SUMS
+        kytos/
+            of_core-2022.3.napp
+            of_core-latest.napp
+            ...
+
+so that ``napps.repo`` (``NAPPS_REPO_URI``) of kytosd and kytos-utils can
+point at it, for instance when served by ``kytos napps mirror --serve``.
+
+Syncs are incremental: packages already in ``SHA256SUMS`` whose files still
+have the same digest are not downloaded again. Packages are downloaded in
+parallel and checked against the digests of a lockfile, when one is given.
+"""
+import hashlib
+import os
+import shutil
+import tempfile
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from http.server import HTTPServer, SimpleHTTPRequestHandler
+from pathlib import Path
+from socketserver import ThreadingMixIn
+
+import requests
+
+from kytos.utils.config import KytosConfig
+from kytos.utils.exceptions import KytosException
+from kytos.utils.lock import package_url
+
+#: Checksums of the mirrored packages, in ``sha256sum`` format.
+SUMS_FILE = 'SHA256SUMS'
+
+#: Default number of packages downloaded at the same time.
+MAX_WORKERS = 8
+
+#: Outcome of a NApp sync. ``downloaded`` is False when it was up to date.
+Synced = namedtuple('Synced', ['napp_id', 'version', 'downloaded', 'error'])
+
+
+def read_sums(directory):
+    """Return the digest of each package path in the SHA256SUMS file."""
+    try:
+        lines = Path(directory, SUMS_FILE).read_text().splitlines()
+    except FileNotFoundError:
+        return {}
+    return {path: digest for digest, path in
+            (line.split(None, 1) for line in lines if line.strip())}
+
+
+def write_sums(directory, sums):
+    """Write the SHA256SUMS file, sorted by path."""
+    content = ''.join(f'{sums[path]}  {path}\n' for path in sorted(sums))
+    Path(directory, SUMS_FILE).write_text(content)
+
+
+def file_digest(path):
+    """Return the SHA-256 hex digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _download(url, path, expected=None, timeout=30):
+    """Download ``url`` to ``path`` atomically and return its digest.
+
+    Raises:
+        KytosException: If the download fails or its digest isn't the
+            ``expected`` one.
+
+    """
+    digest = hashlib.sha256()
+    tmp = tempfile.NamedTemporaryFile(dir=path.parent, delete=False,
+                                      prefix='.', suffix='.part')
+    try:
+        with tmp, requests.get(url, stream=True, timeout=timeout) as response:
+            if response.status_code != 200:
+                raise KytosException(f'{url}: HTTP {response.status_code}')
+            for chunk in response.iter_content(65536):
+                digest.update(chunk)
+                tmp.write(chunk)
+        if expected not in (None, digest.hexdigest()):
+            raise KytosException(f'{url}: digest differs from the lockfile')
+        os.replace(tmp.name, path)
+    except requests.RequestException as exception:
+        raise KytosException(f'{url}: {exception}')
+    finally:
+        if os.path.exists(tmp.name):
+            os.unlink(tmp.name)
+    return digest.hexdigest()
+
+
+def sync(directory, lock, repo=None, max_workers=MAX_WORKERS):
+    """Copy the packages of the NApps in a lock to a mirror directory.
+
+    Each package is also copied as ``<name>-latest.napp``, the one kytosd
+    downloads when no version is given.
+
+    Args:
+        directory (str): Mirror directory, created if needed.
+        lock (dict): NApps to be mirrored, as from :mod:`kytos.utils.lock`.
+            Packages are checked against its digests, unless they are None.
+        repo (str): NApps repository. Defaults to the configured one.
+        max_workers (int): Maximum number of simultaneous downloads.
+
+    Returns:
+        list: A Synced for each NApp, in the order of the lock.
+
+    """
+    repo = repo or KytosConfig().config.get('napps', 'repo')
+    directory = Path(directory)
+    sums = read_sums(directory)
+
+    def sync_napp(napp_id, meta):
+        username, name = napp_id.split('/')
+        version, expected = meta['version'], meta.get('sha256')
+        path = f'{username}/{name}-{version}.napp'
+        known = sums.get(path)
+        try:
+            if known and expected in (None, known) and \
+                    (directory / path).exists() and \
+                    file_digest(directory / path) == known:
+                return Synced(napp_id, version, False, None), {}
+            (directory / username).mkdir(parents=True, exist_ok=True)
+            url = package_url(repo, username, name, version)
+            digest = _download(url, directory / path, expected)
+            latest = f'{username}/{name}-latest.napp'
+            shutil.copyfile(directory / path, directory / latest)
+        except (KytosException, OSError) as exception:
+            return Synced(napp_id, version, False, exception), {}
+        return Synced(napp_id, version, True, None), {path: digest,
+                                                      latest: digest}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        outcomes = list(executor.map(sync_napp, lock['napps'],
+                                     lock['napps'].values()))
+    for _, new_sums in outcomes:
+        sums.update(new_sums)
+    if any(new_sums for _, new_sums in outcomes):
+        write_sums(directory, sums)
+    return [synced for synced, _ in outcomes]
+
+
+class _MirrorHandler(SimpleHTTPRequestHandler):
+    """Serve the files of the server's directory."""
+
+    def translate_path(self, path):
+        """Return the file of ``path`` in the mirror directory.
+
+        SimpleHTTPRequestHandler serves the current directory, and only
+        takes another one from Python 3.7 on.
+        """
+        relative = os.path.relpath(super().translate_path(path), os.getcwd())
+        return os.path.join(self.server.directory, relative)
+
+
+class _MirrorServer(ThreadingMixIn, HTTPServer):
+    """HTTP server of a mirror directory, a thread for each request."""
+
+    daemon_threads = True
+
+    def __init__(self, directory, address):
+        self.directory = str(directory)
+        super().__init__(address, _MirrorHandler)
+
+
+def make_server(directory, host='127.0.0.1', port=8080):
+    """Return an HTTP server for a mirror directory.
+
+    Call ``serve_forever()`` to serve requests and ``server_close()`` to
+    release the port.
+    """
+    return _MirrorServer(directory, (host, port))
@@ -7,23 +7,38 @@ import re
 import sys
 import tarfile
 import urllib
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
 
 # Disable pylint import checks that conflict with isort
 # pylint: disable=ungrouped-imports,wrong-import-order
 import pathspec
-from jinja2 import Environment, FileSystemLoader
-from ruamel.yaml import YAML
 
 from kytos.utils.client import NAppsClient
 from kytos.utils.config import KytosConfig
 from kytos.utils.exceptions import KytosException
-from kytos.utils.openapi import OpenAPI
-from kytos.utils.settings import SKEL_PATH
+from kytos.utils.journal import journaled
+from kytos.utils.openapi import OpenAPI, compile_spec
+from kytos.utils.settings import NAPP_CACHE_DIR, SKEL_PATH
+from kytos.utils.templating import get_environment
+from kytos.utils.tracing import http_span, set_status
+from kytos.utils.yamlloader import YAML_ERRORS, safe_load
 
 LOG = logging.getLogger(__name__)
 
 
+def _get_json(uri):
+    """Return the JSON answer of kytosd to a GET request, in a span."""
+    with http_span('GET', uri) as current:
+        try:
+            response = urllib.request.urlopen(uri)
+        except urllib.error.HTTPError as exception:
+            set_status(current, exception.code)
+            raise
+        set_status(current, response.getcode())
+        return json.loads(response.read())
+
+
 # pylint: disable=too-many-instance-attributes,too-many-public-methods
 class NAppsManager:
     """Deal with NApps at filesystem level and ask Kytos to (un)load NApps."""
@@ -73,7 +88,7 @@ class NAppsManager:
         if self.__local_enabled is None:
             uri = self._kytos_api + 'api/kytos/core/config/'
             try:
-                ops = json.loads(urllib.request.urlopen(uri).read())
+                ops = _get_json(uri)
             except urllib.error.URLError as err:
                 msg = f'Error connecting to Kytos daemon: {uri} {err.reason}'
                 print(msg)
@@ -121,12 +136,14 @@ class NAppsManager:
         uri = self._kytos_api + self._NAPPS_ENABLED
 
         try:
-            response = urllib.request.urlopen(uri)
-            if response.getcode() != 200:
-                msg = "Error calling Kytos to check enabled NApps."
-                raise KytosException(msg)
-
-            content = json.loads(response.read())
+            with http_span('GET', uri) as current:
+                response = urllib.request.urlopen(uri)
+                set_status(current, response.getcode())
+                if response.getcode() != 200:
+                    msg = "Error calling Kytos to check enabled NApps."
+                    raise KytosException(msg)
+
+                content = json.loads(response.read())
             return sorted((c[0], c[1]) for c in content['napps'])
         except urllib.error.URLError as exception:
             LOG.error("Error checking enabled NApps. Is Kytos running?")
@@ -137,12 +154,14 @@ class NAppsManager:
         uri = self._kytos_api + self._NAPPS_INSTALLED
 
         try:
-            response = urllib.request.urlopen(uri)
-            if response.getcode() != 200:
-                msg = "Error calling Kytos to check installed NApps."
-                raise KytosException(msg)
-
-            content = json.loads(response.read())
+            with http_span('GET', uri) as current:
+                response = urllib.request.urlopen(uri)
+                set_status(current, response.getcode())
+                if response.getcode() != 200:
+                    msg = "Error calling Kytos to check installed NApps."
+                    raise KytosException(msg)
+
+                content = json.loads(response.read())
             return sorted((c[0], c[1]) for c in content['napps'])
         except urllib.error.URLError as exception:
             LOG.error("Error checking installed NApps. Is Kytos running?")
@@ -203,7 +222,7 @@ class NAppsManager:
         uri = self._kytos_api + self._NAPP_METADATA
         uri = uri.format(user, napp, key)
 
-        meta = json.loads(urllib.request.urlopen(uri).read())
+        meta = _get_json(uri)
         return meta[key]
 
     def disable(self):
@@ -212,7 +231,9 @@ class NAppsManager:
         uri = uri.format(self.user, self.napp)
 
         try:
-            json.loads(urllib.request.urlopen(uri).read())
+            with journaled(self._config, 'disable', uri,
+                           f'{self.user}/{self.napp}'):
+                _get_json(uri)
         except urllib.error.HTTPError as exception:
             if exception.code == HTTPStatus.BAD_REQUEST.value:
                 LOG.error("NApp is not installed. Check the NApp list.")
@@ -225,7 +246,9 @@ class NAppsManager:
         uri = uri.format(self.user, self.napp)
 
         try:
-            json.loads(urllib.request.urlopen(uri).read())
+            with journaled(self._config, 'enable', uri,
+                           f'{self.user}/{self.napp}'):
+                _get_json(uri)
         except urllib.error.HTTPError as exception:
             if exception.code == HTTPStatus.BAD_REQUEST.value:
                 LOG.error("NApp is not installed. Check the NApp list.")
@@ -250,7 +273,9 @@ class NAppsManager:
         uri = uri.format(self.user, self.napp)
 
         try:
-            json.loads(urllib.request.urlopen(uri).read())
+            with journaled(self._config, 'uninstall', uri,
+                           f'{self.user}/{self.napp}'):
+                _get_json(uri)
         except urllib.error.HTTPError as exception:
             if exception.code == HTTPStatus.BAD_REQUEST.value:
                 LOG.error("Check if the NApp is installed.")
@@ -270,9 +295,7 @@ class NAppsManager:
     @staticmethod
     def render_template(templates_path, template_filename, context):
         """Render Jinja2 template for a NApp structure."""
-        template_env = Environment(
-            autoescape=False, trim_blocks=False,
-            loader=FileSystemLoader(str(templates_path)))
+        template_env = get_environment(templates_path)
         return template_env.get_template(str(template_filename)) \
             .render(context)
 
@@ -302,7 +325,29 @@ class NAppsManager:
         uri = self._kytos_api + self._NAPP_INSTALL
         uri = uri.format(self.user, self.napp)
 
-        json.loads(urllib.request.urlopen(uri).read())
+        with journaled(self._config, 'install', uri,
+                       f'{self.user}/{self.napp}'):
+            _get_json(uri)
+
+    def napp_action(self, action):
+        """Ask kytosd to install, uninstall, enable or disable the NApp.
+
+        Unlike the methods of each action, errors are raised, not logged.
+
+        Args:
+            action (str): "install", "uninstall", "enable" or "disable".
+
+        Raises:
+            urllib.error.URLError: If kytosd can't be reached or refuses the
+                action (HTTPError).
+
+        """
+        uri = self._kytos_api + getattr(self, f'_NAPP_{action.upper()}')
+        uri = uri.format(self.user, self.napp)
+
+        with journaled(self._config, action, uri,
+                       f'{self.user}/{self.napp}'):
+            _get_json(uri)
 
     @classmethod
     # pylint: disable=too-many-statements
@@ -312,10 +357,6 @@ class NAppsManager:
         This will create, on the current folder, a clean structure of a NAPP,
         filling some contents on this structure.
         """
-        templates_path = SKEL_PATH / 'napp-structure/username/napp'
-
-        ui_templates_path = os.path.join(templates_path, 'ui')
-
         username = None
         napp_name = None
         print('--------------------------------------------------------------')
@@ -340,21 +381,39 @@ class NAppsManager:
         except KeyboardInterrupt:
             print("User cancelled NApp creation.")
             sys.exit(0)
+        cls.create_napp_tree(username, napp_name, description, meta_package)
+
+        print('\nCongratulations! Your NApp has been bootstrapped!\nNow you'
+              f' can go to the directory "{username}/{napp_name}" and begin'
+              ' to code your NApp.')
+        print('Have fun!')
+
+    @classmethod
+    def create_napp_tree(cls, username, napp_name, description=None,
+                         meta_package=False, user_package=True):
+        """Render the files of a new NApp in ``username/napp_name``.
+
+        Args:
+            user_package (bool): Whether to create the ``username`` package
+                too. It must exist otherwise.
+
+        Raises:
+            FileExistsError: If the NApp directory already exists.
+
+        """
+        templates_path = SKEL_PATH / 'napp-structure/username/napp'
+        ui_templates_path = os.path.join(templates_path, 'ui')
         if not description:
             # pylint: disable=fixme
             description = '# TODO: <<<< Insert your NApp description here >>>>'
             # pylint: enable=fixme
-
         context = {'username': username, 'napp': napp_name,
                    'description': description}
 
-        #: Creating the directory structure (username/napp_name)
-        os.makedirs(username, exist_ok=True)
-
-        #: Creating ``__init__.py`` files
-        with open(os.path.join(username, '__init__.py'), 'w') as init_file:
-            init_file.write(f'"""NApps for the user {username}.""""')
+        if user_package:
+            cls._create_user_package(username)
 
+        #: Creating the directory structure (username/napp_name)
         os.makedirs(os.path.join(username, napp_name))
 
         #: Creating the other files based on the templates
@@ -377,10 +436,87 @@ class NAppsManager:
             NAppsManager.create_ui_structure(username, napp_name,
                                              ui_templates_path, context)
 
-        print('\nCongratulations! Your NApp has been bootstrapped!\nNow you'
-              f' can go to the directory "{username}/{napp_name}" and begin'
-              ' to code your NApp.')
-        print('Have fun!')
+    @staticmethod
+    def _create_user_package(username):
+        """Create the ``username`` directory and its ``__init__.py``."""
+        os.makedirs(username, exist_ok=True)
+        with open(os.path.join(username, '__init__.py'), 'w') as init_file:
+            init_file.write(f'"""NApps for the user {username}.""""')
+
+    @classmethod
+    def read_manifest(cls, manifest_file):
+        """Return the NApps to be created, as listed in a YAML manifest.
+
+        The manifest is a list, or a mapping with a ``napps`` list, whose
+        items have ``username``, ``name`` and, optionally, ``description``
+        and ``meta`` (true for meta-packages).
+
+        Raises:
+            KytosException: If the manifest or any of its items is invalid.
+
+        """
+        try:
+            with open(manifest_file, 'rb') as manifest:
+                content = safe_load(manifest.read())
+        except (OSError, *YAML_ERRORS) as exception:
+            raise KytosException(f'Could not read {manifest_file}: '
+                                 f'{exception}')
+        if isinstance(content, dict):
+            content = content.get('napps')
+        if not isinstance(content, list):
+            raise KytosException(f'{manifest_file} must be a list of NApps.')
+
+        napps, errors = [], []
+        for index, item in enumerate(content, 1):
+            item = item if isinstance(item, dict) else {}
+            username, name = item.get('username'), item.get('name')
+            if not (cls.valid_name(username) and cls.valid_name(name)):
+                errors.append(f'item {index}: invalid username or name')
+            elif (username, name) in (napp[:2] for napp in napps):
+                errors.append(f'item {index}: {username}/{name} repeated')
+            else:
+                napps.append((username, name, item.get('description'),
+                              bool(item.get('meta', False))))
+        if errors:
+            raise KytosException(f'Invalid {manifest_file}: ' +
+                                 '; '.join(errors))
+        return napps
+
+    @classmethod
+    def create_napps(cls, napps, max_workers=8):
+        """Create several NApps concurrently.
+
+        Args:
+            napps (list): (username, name, description, meta_package)
+                tuples, as returned by :meth:`read_manifest`.
+            max_workers (int): Maximum number of NApps rendered at once.
+
+        Returns:
+            dict: The exception raised for each "username/name" that
+                could not be created, or None if it was created.
+
+        """
+        # Created once, before the threads, as the NApps of a user share it.
+        user_errors = {}
+        for username in dict.fromkeys(napp[0] for napp in napps):
+            try:
+                cls._create_user_package(username)
+            except OSError as exception:
+                user_errors[username] = exception
+
+        def create(napp):
+            if napp[0] in user_errors:
+                return user_errors[napp[0]]
+            try:
+                cls.create_napp_tree(*napp, user_package=False)
+            except OSError as exception:
+                return exception
+            return None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(create, napps)
+            return {f'{napp[0]}/{napp[1]}': result
+                    for napp, result in zip(napps, results)}
 
     @classmethod
     def create_ui_structure(cls, username, napp_name, ui_templates_path,
@@ -427,7 +563,7 @@ class NAppsManager:
         """
         def get_matches(path):
             """Return all NApp files matching any .gitignore pattern."""
-            ignored_files = [".git"]
+            ignored_files = [".git", NAPP_CACHE_DIR]
             with open(".gitignore", 'r') as local_gitignore:
                 ignored_files.extend(local_gitignore.readlines())
 
@@ -504,11 +640,12 @@ class NAppsManager:
             metadata['readme'] = ''
 
         try:
-            yaml = YAML(typ='safe')
-            openapi_dict = yaml.load(pathlib.Path('openapi.yml').open())
-            openapi = json.dumps(openapi_dict)
+            openapi = compile_spec(pathlib.Path('openapi.yml'))
         except FileNotFoundError:
             openapi = ''
+        except YAML_ERRORS as exception:
+            print("ERROR: Could not parse openapi.yml:", exception)
+            sys.exit(1)
         metadata['OpenAPI_Spec'] = openapi
 
         return metadata
@@ -537,11 +674,26 @@ class NAppsManager:
         client.delete(self.user, self.napp)
 
     @classmethod
-    def prepare(cls):
-        """Prepare NApp to be uploaded by creating openAPI skeleton."""
-        if cls._ask_openapi():
-            napp_path = pathlib.Path()
-            tpl_path = SKEL_PATH / 'napp-structure/username/napp'
+    def prepare(cls, incremental=False):
+        """Prepare NApp to be uploaded by creating openAPI skeleton.
+
+        Args:
+            incremental (bool): Instead of asking to override openapi.yml,
+                only add, remove or update the endpoints of modules that
+                changed since the last run, keeping manual edits.
+
+        """
+        napp_path = pathlib.Path()
+        tpl_path = SKEL_PATH / 'napp-structure/username/napp'
+        if incremental:
+            changes = OpenAPI(napp_path, tpl_path).update_spec()
+            for change, endpoints in changes.items():
+                for path, method in endpoints:
+                    LOG.info('%s %s %s', change.capitalize(), method.upper(),
+                             path)
+            if not any(changes.values()):
+                LOG.info('openapi.yml is up to date.')
+        elif cls._ask_openapi():
             OpenAPI(napp_path, tpl_path).render_template()
             print('Please, update your openapi.yml file.')
             sys.exit()
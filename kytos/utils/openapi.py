@@ -1,8 +1,69 @@
 """Deal with OpenAPI v3."""
+import ast
+import hashlib
 import json
+import logging
+import os
 import re
 
-from jinja2 import Environment, FileSystemLoader
+from ruamel.yaml import YAML
+
+from kytos.utils.settings import NAPP_CACHE_DIR
+from kytos.utils.templating import get_environment
+from kytos.utils.yamlloader import safe_load
+
+LOG = logging.getLogger(__name__)
+
+
+def compile_spec(api_file):
+    """Return openapi.yml as minified JSON, compiling it only if changed.
+
+    The JSON is cached in the NApp's cache directory along with the hash of
+    the YAML file it came from, so uploads don't parse unchanged specs.
+
+    Args:
+        api_file (pathlib.Path): The openapi.yml file.
+
+    Raises:
+        FileNotFoundError: If ``api_file`` doesn't exist.
+        One of kytos.utils.yamlloader.YAML_ERRORS: If ``api_file`` is not
+            valid YAML.
+
+    """
+    content = api_file.read_bytes()
+    digest = hashlib.sha256(content).hexdigest()
+    cache_dir = api_file.parent / NAPP_CACHE_DIR
+    json_file = cache_dir / 'openapi.json'
+    digest_file = cache_dir / 'openapi.json.sha256'
+    try:
+        if digest_file.read_text() == digest:
+            return json_file.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        pass
+
+    spec = json.dumps(safe_load(content), separators=(',', ':'))
+    try:
+        cache_dir.mkdir(exist_ok=True)
+        # The old digest must not vouch for the JSON while it is replaced,
+        # and the new digest is written last.
+        if digest_file.exists():
+            digest_file.unlink()
+        _replace(json_file, spec)
+        _replace(digest_file, digest)
+    except OSError as exception:
+        LOG.debug('Could not cache the OpenAPI spec: %s', exception)
+    return spec
+
+
+def _replace(path, text):
+    """Write ``text`` to ``path`` at once, through a temporary file."""
+    tmp_file = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    try:
+        tmp_file.write_text(text, encoding='utf-8')
+        os.replace(tmp_file, path)
+    finally:
+        if tmp_file.exists():
+            tmp_file.unlink()
 
 
 class OpenAPI:  # pylint: disable=too-few-public-methods
@@ -19,6 +80,7 @@ class OpenAPI:  # pylint: disable=too-few-public-methods
         self._napp_path = napp_path
         self._template = tpl_path / 'openapi.yml.template'
         self._api_file = napp_path / 'openapi.yml'
+        self._cache_file = napp_path / NAPP_CACHE_DIR / 'openapi-sources.json'
 
         self._napp_dict = self._parse_napp_metadata()
 
@@ -35,6 +97,145 @@ class OpenAPI:  # pylint: disable=too-few-public-methods
         context = dict(napp=self._napp_dict, paths=self._paths)
         self._save(context)
 
+    def update_spec(self):
+        """Update openapi.yml with the endpoints of changed modules only.
+
+        Module hashes and the endpoints found in each module are cached in
+        the NApp's cache directory. Only modules whose hash changed are
+        parsed again. Then, in openapi.yml:
+
+        - endpoints that are gone are removed;
+        - new endpoints get a skeleton rendered from the template;
+        - summaries and descriptions follow the docstrings, unless they were
+          edited by hand.
+
+        Everything else in openapi.yml, comments included, is kept. Without
+        openapi.yml, the whole skeleton is rendered.
+
+        Returns:
+            dict: Lists of "added", "removed" and "updated" (path, method).
+
+        """
+        cached = self._load_cache() or {}
+        modules = {}
+        for module in self._get_modules():
+            name = str(module.relative_to(self._napp_path))
+            digest = self._hash(module)
+            if name in cached and cached[name][0] == digest:
+                modules[name] = cached[name]
+                continue
+            try:
+                modules[name] = (digest, self._parse_module(module))
+            except SyntaxError as exception:
+                # Keep its endpoints, and parse it again next time.
+                LOG.warning('Skipping %s: %s', module, exception)
+                if name in cached:
+                    modules[name] = cached[name]
+
+        if self._api_file.exists():
+            old_paths = self._merge_paths(cached.values())
+            new_paths = self._merge_paths(modules.values())
+            changes = self._merge_spec(old_paths, new_paths)
+        else:
+            self._paths = self._merge_paths(modules.values())
+            self._save(dict(napp=self._napp_dict, paths=self._paths))
+            changes = {'added': [(path, method)
+                                 for path, methods in self._paths.items()
+                                 for method in methods],
+                       'removed': [], 'updated': []}
+        self._save_cache(modules)
+        return changes
+
+    def _merge_spec(self, old_paths, new_paths):
+        """Apply to openapi.yml the difference between generated paths."""
+        yaml = YAML()
+        yaml.indent(mapping=2, sequence=4, offset=2)  # as in the template
+        with self._api_file.open(encoding='utf-8') as api_file:
+            spec = yaml.load(api_file) or {}
+        if spec.get('paths') is None:
+            spec['paths'] = {}
+        paths = spec['paths']
+        changes = {'added': [], 'removed': [], 'updated': []}
+
+        for path, methods in old_paths.items():
+            for method in methods.keys() - new_paths.get(path, {}).keys():
+                if method in (paths.get(path) or {}):
+                    del paths[path][method]
+                    changes['removed'].append((path, method))
+            if path in paths and not paths[path]:
+                del paths[path]
+
+        added = {}
+        for path, methods in new_paths.items():
+            for method, info in methods.items():
+                current = (paths.get(path) or {}).get(method)
+                if current is None:
+                    added.setdefault(path, {})[method] = info
+                    continue
+                old_info = old_paths.get(path, {}).get(method, {})
+                # Only docstring changes are applied; hand edits win.
+                edited = {key: value for key, value in info.items()
+                          if current.get(key) == old_info.get(key) != value}
+                if edited:
+                    current.update(edited)
+                    changes['updated'].append((path, method))
+
+        if added:
+            skeleton = yaml.load(self._render(dict(napp=self._napp_dict,
+                                                   paths=added)))
+            for path, methods in skeleton['paths'].items():
+                if paths.get(path) is None:
+                    paths[path] = methods
+                else:
+                    paths[path].update(methods)
+                changes['added'].extend((path, method) for method in methods)
+
+        if any(changes.values()):
+            with self._api_file.open('w', encoding='utf-8') as api_file:
+                yaml.dump(spec, api_file)
+        return changes
+
+    @staticmethod
+    def _merge_paths(modules):
+        """Return the paths of all (hash, paths) module entries."""
+        paths = {}
+        for _, module_paths in modules:
+            for path, methods in module_paths.items():
+                paths.setdefault(path, {}).update(methods)
+        return paths
+
+    def _parse_module(self, module):
+        """Return the paths found in a single module.
+
+        Raises:
+            SyntaxError: If the module is not valid Python.
+
+        """
+        self._paths = {}
+        self._parse_decorated_functions(module.read_text(encoding='utf-8'))
+        return self._paths
+
+    @staticmethod
+    def _hash(module):
+        return hashlib.sha256(module.read_bytes()).hexdigest()
+
+    def _load_cache(self):
+        """Return {module: (hash, paths)} or None if there is no cache."""
+        try:
+            with self._cache_file.open(encoding='utf-8') as cache_file:
+                modules = json.load(cache_file)['modules']
+        except (FileNotFoundError, ValueError, KeyError):
+            return None
+        return {name: (module['sha256'], module['paths'])
+                for name, module in modules.items()}
+
+    def _save_cache(self, modules):
+        self._cache_file.parent.mkdir(exist_ok=True)
+        content = {'modules': {name: {'sha256': digest, 'paths': paths}
+                               for name, (digest, paths) in modules.items()}}
+        with self._cache_file.open('w', encoding='utf-8') as cache_file:
+            json.dump(content, cache_file, indent=2, sort_keys=True)
+
     def _parse_napp_metadata(self):
         """Return a NApp metadata file."""
         filename = self._napp_path / 'kytos.json'
@@ -42,34 +243,65 @@ class OpenAPI:  # pylint: disable=too-few-public-methods
             data = json.loads(data_file.read())
         return data
 
-    def _parse_paths(self):
-        main_file = self._napp_path / 'main.py'
-        code = main_file.open().read()
-        return self._parse_decorated_functions(code)
+    def _get_modules(self):
+        """Return the Python modules of the NApp.
+
+        Tests and hidden directories, such as the NApp cache, are skipped.
+        """
+        def is_source(path):
+            return not any(part.startswith('.') or
+                           part in ('tests', '__pycache__')
+                           for part in path.relative_to(
+                               self._napp_path).parts[:-1])
+        return sorted(filter(is_source, self._napp_path.rglob('*.py')))
+
+    def _parse_paths(self, modules=None):
+        for module in modules or self._get_modules():
+            with module.open(encoding='utf-8') as module_file:
+                code = module_file.read()
+            try:
+                self._parse_decorated_functions(code)
+            except SyntaxError as exception:
+                LOG.warning('Skipping %s: %s', module, exception)
 
     def _parse_decorated_functions(self, code):
-        """Return URL rule, HTTP methods and docstring."""
-        matches = re.finditer(r"""
-                # @rest decorators
-                (?P<decorators>
-                    (?:@rest\(.+?\)\n)+  # one or more @rest decorators inside
-                )
-                # docstring delimited by 3 double quotes
-                .+?"{3}(?P<docstring>.+?)"{3}
-                """, code, re.VERBOSE | re.DOTALL)
-
-        for function_match in matches:
-            m_dict = function_match.groupdict()
-            self._parse_docstring(m_dict['docstring'])
-            self._add_function_paths(m_dict['decorators'])
+        """Add URL rules, HTTP methods and docstrings of @rest functions.
+
+        Raises:
+            SyntaxError: If ``code`` is not valid Python.
+
+        """
+        for function in self._find_functions(ast.parse(code).body):
+            rules = list(self._parse_decorators(function.decorator_list))
+            if rules:
+                docstring = ast.get_docstring(function, clean=False)
+                self._parse_docstring(docstring or '')
+                self._add_function_paths(rules)
+
+    @classmethod
+    def _find_functions(cls, statements):
+        """Yield function definitions in source order, classes included.
+
+        Only statement bodies are visited: expressions can't define
+        decorated functions and are most of the tree.
+        """
+        for node in statements:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                yield node
+                yield from cls._find_functions(node.body)
+            elif isinstance(node, ast.ClassDef):
+                yield from cls._find_functions(node.body)
+            else:
+                for field in ('body', 'orelse', 'finalbody', 'handlers'):
+                    yield from cls._find_functions(getattr(node, field, ()))
 
     def _get_absolute_rule(self, rule):
         napp_prefix = "/api/{username}/{name}/"
         relative_rule = rule[1:] if rule.startswith('/') else rule
         return napp_prefix.format_map(self._napp_dict) + relative_rule
 
-    def _add_function_paths(self, decorators_str):
-        for rule, parsed_methods in self._parse_decorators(decorators_str):
+    def _add_function_paths(self, rules):
+        for rule, parsed_methods in rules:
             absolute_rule = self._get_absolute_rule(rule)
             path_url = self._rule2path(absolute_rule)
             path_methods = self._paths.setdefault(path_url, {})
@@ -110,37 +342,37 @@ class OpenAPI:  # pylint: disable=too-few-public-methods
         self._summary = summary
         self._description = description
 
-    def _parse_decorators(self, decorators_str):
-        matches = re.finditer(r"""
-             @rest\(
-
-              ## Endpoint rule
-              (?P<quote>['"])  # inside single or double quotes
-                  (?P<rule>.+?)
-              (?P=quote)
-
-              ## HTTP methods (optional)
-              (\s*,\s*
-                  methods=(?P<methods>\[.+?\])
-              )?
+    @classmethod
+    def _parse_decorators(cls, decorators):
+        """Yield (rule, methods) of each @rest decorator in ``decorators``.
 
-             .*?\)\s*$
-            """, decorators_str, re.VERBOSE)
+        Both ``@rest(...)`` and ``@<module>.rest(...)`` are accepted. Rules
+        and methods that are not literals can't be known without running
+        the code, so those decorators are skipped.
+        """
+        for decorator in decorators:
+            if not isinstance(decorator, ast.Call):
+                continue
+            func = decorator.func
+            name = getattr(func, 'id', getattr(func, 'attr', None))
+            if name != 'rest':
+                continue
 
-        for match in matches:
-            rule = match.group('rule')
-            methods = self._parse_methods(match.group('methods'))
+            keywords = {kw.arg: kw.value for kw in decorator.keywords}
+            rule = decorator.args[0] if decorator.args else \
+                keywords.get('rule')
+            methods = decorator.args[1] if len(decorator.args) > 1 else \
+                keywords.get('methods')
+            try:
+                rule = ast.literal_eval(rule)
+                methods = ('GET',) if methods is None else \
+                    ast.literal_eval(methods)
+            except ValueError:
+                LOG.warning('Skipping @rest decorator in line %s: rule and '
+                            'methods must be literals.', decorator.lineno)
+                continue
             yield rule, methods
 
-    @classmethod
-    def _parse_methods(cls, list_string):
-        """Return HTTP method list. Use json for security reasons."""
-        if list_string is None:
-            return ('GET',)
-        # json requires double quotes
-        json_list = list_string.replace("'", '"')
-        return json.loads(json_list)
-
     def _add_methods(self, methods, path_methods):
         for method in methods:
             path_method = dict(summary=self._summary,
@@ -157,11 +389,11 @@ class OpenAPI:  # pylint: disable=too-few-public-methods
         filename = self._napp_path / 'kytos.json'
         return json.load(filename.open())
 
+    def _render(self, context):
+        tpl_env = get_environment(self._template.parent, trim_blocks=True)
+        return tpl_env.get_template('openapi.yml.template').render(context)
+
     def _save(self, context):
-        tpl_env = Environment(
-            loader=FileSystemLoader(str(self._template.parent)),
-            trim_blocks=True)
-        content = tpl_env.get_template(
-            'openapi.yml.template').render(context)
+        content = self._render(context)
         with self._api_file.open('w') as openapi:
             openapi.write(content)
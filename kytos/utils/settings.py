@@ -4,3 +4,12 @@ from pathlib import Path
 
 BASE_ENV = Path(os.environ.get('VIRTUAL_ENV', '/'))
 SKEL_PATH = BASE_ENV / Path('etc/kytos/skel')
+
+#: Local caches kept by kytos-utils, such as the shell completion index.
+#: An empty XDG_CACHE_HOME means the default, as in the XDG specification.
+CACHE_PATH = Path(os.environ.get('XDG_CACHE_HOME') or
+                  '~/.cache').expanduser() / 'kytos'
+
+#: Directory inside a NApp where kytos-utils keeps generated files, such as
+#: the hashes used to regenerate openapi.yml incrementally.
+NAPP_CACHE_DIR = '.kytos'
@@ -0,0 +1,399 @@
+"""Local stand-in for kytosd and the NApps server.
+
+It implements the endpoints used by the CLI, with configurable latency,
+error rate and synthetic catalog size, so that benchmarks, load tests and
+failure-mode tests are reproducible and work offline.
+
+Usage:
+       standin [options]
+       standin -h | --help
+
+Run it with ``python3 -m kytos.utils.standin``.
+
+Options:
+
+  -h, --help              Show this screen.
+  --host=<host>           Address to listen on [default: 127.0.0.1].
+  --port=<port>           Port to listen on [default: 8181].
+  --napps=<n>             NApps in the synthetic catalog [default: 100].
+  --dependencies=<n>      Maximum dependencies of each NApp [default: 3].
+  --installed=<n>         NApps initially installed and enabled [default: 0].
+  --latency=<seconds>     Delay added to every answer [default: 0].
+  --jitter=<seconds>      Random extra delay, up to this value [default: 0].
+  --error-rate=<ratio>    Ratio of requests answered with HTTP 500
+                          [default: 0].
+  --seed=<n>              Seed for the catalog, jitter and errors
+                          [default: 0].
+
+Point the CLI to it with, for instance:
+
+  KYTOS_API=http://127.0.0.1:8181/
+  NAPPS_API_URI=http://127.0.0.1:8181/api/
+  NAPPS_REPO_URI=http://127.0.0.1:8181/repo/
+"""
+import hashlib
+import io
+import json
+import random
+import re
+import tarfile
+import tempfile
+import threading
+import time
+from collections import Counter
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+from docopt import docopt
+
+
+def synthetic_catalog(size, max_dependencies=3, seed=0):
+    """Return ``size`` NApps metadata as served by the NApps server.
+
+    Each NApp depends on up to ``max_dependencies`` NApps defined before
+    it, so the dependency graph is acyclic and gets deeper as it grows.
+    """
+    rand = random.Random(seed)
+    catalog = []
+    for i in range(size):
+        count = rand.randint(0, min(i, max_dependencies))
+        dependencies = sorted({rand.randrange(i) for _ in range(count)})
+        catalog.append({
+            'username': f'user{i % 10}', 'name': f'napp{i}',
+            'version': f'1.{i % 5}', 'license': 'MIT', 'url': '',
+            'description': f'Synthetic NApp number {i}.',
+            'tags': ['standin', f'tag{i % 10}'],
+            'napp_dependencies': ['{username}/{name}'.format_map(
+                catalog[dep]) for dep in dependencies]})
+    return catalog
+
+
+def napp_package(meta):
+    """Return the bytes of a small .napp package for ``meta``."""
+    data = json.dumps(meta, sort_keys=True).encode('utf-8')
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode='w:xz') as package:
+        info = tarfile.TarInfo('{username}/{name}/kytos.json'.format_map(
+            meta))
+        info.size = len(data)
+        info.mtime = 0
+        package.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+class StandInServer(ThreadingMixIn, HTTPServer):
+    """Serve kytosd and NApps server endpoints from memory.
+
+    The NApps server API is at ``<url>api/``, its packages repository at
+    ``<url>repo/`` and kytosd at ``<url>``, as in a default setup.
+    """
+
+    daemon_threads = True
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, host='127.0.0.1', port=0, napps=100,
+                 max_dependencies=3, installed=0, latency=0, jitter=0,
+                 error_rate=0, seed=0):
+        """Create the catalog and bind to ``host`` and ``port``.
+
+        Args:
+            napps (int or list): Catalog size, or NApps metadata.
+            installed (int): NApps initially installed and enabled.
+            latency (float): Seconds added to every answer.
+            jitter (float): Maximum random seconds added to ``latency``.
+            error_rate (float): Ratio of requests answered with HTTP 500.
+            seed (int): Seed for random numbers, for reproducible runs.
+
+        """
+        super().__init__((host, port), StandInHandler)
+        if isinstance(napps, int):
+            napps = synthetic_catalog(napps, max_dependencies, seed)
+        self.catalog = {'{username}/{name}'.format_map(meta): meta
+                        for meta in napps}
+        self.installed = set(list(self.catalog)[:installed])
+        self.enabled = set(self.installed)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.tokens = {}
+        self.users = {}
+        self.version = '2021.1'
+        self.counts = Counter()
+        self.bytes_sent = 0
+        self.napps_dir = tempfile.gettempdir()
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def url(self):
+        """Return the base URL, with a trailing slash."""
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}/'
+
+    def config_env(self):
+        """Return environment variables pointing the CLI to this server."""
+        return {'KYTOS_API': self.url, 'NAPPS_API_URI': self.url + 'api/',
+                'NAPPS_REPO_URI': self.url + 'repo/'}
+
+    def start(self):
+        """Serve requests in a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever,
+                                        args=(0.05,), daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and release the port."""
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def reset_counts(self):
+        """Forget the requests and bytes counted so far."""
+        with self._lock:
+            self.counts.clear()
+            self.bytes_sent = 0
+
+    def next_fault(self):
+        """Return the (delay, fail) pair for the next request."""
+        with self._lock:
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            fail = self._random.random() < self.error_rate
+        return delay, fail
+
+    def count(self, endpoint):
+        """Count one request to ``endpoint``."""
+        with self._lock:
+            self.counts[endpoint] += 1
+
+    def count_bytes(self, size):
+        """Count ``size`` bytes sent in an answer body."""
+        with self._lock:
+            self.bytes_sent += size
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Route requests to kytosd and NApps server endpoints."""
+
+    protocol_version = 'HTTP/1.1'
+
+    #: (HTTP method, path regex, handler name). Requests are counted by
+    #: handler name, without the leading underscore.
+    ROUTES = [
+        ('GET', r'/api/kytos/core/config/?', '_config'),
+        ('GET', r'/api/kytos/core/metadata/?', '_core_metadata'),
+        ('GET', r'/api/kytos/core/napps_enabled/?', '_enabled'),
+        ('GET', r'/api/kytos/core/napps_installed/?', '_installed'),
+        ('GET', r'/api/kytos/core/napps/(\w+)/(\w+)/metadata/(\w+)/?',
+         '_napp_metadata'),
+        ('GET', r'/api/kytos/core/napps/(\w+)/(\w+)/(install|uninstall|'
+                r'enable|disable)/?', '_napp_action'),
+        ('GET', r'/api/kytos/core/reload/all/?', '_reload_all'),
+        ('GET', r'/api/kytos/core/reload/(\w+)/(\w+)/?', '_reload'),
+        ('POST', r'/api/kytos/core/web/update(?:/([^/]+))?/?', '_web_update'),
+        ('GET', r'/api/napps/?', '_catalog'),
+        ('GET', r'/api/napps/(\w+)/(\w+)/?', '_napp'),
+        ('POST', r'/api/napps/?', '_upload'),
+        ('DELETE', r'/api/napps/(\w+)/(\w+)/?', '_delete'),
+        ('GET', r'/api/auth/?', '_auth'),
+        ('POST', r'/api/users/?', '_register'),
+        ('GET', r'/repo/(\w+)/(\w+)-([^/]+)\.napp', '_package'),
+    ]
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Route a GET request."""
+        self._route('GET')
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Route a POST request."""
+        self._route('POST')
+
+    def do_DELETE(self):  # pylint: disable=invalid-name
+        """Route a DELETE request."""
+        self._route('DELETE')
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        """Do not log every request to stderr."""
+
+    def _route(self, method):
+        length = int(self.headers.get('Content-Length', 0))
+        # pylint: disable=attribute-defined-outside-init
+        self.body = self.rfile.read(length) if length else b''
+        path = self.path.split('?', 1)[0]
+        for route_method, regex, handler in self.ROUTES:
+            match = re.fullmatch(regex, path)
+            if route_method == method and match:
+                break
+        else:
+            self.server.count('unknown')
+            self._send(HTTPStatus.NOT_FOUND, {'error': 'Not found.'})
+            return
+
+        self.server.count(handler.strip('_'))
+        delay, fail = self.server.next_fault()
+        if delay:
+            time.sleep(delay)
+        if fail:
+            self._send(HTTPStatus.INTERNAL_SERVER_ERROR,
+                       {'error': 'Injected error.'})
+            return
+        getattr(self, handler)(*match.groups())
+
+    def _send(self, status, body=None, content_type='application/json'):
+        if isinstance(body, bytes):
+            content = body
+        else:
+            content = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+        self.server.count_bytes(len(content))
+
+    # kytosd
+
+    def _config(self):
+        self._send(HTTPStatus.OK, {'napps': self.server.napps_dir,
+                                   'installed_napps': self.server.napps_dir})
+
+    def _core_metadata(self):
+        self._send(HTTPStatus.OK, {'__version__': self.server.version})
+
+    def _enabled(self):
+        napps = [napp_id.split('/') for napp_id in sorted(self.server.enabled)]
+        self._send(HTTPStatus.OK, {'napps': napps})
+
+    def _installed(self):
+        napps = [napp_id.split('/')
+                 for napp_id in sorted(self.server.installed)]
+        self._send(HTTPStatus.OK, {'napps': napps})
+
+    def _napp_metadata(self, username, name, key):
+        napp_id = f'{username}/{name}'
+        if napp_id not in self.server.installed:
+            self._send(HTTPStatus.BAD_REQUEST, {'error': 'Not installed.'})
+            return
+        self._send(HTTPStatus.OK,
+                   {key: self.server.catalog[napp_id].get(key)})
+
+    def _napp_action(self, username, name, action):
+        server = self.server
+        napp_id = f'{username}/{name}'
+        if action == 'install':
+            if napp_id not in server.catalog:
+                self._send(HTTPStatus.NOT_FOUND, {'error': 'NApp not found.'})
+                return
+            if napp_id in server.installed:
+                self._send(HTTPStatus.BAD_REQUEST,
+                           {'error': 'NApp already installed.'})
+                return
+            server.installed.add(napp_id)
+        elif napp_id not in server.installed:
+            self._send(HTTPStatus.BAD_REQUEST, {'error': 'Not installed.'})
+            return
+        elif action == 'uninstall':
+            server.installed.discard(napp_id)
+            server.enabled.discard(napp_id)
+        elif action == 'enable':
+            server.enabled.add(napp_id)
+        else:
+            server.enabled.discard(napp_id)
+        self._send(HTTPStatus.OK, {'response': f'{action}ed'})
+
+    def _reload_all(self):
+        self._send(HTTPStatus.OK, {'response': 'reloaded'})
+
+    def _reload(self, username, name):
+        if f'{username}/{name}' not in self.server.enabled:
+            self._send(HTTPStatus.BAD_REQUEST, {'error': 'Not enabled.'})
+            return
+        self._send(HTTPStatus.OK, {'response': 'reloaded'})
+
+    def _web_update(self, version=None):
+        self._send(HTTPStatus.OK, {'response': f'updated to {version}'})
+
+    # NApps server
+
+    def _catalog(self):
+        napps = list(self.server.catalog.values())
+        self._send(HTTPStatus.OK, {'napps': napps})
+
+    def _napp(self, username, name):
+        meta = self.server.catalog.get(f'{username}/{name}')
+        if meta is None:
+            self._send(HTTPStatus.NOT_FOUND, {'error': 'NApp not found.'})
+        else:
+            self._send(HTTPStatus.OK, meta)
+
+    def _upload(self):
+        match = re.search(rb'name="token"\r\n\r\n(\S+)\r\n', self.body)
+        if not match or match.group(1).decode() not in self.server.tokens:
+            self._send(HTTPStatus.UNAUTHORIZED, {'error': 'Invalid token.'})
+            return
+        self._send(HTTPStatus.CREATED, {'response': 'uploaded'})
+
+    def _delete(self, username, name):
+        token = json.loads(self.body or b'{}').get('token')
+        if token not in self.server.tokens:
+            self._send(HTTPStatus.UNAUTHORIZED, {'error': 'Invalid token.'})
+        elif self.server.catalog.pop(f'{username}/{name}', None) is None:
+            self._send(HTTPStatus.NOT_FOUND, {'error': 'NApp not found.'})
+        else:
+            self._send(HTTPStatus.OK, {'response': 'deleted'})
+
+    def _auth(self):
+        if not self.headers.get('Authorization', '').startswith('Basic '):
+            self._send(HTTPStatus.UNAUTHORIZED, {'error': 'No credentials.'})
+            return
+        credentials = self.headers['Authorization'][6:].encode()
+        token = hashlib.sha256(credentials).hexdigest()
+        self.server.tokens[token] = credentials
+        self._send(HTTPStatus.CREATED, {'hash': token})
+
+    def _register(self):
+        user = json.loads(self.body or b'{}')
+        username = user.get('username')
+        if not username or username in self.server.users:
+            self._send(HTTPStatus.BAD_REQUEST,
+                       {'error': 'Invalid or existing username.'})
+            return
+        self.server.users[username] = user
+        self._send(HTTPStatus.CREATED, {'response': 'User registered.'})
+
+    def _package(self, username, name, version):
+        meta = self.server.catalog.get(f'{username}/{name}')
+        if meta is None or version not in ('latest', meta['version']):
+            self._send(HTTPStatus.NOT_FOUND, {'error': 'Package not found.'})
+            return
+        self._send(HTTPStatus.OK, napp_package(meta),
+                   'application/octet-stream')
+
+
+def main():
+    """Run the stand-in server in the foreground."""
+    args = docopt(__doc__)
+    server = StandInServer(
+        args['--host'], int(args['--port']), int(args['--napps']),
+        int(args['--dependencies']), int(args['--installed']),
+        float(args['--latency']), float(args['--jitter']),
+        float(args['--error-rate']), int(args['--seed']))
+    print(f'Stand-in kytosd and NApps server listening on {server.url}')
+    for name, value in server.config_env().items():
+        print(f'  {name}={value}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,281 @@
+"""Converge the NApps of kytosd to a desired state.
+
+The desired state is described in a YAML file::
+
+    napps:
+      - kytos/of_core               # installed and enabled
+      - kytos/of_lldp:>=2022.3      # ...in one of these versions
+      - napp: kytos/topology
+        enabled: false              # installed, but disabled
+      - napp: kytos/pathfinder
+        installed: false            # not installed
+    prune: true                     # uninstall NApps neither listed nor needed
+
+NApps needed by the desired ones are installed and enabled as well. The
+current state is fetched once and only the difference is carried out: NApps
+are disabled and uninstalled dependents first, then installed and enabled
+dependencies first, with the NApps of each dependency level in parallel.
+
+Versions are constraints, as in :mod:`kytos.utils.versions`. kytosd
+installs the version published in the NApps server, so it must satisfy the
+constraint to be installed.
+"""
+import logging
+import re
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from urllib.error import HTTPError, URLError
+
+from kytos.utils.client import NAppsClient
+from kytos.utils.dependencies import catalog_graph, closure, levels
+from kytos.utils.exceptions import KytosException
+from kytos.utils.napps import NAppsManager
+from kytos.utils.versions import satisfies
+from kytos.utils.yamlloader import YAML_ERRORS, safe_load
+
+LOG = logging.getLogger(__name__)
+
+#: Default number of NApps handled at the same time.
+MAX_WORKERS = 8
+
+#: Desired state of a NApp. The version is a constraint and None accepts
+#: any version.
+Desired = namedtuple('Desired', ['version', 'installed', 'enabled'])
+
+#: Sorted lists of (username, name) for each action, plus the dependency
+#: graph used to order them.
+Plan = namedtuple('Plan', ['disable', 'uninstall', 'install', 'enable',
+                           'graph'])
+
+_NAPP_ID = re.compile(r'([a-zA-Z][a-zA-Z0-9_]{2,})/([a-zA-Z][a-zA-Z0-9_]{2,})'
+                      r'(?::(.+))?')
+
+
+def read_state(state_file):
+    """Return the desired NApps and the prune option of a state file.
+
+    Returns:
+        tuple: A dict with the Desired state of each (username, name) and
+            whether the installed NApps neither listed nor needed must be
+            uninstalled.
+
+    Raises:
+        KytosException: If the file or any of its items is invalid.
+
+    """
+    try:
+        with open(state_file, 'rb') as file:
+            content = safe_load(file.read())
+    except (OSError, *YAML_ERRORS) as exception:
+        raise KytosException(f'Could not read {state_file}: {exception}')
+    if not isinstance(content, dict) or \
+            not isinstance(content.get('napps'), list):
+        raise KytosException(f'{state_file} must have a list of napps.')
+
+    napps, errors = {}, []
+    for index, item in enumerate(content['napps'], 1):
+        item = item if isinstance(item, dict) else {'napp': item}
+        matched = _NAPP_ID.fullmatch(str(item.get('napp', '')))
+        if not matched:
+            errors.append(f'item {index}: not username/name[:version]')
+            continue
+        napp = matched.group(1, 2)
+        if napp in napps:
+            errors.append(f'item {index}: {"/".join(napp)} repeated')
+            continue
+        version = item.get('version', matched.group(3))
+        installed = bool(item.get('installed', True))
+        napps[napp] = Desired(None if version is None else str(version),
+                              installed,
+                              installed and bool(item.get('enabled', True)))
+    if errors:
+        raise KytosException(f'Invalid {state_file}: ' + '; '.join(errors))
+    return napps, bool(content.get('prune', False))
+
+
+# pylint: disable=too-many-arguments,too-many-locals
+def make_plan(desired, prune, installed, enabled, catalog, versions):
+    """Return the Plan taking kytosd from its current to the desired state.
+
+    Args:
+        desired (dict): Desired state of NApps, as from :func:`read_state`.
+        prune (bool): Whether to uninstall the NApps neither desired nor
+            needed by desired ones.
+        installed (set): (username, name) of the installed NApps.
+        enabled (set): (username, name) of the enabled NApps.
+        catalog (list): NApps metadata of the NApps server.
+        versions (dict): Installed version of the NApps with pinned versions.
+
+    Raises:
+        KytosException: If the desired state is inconsistent or can't be
+            reached.
+
+    """
+    graph = catalog_graph(catalog)
+    available = {(meta.get('username', meta.get('author')), meta['name']):
+                 meta.get('version') for meta in catalog}
+    want_installed = closure((napp for napp, state in desired.items()
+                              if state.installed), graph)
+    want_enabled = closure((napp for napp, state in desired.items()
+                            if state.enabled), graph)
+
+    errors = [f'{"/".join(napp)} is needed by other NApps'
+              for napp in sorted(want_installed)
+              if napp in desired and not desired[napp].installed]
+    errors += [f'{"/".join(napp)} must be enabled for other NApps'
+               for napp in sorted(want_enabled)
+               if napp in desired and not desired[napp].enabled]
+
+    reinstall = {napp for napp in want_installed & installed
+                 if not satisfies(versions.get(napp), _pinned(desired, napp))}
+    if prune:
+        uninstall = installed - want_installed
+        disable = enabled - want_enabled
+    else:
+        uninstall = {napp for napp, state in desired.items()
+                     if not state.installed} & installed
+        disable = {napp for napp, state in desired.items()
+                   if not state.enabled} & enabled
+    uninstall |= reinstall
+    disable |= uninstall & enabled
+    install = (want_installed - installed) | reinstall
+    enable = want_enabled - (enabled - disable)
+
+    for napp in sorted(install):
+        version = _pinned(desired, napp)
+        if napp not in available:
+            errors.append(f'{"/".join(napp)} not found in NApps server')
+        elif available[napp] is None and version is not None:
+            errors.append(f'{"/".join(napp)}:{version} not available, '
+                          'NApps server has no version of it')
+        elif not satisfies(available[napp], version):
+            errors.append(f'{"/".join(napp)}:{version} not available, '
+                          f'NApps server has {available[napp]}')
+
+    final = (enabled - disable) | enable
+    errors += [f'{"/".join(napp)} needs {"/".join(dependency)} enabled'
+               for napp in sorted(final) for dependency in graph.get(napp, ())
+               if dependency not in final]
+    if errors:
+        raise KytosException('; '.join(dict.fromkeys(errors)))
+    return Plan(sorted(disable), sorted(uninstall), sorted(install),
+                sorted(enable), graph)
+
+
+def _pinned(desired, napp):
+    """Return the desired version of a NApp, or None for any version."""
+    return desired[napp].version if napp in desired else None
+
+
+def fetch_plan(desired, prune, catalog=None, max_workers=MAX_WORKERS):
+    """Fetch the state of kytosd and the NApps catalog to make a Plan.
+
+    Besides the installed and enabled NApps and the catalog, only the
+    versions of installed NApps that are pinned are requested.
+
+    Args:
+        catalog (list): NApps metadata to use instead of the NApps server
+            catalog, as from a lockfile.
+
+    """
+    mgr = NAppsManager()
+    installed, enabled = set(mgr.get_installed()), set(mgr.get_enabled())
+    if catalog is None:
+        catalog = NAppsClient().get_napps()
+    pinned = [napp for napp, state in desired.items()
+              if state.version is not None and napp in installed]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        versions = dict(zip(pinned, executor.map(
+            lambda napp: _installed_version(mgr, napp), pinned)))
+    return make_plan(desired, prune, installed, enabled, catalog, versions)
+
+
+def _installed_version(mgr, napp):
+    """Return the version of an installed NApp, as told by kytosd.
+
+    Raises:
+        KytosException: If kytosd doesn't tell it.
+
+    """
+    napp_id = '/'.join(napp)
+    try:
+        return mgr.get_version(*napp)
+    except HTTPError as exception:
+        raise KytosException(f'Could not get the version of {napp_id}: '
+                             f'HTTP {exception.code}')
+    except URLError as exception:
+        raise KytosException(f'Could not get the version of {napp_id}: '
+                             f'{exception.reason}')
+    except (KeyError, ValueError):
+        raise KytosException(f'Could not get the version of {napp_id}: '
+                             'invalid metadata')
+
+
+def print_plan(plan):
+    """Print the actions of a plan, one NApp per line."""
+    for action in ('disable', 'uninstall', 'install', 'enable'):
+        for napp in getattr(plan, action):
+            print(f'{action:<9} {"/".join(napp)}')
+    if not any((plan.disable, plan.uninstall, plan.install, plan.enable)):
+        print('Nothing to do.')
+
+
+def apply_plan(plan, max_workers=MAX_WORKERS):
+    """Carry out a plan, the NApps of each dependency level in parallel.
+
+    NApps whose dependencies failed to be installed or enabled are skipped.
+    Requests are made in worker threads, but managers are created and
+    results are logged in the calling thread, so per-thread configuration
+    and output capture (as in ``--controllers``) keep working.
+
+    Returns:
+        dict: Exception of each (username, name) that failed or was
+            skipped, or None for the NApps that converged.
+
+    """
+    results = {}
+    teardown = ('disable', 'uninstall')
+    build = ('install', 'enable')
+    for actions, order in ((teardown, reversed), (build, list)):
+        napps = {napp for action in actions for napp in getattr(plan, action)}
+        for level in order(levels(napps, plan.graph)):
+            tasks = []
+            for napp in level:
+                failed = [dependency for dependency in plan.graph.get(napp, ())
+                          if results.get(dependency) is not None]
+                if failed and actions is build:
+                    results[napp] = KytosException(
+                        'skipped, {} failed'.format(
+                            ', '.join('/'.join(dep) for dep in failed)))
+                    continue
+                mgr = NAppsManager()
+                mgr.set_napp(*napp)
+                tasks.append((mgr, [action for action in actions
+                                    if napp in getattr(plan, action)]))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for (mgr, done), error in zip(tasks, executor.map(
+                        lambda task: _run_actions(*task), tasks)):
+                    napp = (mgr.user, mgr.napp)
+                    results[napp] = results.get(napp) or error
+                    _log_result(mgr.napp_id, done, error)
+    return results
+
+
+def _run_actions(mgr, actions):
+    """Run the actions of a NApp and return the exception that stopped it."""
+    try:
+        for action in actions:
+            mgr.napp_action(action)
+    except HTTPError as exception:
+        return KytosException(f'{action} failed: HTTP {exception.code}')
+    except URLError as exception:
+        return KytosException(f'{action} failed: {exception.reason}')
+    return None
+
+
+def _log_result(napp_id, actions, error):
+    if error is None:
+        LOG.info('  %s: %s.', napp_id, ', '.join(action.rstrip('e') + 'ed'
+                                                 for action in actions))
+    else:
+        LOG.error('  %s: %s', napp_id, error)
@@ -0,0 +1,48 @@
+"""Jinja2 environments shared by everything that renders templates.
+
+Creating an environment per rendered file recompiles every template each
+time. Here, there is one environment per template directory for the whole
+process, and compiled templates are also kept on disk, in the user cache,
+for the next runs of the same kytos-utils version.
+"""
+import logging
+from functools import lru_cache
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+from kytos.utils.metadata import __version__
+from kytos.utils.settings import CACHE_PATH
+
+LOG = logging.getLogger(__name__)
+
+
+def get_environment(templates_path, trim_blocks=False):
+    """Return the shared environment of a template directory.
+
+    Args:
+        templates_path (str, pathlib.Path): Directory of the templates.
+        trim_blocks (bool): Jinja2 option of the environment.
+
+    """
+    return _get_environment(str(Path(templates_path).resolve()),
+                            trim_blocks)
+
+
+@lru_cache(maxsize=None)
+def _get_environment(templates_path, trim_blocks):
+    return Environment(autoescape=False, trim_blocks=trim_blocks,
+                       loader=FileSystemLoader(templates_path),
+                       bytecode_cache=_get_bytecode_cache())
+
+
+@lru_cache(maxsize=1)
+def _get_bytecode_cache():
+    """Return the on-disk cache or None if it can't be created."""
+    directory = CACHE_PATH / 'jinja' / __version__
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+    except OSError as exception:
+        LOG.debug('Not caching compiled templates: %s', exception)
+        return None
+    return FileSystemBytecodeCache(str(directory))
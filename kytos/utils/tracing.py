@@ -0,0 +1,252 @@
+"""Tracing spans of CLI commands, exported as OpenTelemetry OTLP/JSON.
+
+When ``trace`` (a file) or ``trace_endpoint`` (an OTLP/HTTP collector URL,
+such as ``http://localhost:4318/v1/traces``) is set in the ``[global]``
+section of ``~/.kytosrc``, or ``KYTOS_TRACE`` or
+``OTEL_EXPORTER_OTLP_TRACES_ENDPOINT`` in the environment, each command is
+traced as nested spans::
+
+    kytos napps install                       command
+        controller core1                      with --controllers
+            kytos/of_lldp                     NApp
+                GET .../kytos/of_lldp/        HTTP request
+                kytos/of_core                 dependency
+                    GET .../install
+
+and exported when it finishes, as an ``ExportTraceServiceRequest`` in
+OTLP/JSON: appended as one line to the file or posted to the collector.
+No OpenTelemetry package is needed, and spans cost nothing when tracing is
+off.
+
+Spans started in worker threads of a thread pool, which don't inherit the
+current span, are children of the command span.
+"""
+import json
+import logging
+import os
+import secrets
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+
+LOG = logging.getLogger(__name__)
+
+#: Span kinds, as in the OTLP protocol.
+INTERNAL, CLIENT = 1, 3
+
+_STATUS_OK, _STATUS_ERROR = 1, 2
+
+# Current span of each thread.
+_LOCAL = threading.local()
+
+
+def _now():
+    return int(time.time() * 1e9)
+
+
+class Span:
+    """A timed operation with attributes, part of a trace."""
+
+    def __init__(self, name, parent=None, kind=INTERNAL, attributes=None):
+        """Start the span, as a child of ``parent`` if given."""
+        self.name = name
+        self.trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent.span_id if parent else None
+        self.kind = kind
+        self.attributes = dict(attributes or {})
+        self.error = None
+        self.start = _now()
+        self.end = None
+
+    def set_attribute(self, key, value):
+        """Set an attribute. None values are left out."""
+        if value is not None:
+            self.attributes[key] = value
+
+    def set_error(self, message):
+        """Mark the operation as failed."""
+        self.error = message
+
+    def to_otlp(self):
+        """Return the span as OTLP/JSON."""
+        span = {'traceId': self.trace_id, 'spanId': self.span_id,
+                'name': self.name, 'kind': self.kind,
+                'startTimeUnixNano': str(self.start),
+                'endTimeUnixNano': str(self.end),
+                'attributes': _otlp_attributes(self.attributes),
+                'status': {'code': _STATUS_OK}}
+        if self.parent_id:
+            span['parentSpanId'] = self.parent_id
+        if self.error is not None:
+            span['status'] = {'code': _STATUS_ERROR, 'message': self.error}
+        return span
+
+
+class _NoSpan:
+    """Span used when tracing is off: it records nothing."""
+
+    def set_attribute(self, key, value):
+        """Ignore the attribute."""
+
+    def set_error(self, message):
+        """Ignore the error."""
+
+
+_NO_SPAN = _NoSpan()
+
+
+class _Trace:
+    """Spans of the running command and where they are exported to."""
+
+    def __init__(self, root, file=None, endpoint=None):
+        self.root = root
+        self.file = file
+        self.endpoint = endpoint
+        self.spans = []
+        self.lock = threading.Lock()
+
+
+_ACTIVE = None
+
+
+def _otlp_value(value):
+    if isinstance(value, bool):
+        return {'boolValue': value}
+    if isinstance(value, int):
+        return {'intValue': str(value)}
+    if isinstance(value, float):
+        return {'doubleValue': value}
+    if isinstance(value, (list, tuple)):
+        return {'arrayValue': {'values': [_otlp_value(item)
+                                          for item in value]}}
+    return {'stringValue': str(value)}
+
+
+def _otlp_attributes(attributes):
+    return [{'key': key, 'value': _otlp_value(value)}
+            for key, value in attributes.items()]
+
+
+def otlp_request(spans, version=None):
+    """Return an OTLP/JSON ``ExportTraceServiceRequest`` with ``spans``."""
+    resource = {'service.name': 'kytos-utils', 'process.pid': os.getpid()}
+    if version:
+        resource['service.version'] = version
+    return {'resourceSpans': [{
+        'resource': {'attributes': _otlp_attributes(resource)},
+        'scopeSpans': [{'scope': {'name': __name__},
+                        'spans': [span.to_otlp() for span in spans]}]}]}
+
+
+def export(spans, file=None, endpoint=None, version=None, timeout=5):
+    """Append ``spans`` to ``file`` and post them to ``endpoint``.
+
+    Errors are only logged: tracing never stops a command.
+    """
+    data = json.dumps(otlp_request(spans, version),
+                      separators=(',', ':')).encode()
+    if file:
+        try:
+            with open(os.path.expanduser(file), 'ab') as trace_file:
+                trace_file.write(data + b'\n')
+        except OSError as exception:
+            LOG.warning('Could not write trace to %s: %s', file, exception)
+    if endpoint:
+        request = urllib.request.Request(
+            endpoint, data, {'Content-Type': 'application/json'})
+        try:
+            urllib.request.urlopen(request, timeout=timeout).read()
+        except OSError as exception:
+            LOG.warning('Could not send trace to %s: %s', endpoint,
+                        exception)
+
+
+@contextmanager
+def span(name, kind=INTERNAL, **attributes):
+    """Trace the block as a span, child of the current one.
+
+    Yields:
+        Span: to set attributes or errors. Exceptions raised in the block
+            mark it as failed, except ``SystemExit(0)``.
+
+    """
+    trace = _ACTIVE
+    if trace is None:
+        yield _NO_SPAN
+        return
+
+    parent = getattr(_LOCAL, 'span', None)
+    current = Span(name, parent or trace.root, kind, attributes)
+    _LOCAL.span = current
+    try:
+        yield current
+    except SystemExit as exception:
+        if exception.code not in (None, 0):
+            current.set_error(f'exit status {exception.code}')
+        raise
+    except BaseException as exception:
+        current.set_error(repr(exception))
+        raise
+    finally:
+        _LOCAL.span = parent
+        current.end = _now()
+        with trace.lock:
+            trace.spans.append(current)
+
+
+@contextmanager
+def http_span(method, url):
+    """Trace an HTTP request, setting its status code in the block."""
+    with span(method, CLIENT, **{'http.request.method': method,
+                                 'url.full': url}) as current:
+        yield current
+
+
+def set_status(current, status_code):
+    """Set the HTTP status code of a span, failed from 400 on."""
+    current.set_attribute('http.response.status_code', status_code)
+    if isinstance(status_code, int) and status_code >= 400:
+        current.set_error(f'HTTP {status_code}')
+
+
+@contextmanager
+def command(argv, config, version=None):
+    """Trace a CLI command, if tracing is configured, and export it.
+
+    Args:
+        argv (list): Command line, without "kytos".
+        config (ConfigParser): Configuration with ``trace`` and
+            ``trace_endpoint``.
+        version (str): kytos-utils version.
+
+    """
+    global _ACTIVE  # pylint: disable=global-statement
+    file, endpoint = (config.get('global', option)
+                      if config.has_option('global', option) else None
+                      for option in ('trace', 'trace_endpoint'))
+    if not (file or endpoint) or _ACTIVE is not None:
+        yield
+        return
+
+    name = 'kytos ' + ' '.join(arg for arg in argv[:2]
+                               if not arg.startswith('-'))
+    root = Span(name, attributes={'process.command_args':
+                                  ['kytos'] + list(argv)})
+    _ACTIVE = _Trace(root, file, endpoint)
+    _LOCAL.span = root
+    try:
+        yield
+    except SystemExit as exception:
+        if exception.code not in (None, 0):
+            root.set_error(f'exit status {exception.code}')
+        raise
+    except BaseException as exception:
+        root.set_error(repr(exception))
+        raise
+    finally:
+        _LOCAL.span = None
+        root.end = _now()
+        trace, _ACTIVE = _ACTIVE, None
+        export(trace.spans + [root], file, endpoint, version)
@@ -1,9 +1,16 @@
 """Module used to handle Users in Napps Server."""
+import csv
 import logging
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from getpass import getpass
 
+import requests
+
 from kytos.utils.client import UsersClient
+from kytos.utils.exceptions import KytosException
 
 LOG = logging.getLogger(__name__)
 
@@ -20,6 +27,25 @@ EMAIL_PATTERN = ("\t- follow the format: <login>@<domain>\n"
 PHONE_PATTERN = ("\t- insert only numbers", r'\d*$')
 
 
+class RateLimiter:
+    """Spread calls of several threads evenly, ``rate`` per second."""
+
+    def __init__(self, rate):
+        """Set the maximum number of calls per second. Zero disables it."""
+        self.interval = 1 / rate if rate else 0
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Sleep until the next call is allowed."""
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
 class UsersManager:
     """Class used to handle users stored by Napps server."""
 
@@ -78,6 +104,87 @@ class UsersManager:
 
         return self._users_client.register(user)
 
+    @classmethod
+    def read_users(cls, csv_file):
+        """Return the users listed in a CSV file, checked as when asked.
+
+        The header names the columns, as the keys of :attr:`attributes`.
+        Empty cells are left out and every row is checked before anything
+        is registered.
+
+        Raises:
+            KytosException: If the file can't be read or any row is
+                invalid.
+
+        """
+        try:
+            with open(csv_file, newline='') as file:
+                reader = csv.DictReader(file)
+                rows = [(reader.line_num, row) for row in reader]
+                columns = reader.fieldnames or []
+        except (OSError, UnicodeDecodeError, csv.Error) as exception:
+            raise KytosException(f'Could not read {csv_file}: {exception}')
+
+        errors = [f'unknown column {column}' for column in columns
+                  if column not in cls.attributes]
+        errors += [f'missing column {column}' for column in cls.required
+                   if column not in columns]
+        if errors:
+            raise KytosException(f'Invalid {csv_file}: ' + '; '.join(errors))
+
+        users, usernames = [], set()
+        for line, row in rows:
+            user = {attribute: value.strip() for attribute, value in
+                    row.items() if attribute in cls.attributes and
+                    value and value.strip()}
+            invalid = [attribute for attribute in cls.attributes
+                       if (attribute in cls.required or attribute in user)
+                       and not cls.valid_attribute(
+                           user.get(attribute),
+                           cls.attributes[attribute]['pattern'][1])]
+            if invalid:
+                errors.append(f'line {line}: invalid ' + ', '.join(invalid))
+            elif user['username'] in usernames:
+                errors.append(f'line {line}: {user["username"]} repeated')
+            else:
+                usernames.add(user['username'])
+                users.append(user)
+        if errors:
+            raise KytosException(f'Invalid {csv_file}: ' + '; '.join(errors))
+        return users
+
+    def register_users(self, users, max_workers=4, rate=5):
+        """Register several users concurrently.
+
+        Args:
+            users (list): User attributes, as returned by :meth:`read_users`.
+            max_workers (int): Maximum number of simultaneous requests.
+            rate (float): Maximum number of requests per second, not to
+                flood NApps server. Zero disables the limit.
+
+        Returns:
+            dict: The exception raised for each username that could not be
+                registered, or None if it was registered.
+
+        """
+        limiter = RateLimiter(rate)
+
+        def register(user):
+            limiter.wait()
+            try:
+                self._users_client.register_user(user)
+            except (KytosException, requests.RequestException) as exception:
+                return exception
+            # make_request exits when NApps server can't be reached.
+            except SystemExit:
+                return KytosException('NApps server could not be reached.')
+            return None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(register, users)
+            return {user['username']: result
+                    for user, result in zip(users, results)}
+
     def ask_question(self, field_name, pattern=NAME_PATTERN, is_required=False,
                      password=False):
         """Ask a question and get the input values.
@@ -0,0 +1,142 @@
+"""NApp version constraints and a local cache of NApps server metadata.
+
+The version in ``username/name:version`` is a constraint: comma-separated
+clauses such as ``2022.3``, ``==2022.3``, ``>=2022.1,<2023`` or ``!=1.0``.
+A clause without operator means ``==`` and ``latest`` accepts any version.
+
+kytosd installs the version published in the NApps server and takes no
+version parameter, so a constraint can only be checked: against the
+server metadata before installing and against kytosd after installing.
+Metadata is cached in the user cache, so pinning doesn't add a request to
+the NApps server per NApp on every install.
+"""
+import json
+import os
+import re
+import time
+from pathlib import Path
+
+from kytos.utils.client import NAppsClient
+from kytos.utils.exceptions import KytosException
+from kytos.utils.settings import CACHE_PATH
+
+_CLAUSE = re.compile(r'\s*(==|!=|>=|<=|>|<)?\s*([^\s,<>=!]+)\s*')
+
+_OPERATORS = {'==': lambda a, b: a == b, '!=': lambda a, b: a != b,
+              '>=': lambda a, b: a >= b, '<=': lambda a, b: a <= b,
+              '>': lambda a, b: a > b, '<': lambda a, b: a < b}
+
+
+def version_key(version):
+    """Return a key to compare versions such as "2022.3" or "1.0rc1".
+
+    Numeric parts compare as numbers, text parts mark pre-releases, so
+    "2022.1rc1" < "2022.1" < "2022.1.1" < "2022.10".
+    """
+    key = [(2, int(part), '') if part.isdigit() else (0, 0, part)
+           for part in re.findall(r'\d+|[a-zA-Z]+', version)]
+    return key + [(1, 0, '')]
+
+
+def parse_constraint(constraint):
+    """Return the (operator, version) clauses of a constraint.
+
+    Raises:
+        KytosException: If the constraint is invalid.
+
+    """
+    if constraint in (None, '', 'latest'):
+        return []
+    clauses = []
+    for clause in constraint.split(','):
+        matched = _CLAUSE.fullmatch(clause)
+        if not matched:
+            raise KytosException(f'Invalid version constraint: {constraint}')
+        clauses.append((matched.group(1) or '==', matched.group(2)))
+    return clauses
+
+
+def satisfies(version, constraint):
+    """Whether ``version`` satisfies ``constraint``.
+
+    A missing version only satisfies constraints accepting any version.
+    """
+    clauses = parse_constraint(constraint)
+    if not clauses:
+        return True
+    if not version:
+        return False
+    return all(_OPERATORS[operator](version_key(version), version_key(other))
+               for operator, other in clauses)
+
+
+class MetadataCache:
+    """NApps server metadata of single NApps, kept for ``ttl`` seconds."""
+
+    #: Seconds to reuse cached metadata.
+    ttl = 3600
+
+    def __init__(self, path=None, client=None):
+        """Set the cache directory, by default inside the user cache.
+
+        The client is created here, as the configuration may be overridden
+        in this thread only and ``get`` may be called from others.
+        """
+        self.path = Path(path or CACHE_PATH / 'napps')
+        self._client = client or NAppsClient()
+
+    def _file(self, username, name):
+        return self.path / username / f'{name}.json'
+
+    def get(self, username, name):
+        """Return the metadata of a NApp, or None if it isn't in the server.
+
+        Raises:
+            KytosException: If the NApps server answers with an error.
+
+        """
+        cache_file = self._file(username, name)
+        try:
+            cached = json.loads(cache_file.read_text())
+            if time.time() - cached['fetched'] < self.ttl:
+                return cached['metadata']
+        except (OSError, ValueError, KeyError):
+            pass
+
+        metadata = self._client.get_napp(username, name)
+        if metadata is None:
+            return None
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+            tmp_file.write_text(json.dumps({'fetched': time.time(),
+                                            'metadata': metadata}))
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass  # A read-only cache only costs requests.
+        return metadata
+
+    def forget(self, username, name):
+        """Remove a NApp from the cache, for instance when it is stale."""
+        try:
+            self._file(username, name).unlink()
+        except FileNotFoundError:
+            pass
+
+    def resolve(self, username, name, constraint):
+        """Return the version kytosd will install, if it meets a constraint.
+
+        Raises:
+            KytosException: If the NApp isn't in the NApps server or its
+                version doesn't satisfy ``constraint``.
+
+        """
+        metadata = self.get(username, name)
+        if metadata is None:
+            raise KytosException(f'{username}/{name} not found in NApps '
+                                 'server.')
+        version = metadata.get('version')
+        if not satisfies(version, constraint):
+            raise KytosException(f'{username}/{name}:{constraint} not '
+                                 f'available, NApps server has {version}.')
+        return version
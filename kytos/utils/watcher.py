@@ -0,0 +1,259 @@
+"""Watch NApp source trees for changes."""
+import ctypes
+import ctypes.util
+import json
+import logging
+import os
+import select
+import struct
+import time
+from pathlib import Path
+
+LOG = logging.getLogger(__name__)
+
+#: Directories that never contain NApp code worth reloading.
+IGNORED_DIRS = {'.git', '__pycache__', '.kytos', '.tox', '.eggs'}
+
+#: File suffixes written by editors and the interpreter.
+IGNORED_SUFFIXES = ('.pyc', '.pyo', '.swp', '.swx', '~', '.tmp')
+
+
+def is_relevant(path):
+    """Whether a change in ``path`` should trigger a reload."""
+    path = Path(path)
+    if any(part in IGNORED_DIRS for part in path.parts):
+        return False
+    return not (path.name.startswith('.#') or
+                path.name.endswith(IGNORED_SUFFIXES))
+
+
+class PollingObserver:
+    """Detect file changes by comparing modification times periodically."""
+
+    def __init__(self, root, interval=0.5):
+        """Take a first snapshot of ``root``.
+
+        Args:
+            root (pathlib.Path): Directory to be watched recursively.
+            interval (float): Seconds between two consecutive scans.
+
+        """
+        self.root = Path(root)
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self):
+        """Return a dict mapping each file to its modification time."""
+        snapshot = {}
+        for dirname, dirs, files in os.walk(self.root):
+            dirs[:] = [d for d in dirs if d not in IGNORED_DIRS]
+            for filename in files:
+                path = os.path.join(dirname, filename)
+                try:
+                    snapshot[path] = os.stat(path).st_mtime_ns
+                except FileNotFoundError:
+                    continue
+        return snapshot
+
+    def wait(self, timeout=None):
+        """Block until files change or ``timeout`` seconds elapse.
+
+        Returns:
+            list: Paths created, modified or removed. Empty on timeout.
+
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            delay = self.interval
+            if deadline is not None:
+                delay = min(delay, max(0, deadline - time.monotonic()))
+            time.sleep(delay)
+
+            current = self._scan()
+            changed = [path for path in current.keys() | self._snapshot.keys()
+                       if current.get(path) != self._snapshot.get(path)]
+            self._snapshot = current
+            if changed or (deadline is not None and
+                           time.monotonic() >= deadline):
+                return changed
+
+    def close(self):
+        """Nothing to release when polling."""
+
+
+class InotifyObserver:
+    """Detect file changes using the Linux inotify API through libc."""
+
+    _IN_MODIFY = 0x00000002
+    _IN_ATTRIB = 0x00000004
+    _IN_CLOSE_WRITE = 0x00000008
+    _IN_MOVED_FROM = 0x00000040
+    _IN_MOVED_TO = 0x00000080
+    _IN_CREATE = 0x00000100
+    _IN_DELETE = 0x00000200
+    _IN_ISDIR = 0x40000000
+    _IN_NONBLOCK = 0o4000
+
+    _MASK = (_IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM |
+             _IN_MOVED_TO | _IN_CREATE | _IN_DELETE)
+    _EVENT = struct.Struct('iIII')
+
+    def __init__(self, root):
+        """Add an inotify watch to ``root`` and all of its subdirectories.
+
+        Raises:
+            OSError: If inotify is not available on this system.
+
+        """
+        self.root = Path(root)
+        libc_name = ctypes.util.find_library('c')
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self._libc, 'inotify_init1'):
+            raise OSError('inotify is not available.')
+        self._fd = self._libc.inotify_init1(self._IN_NONBLOCK)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed.')
+        self._watches = {}
+        self._add_tree(self.root)
+
+    def _add_tree(self, top):
+        for dirname, dirs, _ in os.walk(top):
+            dirs[:] = [d for d in dirs if d not in IGNORED_DIRS]
+            self._add_watch(dirname)
+
+    def _add_watch(self, dirname):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(dirname),
+                                          self._MASK)
+        if wd >= 0:
+            self._watches[wd] = dirname
+
+    def _read_events(self):
+        """Return paths from all events pending in the inotify queue."""
+        changed = []
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = self._EVENT.unpack_from(data, offset)
+            offset += self._EVENT.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+
+            dirname = self._watches.get(wd)
+            if dirname is None:
+                continue
+            path = os.path.join(dirname, os.fsdecode(name))
+            if mask & self._IN_ISDIR:
+                if mask & (self._IN_CREATE | self._IN_MOVED_TO) and \
+                        os.path.basename(path) not in IGNORED_DIRS:
+                    self._add_tree(path)
+                continue
+            changed.append(path)
+        return changed
+
+    def wait(self, timeout=None):
+        """Block until files change or ``timeout`` seconds elapse.
+
+        Returns:
+            list: Paths created, modified or removed. Empty on timeout.
+
+        """
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return []
+        return self._read_events()
+
+    def close(self):
+        """Release the inotify file descriptor."""
+        os.close(self._fd)
+
+
+def get_observer(root, interval=0.5):
+    """Return an inotify observer if possible, or a polling one otherwise."""
+    try:
+        return InotifyObserver(root)
+    except (OSError, AttributeError, TypeError) as exception:
+        LOG.debug('inotify unavailable (%s), polling instead.', exception)
+        return PollingObserver(root, interval)
+
+
+class NAppsWatcher:
+    """Map file changes in a source tree to the NApps they belong to.
+
+    Bursts of changes are coalesced: the callback only runs when no file has
+    changed for ``debounce`` seconds, and receives every NApp touched by the
+    burst.
+    """
+
+    def __init__(self, path='.', debounce=0.5, observer=None):
+        """Find the NApps below ``path``.
+
+        Args:
+            path (str): NApp directory or a directory containing NApps,
+                such as ``username/`` or a napps tree.
+            debounce (float): Quiet period, in seconds, before reloading.
+            observer: Object with ``wait(timeout)`` and ``close()`` methods.
+                Defaults to :func:`get_observer`.
+
+        """
+        self.path = Path(path).resolve()
+        self.debounce = debounce
+        self.napps = self.find_napps(self.path)
+        self._observer = observer or get_observer(self.path)
+
+    @staticmethod
+    def find_napps(path):
+        """Return a dict mapping NApp directories to (username, name)."""
+        napps = {}
+        for json_file in [path / 'kytos.json', *path.glob('**/kytos.json')]:
+            if not json_file.exists() or not is_relevant(json_file):
+                continue
+            with json_file.open(encoding='utf-8') as data_file:
+                meta = json.load(data_file)
+            # WARNING: This will change for future versions, when 'author'
+            # will be removed.
+            username = meta.get('username', meta.get('author'))
+            napps[json_file.parent] = (username, meta.get('name'))
+        return napps
+
+    def napp_for(self, path):
+        """Return the (username, name) owning ``path`` or None."""
+        path = Path(path)
+        for parent in (path, *path.parents):
+            if parent in self.napps:
+                return self.napps[parent]
+        return None
+
+    def changed_napps(self, paths):
+        """Return the set of NApps owning the relevant changed ``paths``."""
+        napps = {self.napp_for(path) for path in paths if is_relevant(path)}
+        napps.discard(None)
+        return napps
+
+    def watch(self, callback):
+        """Call ``callback(napps)`` after each burst of changes.
+
+        It blocks until interrupted with Ctrl+C.
+        """
+        pending = set()
+        deadline = None
+        try:
+            while True:
+                timeout = None
+                if deadline is not None:
+                    timeout = max(0, deadline - time.monotonic())
+                napps = self.changed_napps(self._observer.wait(timeout))
+                if napps:
+                    pending |= napps
+                    deadline = time.monotonic() + self.debounce
+                elif pending and time.monotonic() >= deadline:
+                    callback(sorted(pending))
+                    pending = set()
+                    deadline = None
+        except KeyboardInterrupt:
+            LOG.info('Stopped watching %s.', self.path)
+        finally:
+            self._observer.close()
@@ -0,0 +1,60 @@
+"""Load YAML documents with the fastest backend available.
+
+Documents are loaded by ruamel.yaml's safe loader, which uses the C parser
+of ``ruamel.yaml.clib`` (pinned in the requirements) and is much faster than
+its pure-Python loader for big documents such as the ``openapi.yml`` of large
+NApps. The pure-Python loader is used only when the C one is missing.
+
+Both follow YAML 1.2, so a document gives the same objects whatever the
+backend: unquoted ``yes``, ``no``, ``on`` and ``off`` are strings, not
+booleans as in YAML 1.1.
+"""
+from ruamel.yaml import YAML, YAMLError
+
+try:
+    from _ruamel_yaml import CParser
+except ImportError:
+    CParser = None
+
+#: Exceptions raised for invalid documents, whatever the backend.
+YAML_ERRORS = (YAMLError,)
+
+
+def _load_ruamel(content):
+    return YAML(typ='safe').load(content)
+
+
+def _load_ruamel_pure(content):
+    return YAML(typ='safe', pure=True).load(content)
+
+
+#: Loaders by name, from the fastest to the slowest.
+BACKENDS = {'ruamel': _load_ruamel,
+            'ruamel-pure': _load_ruamel_pure}
+
+
+def available_backends():
+    """Return the names of the backends with their own loader, fastest first.
+
+    Without ``ruamel.yaml.clib``, "ruamel" falls back to the pure-Python
+    loader, so only "ruamel-pure" is listed.
+    """
+    return [name for name in BACKENDS
+            if name != 'ruamel' or CParser is not None]
+
+
+def safe_load(content, backend=None):
+    """Return the Python objects of a YAML document.
+
+    Only standard YAML tags are accepted, like ``yaml.safe_load``.
+
+    Args:
+        content (str, bytes): The YAML document.
+        backend (str): Name of a backend in BACKENDS. By default, the
+            fastest available one is used.
+
+    Raises:
+        One of YAML_ERRORS: If ``content`` is not valid YAML.
+
+    """
+    return BACKENDS[backend or available_backends()[0]](content)
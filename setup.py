@@ -137,6 +137,21 @@ class CITest(TestCommand):
         check_call(cmd, shell=True)
 
 
+class Benchmark(SimpleCommand):
+    """Performance benchmarks."""
+
+    description = 'run benchmarks and compare them to the stored baselines'
+
+    def run(self):
+        """Run the benchmarks against local stand-in servers."""
+        try:
+            check_call('python3 -m tests.benchmarks', shell=True)
+        except CalledProcessError:
+            print('Benchmarks are slower than the baselines. Check the '
+                  'results above.')
+            sys.exit(-1)
+
+
 class Linter(SimpleCommand):
     """Code linters."""
 
@@ -180,6 +195,7 @@ setup(name='kytos-utils',
       tests_require=['pytest'],
       packages=find_packages(exclude=['tests']),
       cmdclass={
+          'bench': Benchmark,
           'ci': CITest,
           'clean': Cleaner,
           'coverage': TestCoverage,
@@ -0,0 +1 @@
+"""Performance benchmarks of kytos-utils hot paths."""
@@ -0,0 +1,56 @@
+"""Run the kytos-utils benchmarks with ``python3 -m tests.benchmarks``.
+
+Usage:
+       benchmarks [options] [<name>...]
+       benchmarks -h | --help
+
+Options:
+
+  -h, --help              Show this screen.
+  --save                  Store the results as the new baselines.
+  --rounds=<n>            Override the number of timed rounds.
+  --tolerance=<factor>    Fail when a median is slower than the baseline by
+                          more than this factor [default: 1.5].
+  --catalog-size=<n>      NApps in the synthetic catalog [default: 5000].
+
+Benchmarks run against local stand-in servers, with HOME, the NApps server
+and kytosd URLs pointing to temporary locations, so they work offline and
+never touch the user configuration.
+"""
+import sys
+
+from docopt import docopt
+
+from tests.benchmarks.runner import offline_environment
+
+
+def main():
+    """Run the selected benchmarks and compare them to the baselines."""
+    args = docopt(__doc__)
+    rounds = int(args['--rounds']) if args['--rounds'] else None
+    tolerance = float(args['--tolerance'])
+
+    catalog_size = int(args['--catalog-size'])
+    with offline_environment(napps=catalog_size) as (server, tmp_path):
+        # Imported after the environment is ready, as kytos modules read
+        # HOME and XDG_CACHE_HOME when imported.
+        # pylint: disable=import-outside-toplevel
+        from tests.benchmarks import bench_cli  # noqa pylint: disable=W0611
+        from tests.benchmarks.runner import (BENCHMARKS, report, run,
+                                             save_baselines)
+
+        selected = [bench for bench in BENCHMARKS
+                    if not args['<name>'] or bench.name in args['<name>']]
+        env = {'server': server, 'tmp': tmp_path}
+        results = [run(bench, env, rounds) for bench in selected]
+
+    regressions = report(results, tolerance)
+    if args['--save']:
+        save_baselines(results)
+        print('Baselines saved.')
+    elif regressions:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
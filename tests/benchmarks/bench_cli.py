@@ -0,0 +1,157 @@
+"""Benchmarks of the CLI hot paths."""
+import itertools
+import json
+import os
+import re
+import subprocess
+import sys
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+from kytos.cli.commands.napps.parser import parse_napps
+from kytos.utils.napps import NAppsManager
+from kytos.utils.openapi import OpenAPI
+from kytos.utils.yamlloader import available_backends, safe_load
+
+from tests.benchmarks.runner import benchmark
+
+REPO_PATH = Path(__file__).resolve().parent.parent.parent
+SKEL_PATH = REPO_PATH / 'kytos' / 'templates' / 'skel'
+TPL_PATH = SKEL_PATH / 'napp-structure' / 'username' / 'napp'
+
+REST_FUNCTION = '''
+    @rest('/v1/resource{i}/<dpid>', methods=['GET', 'POST'])
+    @rest('/v1/resource{i}', methods=["GET"])
+    def resource{i}(self, dpid=None):
+        """Handle resource {i}.
+
+        A longer description of what resource {i} does, spanning
+        a couple of lines as usual.
+        """
+        return jsonify({{'resource': {i}}})
+'''
+
+
+def write_napp(path, username='bench', name='bignapp'):
+    """Create a NApp directory with kytos.json and return its path."""
+    napp_path = Path(path) / username / name
+    napp_path.mkdir(parents=True, exist_ok=True)
+    meta = {'username': username, 'name': name, 'version': '1.0',
+            'description': 'Benchmark NApp.'}
+    (napp_path / 'kytos.json').write_text(json.dumps(meta))
+    return napp_path
+
+
+@benchmark('parse_napps_5000', rounds=20)
+def bench_parse_napps(env):  # pylint: disable=unused-argument
+    """Parse thousands of NApp IDs given in the command line."""
+    napp_ids = [f'user{i % 50}/napp{i}:1.{i}' for i in range(5000)]
+    yield lambda: parse_napps(napp_ids)
+
+
+@benchmark('search_catalog', rounds=10)
+def bench_search(env):  # pylint: disable=unused-argument
+    """Search a synthetic catalog served by the local server."""
+    pattern = re.compile('.*tag3.*', re.IGNORECASE)
+    yield lambda: NAppsManager.search(pattern)
+
+
+@benchmark('build_napp_package_2000_files', rounds=3)
+def bench_build_napp_package(env):
+    """Package a NApp with a large source tree."""
+    root = env['tmp'] / 'package'
+    napp_path = write_napp(root)
+    for i in range(2000):
+        module_dir = napp_path / f'module{i % 40}'
+        module_dir.mkdir(exist_ok=True)
+        (module_dir / f'file{i}.py').write_text('x = 1\n' * 50)
+    (root / '.gitignore').write_text('*.pyc\n__pycache__\n')
+
+    def build():
+        NAppsManager.build_napp_package('bignapp').close()
+
+    cwd = os.getcwd()
+    os.chdir(root)
+    try:
+        yield build
+    finally:
+        os.chdir(cwd)
+
+
+@benchmark('openapi_parse_500_endpoints', rounds=10)
+def bench_openapi_parse(env):
+    """Extract endpoints from a big main.py."""
+    napp_path = write_napp(env['tmp'] / 'openapi')
+    code = 'class Main(KytosNApp):\n' + ''.join(
+        REST_FUNCTION.format(i=i) for i in range(500))
+    openapi = OpenAPI(napp_path, TPL_PATH)
+
+    def parse():
+        openapi._paths = {}  # pylint: disable=protected-access
+        # pylint: disable=protected-access
+        openapi._parse_decorated_functions(code)
+
+    yield parse
+
+
+def _bench_yaml_load(backend):
+    @benchmark(f'yaml_load_openapi_{backend}', rounds=5)
+    def bench_yaml_load(env):
+        """Load the openapi.yml skeleton of a NApp with 500 endpoints."""
+        napp_path = write_napp(env['tmp'] / f'yaml_{backend}')
+        code = 'class Main(KytosNApp):\n' + ''.join(
+            REST_FUNCTION.format(i=i) for i in range(500))
+        napp_path.joinpath('main.py').write_text(code)
+        OpenAPI(napp_path, TPL_PATH).render_template()
+        content = napp_path.joinpath('openapi.yml').read_text()
+        yield lambda: safe_load(content, backend)
+    return bench_yaml_load
+
+
+for _backend in available_backends():
+    _bench_yaml_load(_backend)
+
+
+@benchmark('create_napp', rounds=10)
+def bench_create_napp(env):
+    """Render the templates of a new NApp."""
+    root = env['tmp'] / 'create'
+    root.mkdir()
+    counter = itertools.count()
+
+    def create():
+        username = 'user{}'.format(next(counter))
+        inputs = iter([username, 'mynapp', 'Description.'])
+        with patch('builtins.input', lambda _: next(inputs)), \
+                redirect_stdout(StringIO()):
+            NAppsManager.create_napp()
+
+    cwd = os.getcwd()
+    os.chdir(root)
+    try:
+        with patch('kytos.utils.napps.SKEL_PATH', SKEL_PATH):
+            yield create
+    finally:
+        os.chdir(cwd)
+
+
+def _run_cli(*args):
+    """Run bin/kytos in a new process."""
+    env = dict(os.environ, PYTHONPATH=str(REPO_PATH), KYTOS_NO_HELPER='1')
+    subprocess.run([sys.executable, str(REPO_PATH / 'bin' / 'kytos'), *args],
+                   env=env, stdout=subprocess.DEVNULL,
+                   stderr=subprocess.DEVNULL, check=False)
+
+
+@benchmark('cli_cold_start_version', rounds=5)
+def bench_cli_version(env):  # pylint: disable=unused-argument
+    """Start the CLI only to print its version."""
+    yield lambda: _run_cli('--version')
+
+
+@benchmark('cli_cold_start_napps', rounds=5)
+def bench_cli_napps(env):  # pylint: disable=unused-argument
+    """Start the CLI and query kytosd once."""
+    yield lambda: _run_cli('napps', 'uninstall', 'bench/notinstalled')
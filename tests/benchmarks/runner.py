@@ -0,0 +1,107 @@
+"""Register, run and compare benchmarks against stored baselines."""
+import json
+import os
+import statistics
+import tempfile
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+from pathlib import Path
+from unittest.mock import patch
+
+from kytos.utils.standin import StandInServer
+
+BASELINES_FILE = Path(__file__).parent / 'baselines.json'
+
+Benchmark = namedtuple('Benchmark', ['name', 'func', 'rounds'])
+Result = namedtuple('Result', ['name', 'median', 'best', 'baseline'])
+
+#: Registered benchmarks, in definition order.
+BENCHMARKS = []
+
+
+def benchmark(name, rounds=5):
+    """Register a benchmark.
+
+    The decorated function is a generator receiving the environment of the
+    run (see ``__main__``). Code before its single ``yield`` prepares the
+    benchmark, the yielded callable is timed ``rounds`` times and code after
+    the ``yield`` cleans up.
+    """
+    def register(func):
+        BENCHMARKS.append(Benchmark(name, func, rounds))
+        return func
+    return register
+
+
+@contextmanager
+def offline_environment(**standin_options):
+    """Start a stand-in server and point HOME and the CLI config to it.
+
+    Yields:
+        tuple: The running StandInServer and the temporary HOME path.
+
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir, \
+            StandInServer(**standin_options) as server:
+        env = dict(server.config_env(), HOME=tmp_dir, XDG_CACHE_HOME=tmp_dir)
+        with patch.dict(os.environ, env):
+            yield server, Path(tmp_dir)
+
+
+def load_baselines():
+    """Return a dict mapping benchmark names to baseline medians."""
+    try:
+        with BASELINES_FILE.open() as baselines:
+            return json.load(baselines)
+    except FileNotFoundError:
+        return {}
+
+
+def save_baselines(results):
+    """Store the medians of ``results`` as the new baselines."""
+    baselines = load_baselines()
+    baselines.update({result.name: round(result.median, 6)
+                      for result in results})
+    with BASELINES_FILE.open('w') as out_file:
+        json.dump(baselines, out_file, indent=2, sort_keys=True)
+        out_file.write('\n')
+
+
+def run(bench, env, rounds=None):
+    """Run one benchmark and return its Result."""
+    baselines = load_baselines()
+    steps = bench.func(env)
+    target = next(steps)
+    target()  # Warm up caches and imports outside the measurements.
+    times = []
+    try:
+        for _ in range(rounds or bench.rounds):
+            start = time.perf_counter()
+            target()
+            times.append(time.perf_counter() - start)
+    finally:
+        next(steps, None)
+    return Result(bench.name, statistics.median(times), min(times),
+                  baselines.get(bench.name))
+
+
+def report(results, tolerance):
+    """Print a table of results and return the regressed ones."""
+    regressions = []
+    print('{:<32} {:>11} {:>11} {:>11} {:>7}'.format(
+        'Benchmark', 'Median (s)', 'Best (s)', 'Baseline', 'Ratio'))
+    for result in results:
+        ratio, status = '', ''
+        if result.baseline:
+            ratio = result.median / result.baseline
+            if ratio > tolerance:
+                regressions.append(result)
+                status = ' SLOWER'
+            ratio = '{:.2f}'.format(ratio)
+        baseline = '{:.6f}'.format(result.baseline) if result.baseline \
+            else '-'
+        print('{:<32} {:>11.6f} {:>11.6f} {:>11} {:>7}{}'.format(
+            result.name, result.median, result.best, baseline, ratio,
+            status))
+    return regressions
@@ -0,0 +1,130 @@
+"""Drive NAppsAPI against stand-in servers with growing numbers of NApps.
+
+Run it with ``python3 -m tests.benchmarks.scale``.
+
+Usage:
+       scale [options]
+       scale -h | --help
+
+Options:
+
+  -h, --help              Show this screen.
+  --sizes=<list>          Comma-separated catalog sizes
+                          [default: 10,100,1000].
+  --dependencies=<n>      Maximum dependencies of each NApp [default: 3].
+  --latency=<seconds>     Delay added by the stand-in servers [default: 0].
+  --no-memory             Skip peak memory tracing, which slows Python down.
+  --json=<file>           Also write the results to a JSON file.
+
+For every size, all NApps of a synthetic catalog with a random acyclic
+dependency graph are installed, disabled, enabled, listed and reloaded. The
+"Req/NApp" and "KiB/NApp" columns should stay flat as sizes grow; a column
+that grows with the size points to a code path with quadratic behaviour.
+"""
+import json
+import logging
+import os
+import tempfile
+import time
+import tracemalloc
+from collections import namedtuple
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest.mock import patch
+
+from docopt import docopt
+
+from tests.benchmarks.runner import offline_environment
+
+Measure = namedtuple('Measure', ['size', 'operation', 'requests', 'kib',
+                                 'seconds', 'peak_mib'])
+
+
+# kytos modules are imported by main(), after HOME and XDG_CACHE_HOME
+# point to a temporary directory, as they read them when imported.
+# pylint: disable=import-outside-toplevel
+
+
+def operations(napps, cache_path):
+    """Return (name, callable) pairs run in order for each size.
+
+    NApps metadata is cached in ``cache_path``, as catalogs of different
+    sizes have NApps with the same names and other dependencies.
+    """
+    from kytos.cli.commands.napps.api import NAppsAPI
+    from kytos.utils.versions import MetadataCache
+    cache = MetadataCache(cache_path)
+    return [
+        ('install', lambda: NAppsAPI.install_napps(napps, cache)),
+        ('disable', lambda: NAppsAPI.disable({'all': True})),
+        ('enable', lambda: NAppsAPI.enable({'all': True})),
+        ('list', lambda: NAppsAPI.list({})),
+        ('reload', lambda: NAppsAPI.reload({'all': False,
+                                            '<napp>': napps})),
+    ]
+
+
+def measure(server, size, name, func, trace_memory=True):
+    """Run ``func`` once and return its Measure."""
+    from kytos.cli.commands.napps.api import NAppsAPI
+    server.reset_counts()
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    # The table printed by "list" would need a terminal.
+    with redirect_stdout(StringIO()), \
+            patch.object(NAppsAPI, 'print_napps'):
+        func()
+    seconds = time.perf_counter() - start
+    peak = 0
+    if trace_memory:
+        peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        tracemalloc.stop()
+    return Measure(size, name, sum(server.counts.values()),
+                   server.bytes_sent / 1024, seconds, peak)
+
+
+def run_size(size, dependencies, latency, trace_memory):
+    """Return the measures of all operations for a catalog of ``size``."""
+    with offline_environment(napps=size, max_dependencies=dependencies,
+                             latency=latency) as (server, tmp_path):
+        napps = [tuple(napp_id.split('/')) for napp_id in server.catalog]
+        return [measure(server, size, name, func, trace_memory)
+                for name, func in operations(napps, tmp_path / 'napps')]
+
+
+def report(measures):
+    """Print a table with the measures."""
+    print('{:>6} {:<9} {:>9} {:>9} {:>10} {:>10} {:>10}'.format(
+        'NApps', 'Operation', 'Requests', 'Req/NApp', 'KiB/NApp',
+        'Wall (s)', 'Peak (MiB)'))
+    row = '{:>6} {:<9} {:>9} {:>9.1f} {:>10.2f} {:>10.3f} {:>10.2f}'
+    for item in measures:
+        print(row.format(item.size, item.operation, item.requests,
+                         item.requests / item.size, item.kib / item.size,
+                         item.seconds, item.peak_mib))
+
+
+def main():
+    """Run the harness for all sizes."""
+    args = docopt(__doc__)
+    logging.disable(logging.CRITICAL)
+    measures = []
+    # HOME of the kytos modules, imported once for all sizes.
+    with tempfile.TemporaryDirectory() as home, \
+            patch.dict(os.environ, HOME=home, XDG_CACHE_HOME=home):
+        for size in (int(size) for size in args['--sizes'].split(',')):
+            measures += run_size(size, int(args['--dependencies']),
+                                 float(args['--latency']),
+                                 not args['--no-memory'])
+    logging.disable(logging.NOTSET)
+
+    report(measures)
+    if args['--json']:
+        with open(args['--json'], 'w') as out_file:
+            json.dump([item._asdict() for item in measures], out_file,
+                      indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+"""kytos.cli.commands.bug_report.api.BugReportAPI tests."""
+import json
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from kytos.cli.commands.bug_report.api import BugReportAPI, Collected
+from kytos.utils.exceptions import KytosException
+
+
+# pylint: disable=protected-access
+class TestBugReportAPI(unittest.TestCase):
+    """Test the class BugReportAPI."""
+
+    def setUp(self):
+        """Execute steps before each tests."""
+        self.bug_report_api = BugReportAPI()
+
+    @patch('kytos.cli.commands.bug_report.api.BugReportAPI._collect_napps')
+    @patch('kytos.cli.commands.bug_report.api.BugReportAPI._collect_system')
+    def test_collect(self, *args):
+        """Test collect method with failing and hanging collectors."""
+        (mock_system, mock_napps) = args
+        release = threading.Event()
+        mock_system.side_effect = release.wait
+        mock_napps.side_effect = KytosException('kytosd is down')
+
+        collected = self.bug_report_api.collect(
+            ['system', 'python', 'napps'], timeout=0.2)
+        release.set()
+
+        self.assertIsInstance(collected['system'].error, TimeoutError)
+        self.assertIsInstance(collected['napps'].error, KytosException)
+        self.assertIsNone(collected['python'].error)
+        self.assertIn('pip', collected['python'].data)
+
+    @patch('kytos.cli.commands.bug_report.api.probe_kytosd')
+    def test_collect__latency(self, mock_probe_kytosd):
+        """Test collect method gives the latency probes the time left."""
+        mock_probe_kytosd.return_value = [{'url': 'url', 'error': None}]
+
+        collected = self.bug_report_api.collect(['latency'], timeout=2)
+
+        self.assertEqual(collected['latency'].data,
+                         [{'url': 'url', 'error': None}])
+        total = mock_probe_kytosd.call_args[1]['total']
+        self.assertLess(total, 2)
+        self.assertGreater(total, 1)
+
+    @patch('kytos.cli.commands.bug_report.api.metadata.distributions')
+    def test_collect_packages(self, mock_distributions):
+        """Test _collect_packages method."""
+        def dist(name, version, direct_url=None):
+            mock = MagicMock(metadata={'Name': name}, version=version)
+            mock.read_text.return_value = direct_url and json.dumps(
+                direct_url)
+            return mock
+
+        mock_distributions.return_value = [
+            dist('requests', '2.0'),
+            dist('kytos', '2021.1'),
+            dist('kytos-utils', '2021.1', {
+                'url': 'https://github.com/kytos/kytos-utils.git',
+                'vcs_info': {'vcs': 'git', 'commit_id': '0123456789abc'}})]
+
+        packages = self.bug_report_api._collect_packages()
+
+        self.assertEqual(packages, [
+            {'name': 'kytos', 'version': '2021.1'},
+            {'name': 'kytos-utils', 'version': '2021.1',
+             'repository': 'github.com/kytos/kytos-utils',
+             'commit': '01234567'}])
+
+    @patch('kytos.cli.commands.bug_report.api.NAppsManager')
+    def test_collect_napps(self, mock_napps_manager):
+        """Test _collect_napps method."""
+        mgr = mock_napps_manager.return_value
+        mgr.get_installed.return_value = [('kytos', 'of_lldp'),
+                                          ('kytos', 'of_core')]
+        mgr.get_enabled.return_value = [('kytos', 'of_core')]
+
+        napps = self.bug_report_api._collect_napps()
+
+        self.assertEqual(napps, [{'napp': 'kytos/of_core', 'enabled': True},
+                                 {'napp': 'kytos/of_lldp', 'enabled': False}])
+
+    @patch('builtins.print')
+    @patch('kytos.cli.commands.bug_report.api.BugReportAPI.collect')
+    def test_bug_report(self, *args):
+        """Test bug_report method printing all sections."""
+        (mock_collect, mock_print) = args
+        path = {'path': '/usr/bin/x', 'version': '1.0'}
+        mock_collect.return_value = {
+            'system': Collected({'release': {'NAME': 'Debian'},
+                                 'uname': 'Linux'}, None, 0.1),
+            'python': Collected({'python': path, 'pip': path}, None, 0.1),
+            'packages': Collected([{'name': 'kytos', 'version': '1.0'}],
+                                  None, 0.1),
+            'kytos': Collected({'kytosd': path, 'kytos': path}, None, 0.1),
+            'napps': Collected(None, TimeoutError('no answer in 2.0s'), 2)}
+
+        self.bug_report_api.bug_report({'--timeout': '2'})
+
+        mock_collect.assert_called_with(timeout=2.0)
+        printed = [call_args[0][0] for call_args in mock_print.call_args_list]
+        self.assertIn('NAME=Debian', printed)
+        self.assertIn('## Kytosd', printed)
+        self.assertIn("Not available: TimeoutError('no answer in 2.0s')",
+                      printed)
+
+    def test_bug_report__invalid_timeout(self):
+        """Test bug_report method with invalid timeouts."""
+        for timeout in ('abc', '0', '-1'):
+            with self.subTest(timeout=timeout):
+                with self.assertRaises(KytosException):
+                    self.bug_report_api.bug_report({'--timeout': timeout})
+
+    @patch('builtins.print')
+    @patch('kytos.cli.commands.bug_report.api.BugReportAPI.collect')
+    def test_bug_report__json(self, *args):
+        """Test bug_report method printing a JSON document."""
+        (mock_collect, mock_print) = args
+        mock_collect.return_value = {
+            'system': Collected({'uname': 'Linux'}, None, 0.0123456789),
+            'latency': Collected(None, TimeoutError('no answer'), 5)}
+
+        self.bug_report_api.bug_report({'--json': True, '--timeout': '5'})
+
+        mock_collect.assert_called_with(BugReportAPI.COLLECTORS +
+                                        ('latency',), 5.0)
+        report = json.loads(mock_print.call_args[0][0])
+        self.assertEqual(report['collectors']['system'], {
+            'data': {'uname': 'Linux'}, 'error': None, 'seconds': 0.012346})
+        self.assertEqual(report['collectors']['latency']['error'],
+                         "TimeoutError('no answer')")
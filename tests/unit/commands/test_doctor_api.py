@@ -0,0 +1,63 @@
+"""kytos.cli.commands.doctor.api.DoctorAPI tests."""
+import unittest
+from unittest.mock import patch
+
+from kytos.cli.commands.doctor.api import DoctorAPI
+from kytos.utils.exceptions import KytosException
+
+CONNECTION = {'url': 'http://host/', 'dns': 0.001, 'tcp': 0.002, 'tls': None,
+              'first_byte': 0.05, 'error': None}
+CATALOG = {'url': 'http://host/napps/', 'bytes': 2048, 'seconds': 0.5,
+           'throughput': 4096, 'error': None}
+PACKAGE = {'files': 10, 'bytes': 10240, 'compressed': 1024, 'seconds': 0.1}
+
+
+class TestDoctorAPI(unittest.TestCase):
+    """Test the class DoctorAPI."""
+
+    def setUp(self):
+        """Execute steps before each tests."""
+        self.doctor_api = DoctorAPI()
+
+    def test_rank(self):
+        """Test rank method putting the slowest measures first."""
+        connections = {'kytos.api': CONNECTION,
+                       'napps.api': dict(CONNECTION, dns=1.0)}
+
+        ranked = self.doctor_api.rank(connections, CATALOG, PACKAGE)
+
+        self.assertEqual(ranked[:3], [(1.0, 'DNS of napps.api'),
+                                      (0.5, 'Catalog download'),
+                                      (0.1, 'Package build')])
+        self.assertEqual(len(ranked), 8)
+
+    @patch('builtins.print')
+    @patch('kytos.cli.commands.doctor.api.time_package_build',
+           return_value=PACKAGE)
+    @patch('kytos.cli.commands.doctor.api.time_download',
+           return_value=CATALOG)
+    @patch('kytos.cli.commands.doctor.api.time_connection',
+           return_value=CONNECTION)
+    @patch('kytos.cli.commands.doctor.api.KytosConfig')
+    def test_doctor(self, *args):
+        """Test doctor method with and without --perf."""
+        (mock_config, mock_connection, mock_download, _, mock_print) = args
+        mock_config.return_value.config.get.side_effect = \
+            lambda section, option: f'http://{section}-{option}/'
+
+        self.doctor_api.doctor({'--perf': False, '--timeout': '2'})
+
+        self.assertEqual(mock_connection.call_count, 3)
+        mock_connection.assert_any_call('http://napps-repo/', 2.0)
+        mock_download.assert_not_called()
+
+        self.doctor_api.doctor({'--perf': True, '--timeout': '2'})
+
+        mock_download.assert_called_with('http://napps-api/napps/', 2.0)
+        printed = [call_args[0][0] for call_args in mock_print.call_args_list]
+        self.assertIn('# Bottlenecks', printed)
+
+    def test_doctor__invalid_timeout(self):
+        """Test doctor method with an invalid timeout."""
+        with self.assertRaises(KytosException):
+            self.doctor_api.doctor({'--perf': False, '--timeout': 'x'})
@@ -1,4 +1,7 @@
 """kytos.cli.commands.napps.api.NAppsAPI tests."""
+import os
+import socket
+import tempfile
 import unittest
 from unittest.mock import MagicMock, call, patch
 from urllib.error import HTTPError
@@ -6,7 +9,12 @@ from urllib.error import HTTPError
 import requests
 
 from kytos.cli.commands.napps.api import NAppsAPI
+from kytos.utils.config import KytosConfig
 from kytos.utils.exceptions import KytosException
+from kytos.utils.mirror import Synced
+from kytos.utils.standin import StandInServer
+from kytos.utils.state import Plan
+from kytos.utils.versions import MetadataCache
 
 
 # pylint: disable=too-many-public-methods
@@ -124,6 +132,23 @@ class TestNAppsAPI(unittest.TestCase):
 
         mock_create_napp.assert_called()
 
+    @patch('kytos.cli.commands.napps.api.LOG')
+    @patch('kytos.cli.commands.napps.api.NAppsManager')
+    def test_create__from_manifest(self, *args):
+        """Test create method with a manifest."""
+        (mock_napps_manager, mock_logger) = args
+        napps = [('kytos', 'one', None, False), ('kytos', 'two', None, True)]
+        mock_napps_manager.read_manifest.return_value = napps
+        mock_napps_manager.create_napps.return_value = {
+            'kytos/one': None, 'kytos/two': FileExistsError('kytos/two')}
+
+        self.napps_api.create({'--from': 'napps.yml'})
+
+        mock_napps_manager.read_manifest.assert_called_with('napps.yml')
+        mock_napps_manager.create_napps.assert_called_with(napps)
+        mock_napps_manager.create_napp.assert_not_called()
+        self.assertEqual(mock_logger.error.call_count, 1)
+
     @patch('kytos.cli.commands.napps.api.NAppsManager.upload')
     def test_upload(self, mock_upload):
         """Test upload method."""
@@ -145,11 +170,13 @@ class TestNAppsAPI(unittest.TestCase):
         mgr.set_napp.assert_called_with(*napp)
         mgr.remote_uninstall.assert_called()
 
+    @patch('kytos.cli.commands.napps.api.MetadataCache')
     @patch('kytos.cli.commands.napps.api.NAppsManager')
-    def test_install(self, mock_napps_manager):
+    def test_install(self, mock_napps_manager, _):
         """Test install method."""
         mgr = MagicMock()
         mgr.is_installed.return_value = False
+        mgr.get_version.return_value = 'version'
         mock_napps_manager.return_value = mgr
 
         napp = ('user', 'napp', 'version')
@@ -159,11 +186,76 @@ class TestNAppsAPI(unittest.TestCase):
         mgr.set_napp.assert_called_with(*napp)
         mgr.remote_install.assert_called()
 
+    @patch('kytos.cli.commands.napps.api.NAppsAPI._apply_plan')
+    @patch('kytos.cli.commands.napps.api.print_plan')
+    @patch('kytos.cli.commands.napps.api.verify_lock')
+    @patch('kytos.cli.commands.napps.api.fetch_plan')
+    @patch('kytos.cli.commands.napps.api.read_lock')
+    def test_install__lock(self, *args):
+        """Test install method with a lockfile."""
+        (mock_read_lock, mock_fetch_plan, mock_verify_lock, _,
+         mock_apply_plan) = args
+        mock_read_lock.return_value = {'napps': {'kytos/one': {
+            'version': '1.0', 'sha256': 'x', 'napp_dependencies': []}}}
+        plan = Plan([], [], [('kytos', 'one')], [('kytos', 'one')], {})
+        mock_fetch_plan.return_value = plan
+
+        self.napps_api.install({'--lock': 'napps.lock', '<napp>': []})
+
+        mock_read_lock.assert_called_with('napps.lock')
+        mock_verify_lock.assert_called_with(mock_read_lock.return_value,
+                                            [('kytos', 'one')])
+        mock_apply_plan.assert_called_with(plan)
+
+    @patch('kytos.cli.commands.napps.api.write_lock')
+    @patch('kytos.cli.commands.napps.api.fetch_lock')
+    def test_lock(self, *args):
+        """Test lock method."""
+        (mock_fetch_lock, mock_write_lock) = args
+        napps = [('kytos', 'one', None)]
+
+        self.napps_api.lock({'<napp>': napps, '--output': 'napps.lock'})
+
+        mock_fetch_lock.assert_called_with(napps)
+        mock_write_lock.assert_called_with(mock_fetch_lock.return_value,
+                                           'napps.lock')
+
+    @patch('kytos.cli.commands.napps.api.LOG')
+    @patch('kytos.cli.commands.napps.api.sync')
+    @patch('kytos.cli.commands.napps.api.read_lock')
+    def test_mirror(self, *args):
+        """Test mirror method with a lockfile."""
+        (mock_read_lock, mock_sync, mock_logger) = args
+        mock_sync.return_value = [
+            Synced('kytos/one', '1.0', True, None),
+            Synced('kytos/two', '1.0', False, KytosException('HTTP 404'))]
+
+        self.napps_api.mirror({'<dir>': 'mirror', '--lock': 'napps.lock',
+                               '--serve': False})
+
+        mock_sync.assert_called_with('mirror', mock_read_lock.return_value)
+        mock_logger.error.assert_called_with('%d of %d NApps failed.', 1, 2)
+
+    @patch('kytos.cli.commands.napps.api.make_server')
+    def test_mirror__serve(self, mock_make_server):
+        """Test mirror method serving a directory."""
+        server = mock_make_server.return_value
+        server.server_address = ('127.0.0.1', 8080)
+        server.serve_forever.side_effect = KeyboardInterrupt
+
+        self.napps_api.mirror({'<dir>': 'mirror', '--serve': True,
+                               '--bind': '127.0.0.1', '--port': '8080'})
+
+        mock_make_server.assert_called_with('mirror', '127.0.0.1', 8080)
+        server.server_close.assert_called()
+
+    @patch('kytos.cli.commands.napps.api.MetadataCache')
     @patch('kytos.cli.commands.napps.api.NAppsManager')
-    def test_install_napps(self, mock_napps_manager):
+    def test_install_napps(self, mock_napps_manager, mock_cache):
         """Test prepare method."""
         mgr = MagicMock()
         mgr.is_installed.return_value = False
+        mgr.get_version.return_value = 'version'
         mock_napps_manager.return_value = mgr
 
         napp = ('user', 'napp', 'version')
@@ -171,6 +263,88 @@ class TestNAppsAPI(unittest.TestCase):
 
         mgr.set_napp.assert_called_with(*napp)
         mgr.remote_install.assert_called()
+        mock_cache.return_value.resolve.assert_called_with(
+            mgr.user, mgr.napp, 'version')
+        mgr.remote_uninstall.assert_not_called()
+
+    @patch('kytos.utils.config.create_skel_dir')
+    def test_install_napps__dependencies_first(self, _):
+        """Test install_napps method with dependencies known up front."""
+        catalog = [{'username': 'kytos', 'name': name, 'version': '1.0',
+                    'napp_dependencies': deps}
+                   for name, deps in (('of_core', []),
+                                      ('of_lldp', ['kytos/of_core']),
+                                      ('topology', ['kytos/of_lldp']))]
+        server = StandInServer(napps=catalog).start()
+        self.addCleanup(server.stop)
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+
+        with KytosConfig.override('kytos', 'api', server.url), \
+                KytosConfig.override('napps', 'api', server.url + 'api/'):
+            self.napps_api.install_napps([('kytos', 'topology', None)],
+                                         MetadataCache(tmp_dir.name))
+
+        self.assertEqual(server.enabled, {'kytos/of_core', 'kytos/of_lldp',
+                                          'kytos/topology'})
+        # Dependencies come from the NApps server, not from kytosd.
+        self.assertEqual(server.counts['napp'], 3)
+        self.assertEqual(server.counts['napp_metadata'], 0)
+
+    @patch('kytos.utils.config.create_skel_dir')
+    def test_install_napps__napps_server_down(self, _):
+        """Test install_napps method reading dependencies from kytosd."""
+        catalog = [{'username': 'kytos', 'name': name, 'version': '1.0',
+                    'napp_dependencies': deps}
+                   for name, deps in (('of_core', []),
+                                      ('of_lldp', ['kytos/of_core']))]
+        server = StandInServer(napps=catalog).start()
+        self.addCleanup(server.stop)
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            napps_api = 'http://127.0.0.1:{}/api/'.format(
+                sock.getsockname()[1])
+
+        with KytosConfig.override('kytos', 'api', server.url), \
+                KytosConfig.override('napps', 'api', napps_api):
+            self.napps_api.install_napps([('kytos', 'of_lldp', None)],
+                                         MetadataCache(tmp_dir.name))
+
+        self.assertEqual(server.enabled, {'kytos/of_core', 'kytos/of_lldp'})
+        self.assertGreater(server.counts['napp_metadata'], 0)
+
+    @patch('kytos.cli.commands.napps.api.LOG')
+    @patch('kytos.cli.commands.napps.api.NAppsManager')
+    def test_install_napps__unavailable_version(self, *args):
+        """Test install_napps method with a version not in NApps server."""
+        (mock_napps_manager, mock_logger) = args
+        mgr = MagicMock()
+        mgr.is_installed.return_value = False
+        mock_napps_manager.return_value = mgr
+        cache = MagicMock()
+        cache.resolve.side_effect = KytosException('not available')
+
+        self.napps_api.install_napps([('user', 'napp', '>=2.0')], cache)
+
+        mgr.remote_install.assert_not_called()
+        mock_logger.error.assert_called_with('Error installing NApp: %s',
+                                             cache.resolve.side_effect)
+
+    def test_check_installed_version(self):
+        """Test check_installed_version method uninstalling other versions."""
+        mgr = MagicMock()
+        mgr.get_version.return_value = '2.0'
+        cache = MagicMock()
+
+        self.napps_api.check_installed_version(mgr, '>=2.0', cache)
+        mgr.remote_uninstall.assert_not_called()
+
+        with self.assertRaises(KytosException):
+            self.napps_api.check_installed_version(mgr, '<2.0', cache)
+        mgr.remote_uninstall.assert_called()
+        cache.forget.assert_called_with(mgr.user, mgr.napp)
 
     @patch('kytos.cli.commands.napps.api.NAppsManager')
     def test_install_napp(self, mock_napps_manager):
@@ -224,18 +398,15 @@ class TestNAppsAPI(unittest.TestCase):
 
         mock_print.assert_called_with({(('kytos', 'mef_eline'), '')})
 
-    @patch('os.popen')
+    @patch('shutil.get_terminal_size',
+           return_value=os.terminal_size((1000, 1000)))
     @patch('builtins.print')
     @patch('kytos.cli.commands.napps.api.NAppsManager')
     def test_print_napps(self, *args):
         """Test _print_napps method."""
-        (mock_napps_manager, mock_print, mock_popen) = args
+        (mock_napps_manager, mock_print, _) = args
         napps = [('kytos', 'mef_eline')]
 
-        mock_test = MagicMock()
-        mock_test.read.return_value = '1000 1000'
-        mock_popen.return_value = mock_test
-
         mgr = MagicMock()
         mgr.get_enabled.return_value = napps
         mgr.get_installed.return_value = napps
@@ -305,9 +476,35 @@ class TestNAppsAPI(unittest.TestCase):
         mgr = MagicMock()
         mock_napps_manager.return_value = mgr
 
-        self.napps_api.prepare(None)
+        self.napps_api.prepare({'--incremental': True})
+
+        mgr.prepare.assert_called_with(incremental=True)
 
-        mgr.prepare.assert_called()
+    @patch('kytos.cli.commands.napps.api.LOG')
+    @patch('kytos.cli.commands.napps.api.print_plan')
+    @patch('kytos.cli.commands.napps.api.apply_plan')
+    @patch('kytos.cli.commands.napps.api.fetch_plan')
+    @patch('kytos.cli.commands.napps.api.read_state')
+    def test_apply(self, *args):
+        """Test apply method."""
+        (mock_read_state, mock_fetch_plan, mock_apply_plan, mock_print_plan,
+         mock_logger) = args
+        mock_read_state.return_value = ({}, True)
+        plan = Plan([], [], [('kytos', 'one'), ('kytos', 'two')],
+                    [('kytos', 'one')], {})
+        mock_fetch_plan.return_value = plan
+        mock_apply_plan.return_value = {('kytos', 'one'): None,
+                                        ('kytos', 'two'): ValueError()}
+
+        self.napps_api.apply({'<file>': 'napps.yml', '--dry-run': True})
+        mock_apply_plan.assert_not_called()
+
+        self.napps_api.apply({'<file>': 'napps.yml', '--dry-run': False})
+        mock_read_state.assert_called_with('napps.yml')
+        mock_fetch_plan.assert_called_with({}, True)
+        mock_print_plan.assert_called_with(plan)
+        mock_apply_plan.assert_called_with(plan)
+        mock_logger.error.assert_called_with('%d of %d NApps failed.', 1, 2)
 
     @patch('kytos.cli.commands.napps.api.NAppsManager')
     def test_reload__all(self, mock_napps_manager):
@@ -346,3 +543,52 @@ class TestNAppsAPI(unittest.TestCase):
         self.napps_api.reload(args)
 
         self.assertEqual(mock_logger.error.call_count, 1)
+
+    @patch('kytos.cli.commands.napps.api.NAppsWatcher')
+    def test_watch(self, mock_watcher):
+        """Test watch method."""
+        watcher = MagicMock()
+        watcher.napps = {'path': ('kytos', 'of_core')}
+        mock_watcher.return_value = watcher
+
+        args = {'<path>': None, '--debounce': '0.2'}
+        self.napps_api.watch(args)
+
+        mock_watcher.assert_called_with('.', 0.2)
+        watcher.watch.assert_called_with(self.napps_api.reload_changed)
+
+    def test_watch__invalid_debounce(self):
+        """Test watch method with an invalid debounce value."""
+        args = {'<path>': None, '--debounce': 'abc'}
+        with self.assertRaises(KytosException):
+            self.napps_api.watch(args)
+
+    @patch('kytos.cli.commands.napps.api.LOG')
+    @patch('kytos.cli.commands.napps.api.NAppsManager')
+    def test_reload_changed(self, *args):
+        """Test reload_changed method reloading one NApp at a time."""
+        (mock_napps_manager, mock_logger) = args
+        mgr = MagicMock()
+        mgr.reload.side_effect = [None, KytosException('error')]
+        mock_napps_manager.return_value = mgr
+
+        napps = [('kytos', 'of_core'), ('kytos', 'of_lldp')]
+        self.napps_api.reload_changed(napps)
+
+        mgr.reload.assert_has_calls([call([napps[0]]), call([napps[1]])])
+        self.assertEqual(mock_logger.error.call_count, 1)
+
+    @patch('kytos.cli.commands.napps.api.LOG')
+    @patch('kytos.utils.config.create_skel_dir')
+    def test_reload_changed__unreachable(self, *args):
+        """Test reload_changed method when kytosd can't be reached."""
+        (_, mock_logger) = args
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            api = 'http://127.0.0.1:{}/'.format(sock.getsockname()[1])
+
+        napps = [('kytos', 'of_core'), ('kytos', 'of_lldp')]
+        with KytosConfig.override('kytos', 'api', api):
+            self.napps_api.reload_changed(napps)
+
+        self.assertEqual(mock_logger.error.call_count, 2)
@@ -3,6 +3,7 @@ import unittest
 from unittest.mock import patch
 
 from kytos.cli.commands.users.api import UsersAPI
+from kytos.utils.exceptions import KytosException
 
 
 class TestUsersAPI(unittest.TestCase):
@@ -18,3 +19,36 @@ class TestUsersAPI(unittest.TestCase):
         self.users_api.register(None)
 
         mock_register.assert_called()
+
+    @patch('kytos.cli.commands.users.api.LOG')
+    @patch('kytos.utils.users.UsersManager.register_users')
+    @patch('kytos.utils.users.UsersManager.read_users')
+    def test_register__from(self, *args):
+        """Test register method with a CSV file."""
+        (mock_read_users, mock_register_users, mock_log) = args
+        mock_read_users.return_value = ['alice', 'bob']
+        mock_register_users.return_value = {'alice': None,
+                                            'bob': KytosException('error')}
+        with self.assertRaises(SystemExit):
+            self.users_api.register({'--from': 'users.csv', '--rate': '2'})
+
+        mock_read_users.assert_called_with('users.csv')
+        mock_register_users.assert_called_with(['alice', 'bob'], rate=2)
+        mock_log.error.assert_called_with('%d of %d users failed.', 1, 2)
+
+    @patch('kytos.utils.users.UsersManager.register_users')
+    @patch('kytos.utils.users.UsersManager.read_users')
+    def test_register__from_all_registered(self, *args):
+        """Test register method with a CSV file of new users."""
+        (mock_read_users, mock_register_users) = args
+        mock_read_users.return_value = ['alice']
+        mock_register_users.return_value = {'alice': None}
+
+        self.users_api.register({'--from': 'users.csv', '--rate': '5'})
+
+        mock_register_users.assert_called_with(['alice'], rate=5)
+
+    def test_register__invalid_rate(self):
+        """Test register method with an invalid rate."""
+        with self.assertRaises(KytosException):
+            self.users_api.register({'--from': 'users.csv', '--rate': 'x'})
@@ -40,6 +40,20 @@ class TestWebParser(unittest.TestCase):
     def test_call(*args):
         """Test call method."""
         (_, mock_web_api) = args
-        call('update', 'args')
+        call_args = {'<version>': None}
+        call('update', call_args)
 
-        mock_web_api.assert_called_with('args')
+        mock_web_api.assert_called_with(call_args)
+
+    @staticmethod
+    @patch('kytos.cli.commands.web.parser.run_on_controllers',
+           return_value=True)
+    @patch('kytos.cli.commands.web.api.WebAPI.update')
+    def test_call__controllers(*args):
+        """Test call method with --controllers."""
+        (mock_web_api, mock_run) = args
+        call_args = {'<version>': None, '--controllers': 'core'}
+        call('update', call_args)
+
+        mock_run.assert_called_once()
+        mock_web_api.assert_not_called()
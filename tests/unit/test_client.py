@@ -1,10 +1,14 @@
 """kytos.utils.client tests."""
+import io
 import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 
+import requests
+
 from kytos.utils.client import CommonClient, NAppsClient, UsersClient
 from kytos.utils.config import KytosConfig
+from kytos.utils.exceptions import KytosException
 
 
 class TestCommonClient(unittest.TestCase):
@@ -115,6 +119,31 @@ class TestNAppsClient(unittest.TestCase):
         mock_post.assert_called_with('value/napps/', data=metadata,
                                      files={'file': 'package'})
 
+    @patch('requests.post')
+    @patch('requests.get')
+    @patch('configparser.ConfigParser.set')
+    @patch('configparser.ConfigParser.get', return_value='value')
+    @patch('configparser.ConfigParser.has_option', return_value=False)
+    @patch('kytos.utils.decorators.getpass', return_value='password')
+    @patch('builtins.input', return_value='username')
+    def test_upload_napp__token_refused(self, *args):
+        """Test upload_napp method sends the whole package again on 401."""
+        (_, _, _, _, _, mock_get, mock_post) = args
+        mock_get.return_value = self._expected_response(201)
+        sent = []
+
+        def post(endpoint, data, files):  # pylint: disable=unused-argument
+            sent.append(files['file'].read())
+            response = requests.Response()
+            response.status_code = 401 if len(sent) == 1 else 201
+            return response
+        mock_post.side_effect = post
+
+        package = io.BytesIO(b'napp package')
+        self.napps_client.upload_napp(MagicMock(), package)
+
+        self.assertEqual(sent, [b'napp package', b'napp package'])
+
     @patch('requests.delete')
     @patch('requests.get')
     @patch('configparser.ConfigParser.set')
@@ -155,3 +184,20 @@ class TestUsersClient(unittest.TestCase):
         self.users_client.register(user_dict)
 
         mock_request.assert_called_with('endpoint/users/', json=user_dict)
+
+    @patch('requests.post')
+    def test_register_user(self, mock_request):
+        """Test register_user method."""
+        mock_request.return_value = MagicMock(status_code=201)
+        self.users_client.register_user({'username': 'user'})
+
+        mock_request.assert_called_with('endpoint/users/',
+                                        json={'username': 'user'})
+
+    @patch('requests.post')
+    def test_register_user__error(self, mock_request):
+        """Test register_user method to error case."""
+        mock_request.return_value = MagicMock(status_code=400,
+                                              content=b'Existing username.')
+        with self.assertRaises(KytosException):
+            self.users_client.register_user({'username': 'user'})
@@ -0,0 +1,89 @@
+"""kytos.utils.completion tests."""
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from kytos.cli.commands.napps import parser as napps_parser
+from kytos.utils.completion import (CompletionIndex, get_subcommands,
+                                    render_script)
+from kytos.utils.exceptions import KytosException
+
+
+class TestCompletionScripts(unittest.TestCase):
+    """Test the completion script generation."""
+
+    def test_get_subcommands(self):
+        """Test get_subcommands function."""
+        subcommands = get_subcommands('napps', napps_parser)
+
+        self.assertIn('install', subcommands)
+        self.assertIn('watch', subcommands)
+        self.assertEqual(len(subcommands), len(set(subcommands)))
+
+    def test_render_script(self):
+        """Test render_script function for both shells."""
+        bash = render_script('bash')
+        zsh = render_script('zsh')
+
+        self.assertIn('complete -F _kytos kytos', bash)
+        self.assertIn('"napps install")', bash)
+        self.assertIn('bashcompinit', zsh)
+        self.assertIn('complete -F _kytos kytos', zsh)
+
+
+class TestCompletionIndex(unittest.TestCase):
+    """Test the class CompletionIndex."""
+
+    def setUp(self):
+        """Use a temporary directory as index."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.index = CompletionIndex(self.tmp_dir.name)
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp_dir.cleanup()
+
+    @patch('kytos.utils.completion.NAppsManager')
+    @patch('kytos.utils.completion.NAppsClient')
+    def test_refresh(self, *args):
+        """Test refresh method writing all index files."""
+        (mock_client, mock_manager) = args
+        mock_client.return_value.get_napps.return_value = [
+            {'username': 'kytos', 'name': 'of_core', 'version': '1.0'},
+            {'author': 'kytos', 'name': 'of_lldp'}]
+        mgr = MagicMock()
+        mgr.get_installed.return_value = [('kytos', 'of_core'),
+                                          ('kytos', 'of_lldp')]
+        mgr.get_enabled.return_value = [('kytos', 'of_core')]
+        mock_manager.return_value = mgr
+
+        self.index.refresh()
+
+        self.assertEqual(self.index.read('catalog'),
+                         ['kytos/of_core', 'kytos/of_core:1.0',
+                          'kytos/of_lldp'])
+        self.assertEqual(self.index.read('enabled'), ['kytos/of_core'])
+        self.assertEqual(self.index.read('disabled'), ['kytos/of_lldp'])
+
+    @patch('kytos.utils.completion.NAppsManager')
+    @patch('kytos.utils.completion.NAppsClient')
+    def test_refresh__unreachable(self, *args):
+        """Test refresh method keeping old files when servers are down."""
+        (mock_client, mock_manager) = args
+        mock_client.return_value.get_napps.side_effect = SystemExit(1)
+        mock_manager.return_value.get_installed.side_effect = KytosException
+        self.index.path.joinpath('catalog').write_text('kytos/of_core\n')
+
+        self.index.refresh()
+
+        self.assertEqual(self.index.read('catalog'), ['kytos/of_core'])
+        self.assertEqual(self.index.read('installed'), [])
+
+    @patch('kytos.utils.completion.NAppsClient')
+    def test_refresh__locked(self, mock_client):
+        """Test refresh method while another refresh is running."""
+        self.index.path.joinpath('refresh.lock').touch()
+
+        self.index.refresh()
+
+        mock_client.assert_not_called()
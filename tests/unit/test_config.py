@@ -31,6 +31,18 @@ class TestKytosConfig(unittest.TestCase):
         has_token = config.has_option('auth', 'token')
         self.assertTrue(has_token)
 
+    def test_save_token__expires(self):
+        """Test save_token method with the token expiry."""
+        self.kytos_config.save_token('user', 'token', 1700000000.5)
+
+        config = KytosConfig(self.config_file).config
+        self.assertEqual(config.get('auth', 'token_expires'), '1700000000')
+
+        self.kytos_config.clear_token()
+
+        config = KytosConfig(self.config_file).config
+        self.assertFalse(config.has_option('auth', 'token_expires'))
+
     @patch('builtins.open')
     @patch('kytos.utils.config.urlopen')
     @patch('kytos.utils.config.logging.RootLogger.warning')
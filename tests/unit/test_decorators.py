@@ -1,9 +1,16 @@
 """kytos.utils.decorators tests."""
+import os
+import tempfile
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
+import requests
+
 from kytos.utils.config import KytosConfig
-from kytos.utils.decorators import kytos_auth
+from kytos.utils.decorators import MAX_ATTEMPTS, REFRESH_MARGIN, kytos_auth
+from kytos.utils.exceptions import KytosException
 
 
 class TestKytosAuth(unittest.TestCase):
@@ -52,18 +59,119 @@ class TestKytosAuth(unittest.TestCase):
 
         This test check the fail and success cases. At the first, the 401
         status code will cause a fail and after that the 201 status code will
-        test the success case. The authenticate has to be called twice, once
-        the test `test_authenticate_success_and_fail` calls `authenticate`
-        the first time, and the fail case will cause the second call."""
-        (_, _, _, mock_requests_get) = args
+        test the success case. The password is asked again, without
+        recursion."""
+        (_, _, mock_save_token, mock_requests_get) = args
         mock_requests_get.side_effect = [self._expected_response(401),
                                          self._expected_response(201)]
 
-        authenticate = self.kytos_auth.authenticate
-        self.kytos_auth.authenticate = MagicMock(side_effect=authenticate)
+        token = self.kytos_auth.authenticate()
+
+        self.assertEqual(token, 'hash')
+        self.assertEqual(mock_requests_get.call_count, 2)
+        self.assertEqual(mock_save_token.call_args[0][:2],
+                         ('username', 'hash'))
+
+    @patch('requests.get')
+    @patch('kytos.utils.config.KytosConfig.save_token')
+    @patch('builtins.input', return_value='username')
+    @patch('kytos.utils.decorators.getpass', return_value='password')
+    def test_authenticate__attempts(self, *args):
+        """Test authenticate method gives up after MAX_ATTEMPTS."""
+        (_, _, mock_save_token, mock_requests_get) = args
+        mock_requests_get.return_value = self._expected_response(401)
+
+        with self.assertRaises(KytosException):
+            self.kytos_auth.authenticate()
+
+        self.assertEqual(mock_requests_get.call_count, MAX_ATTEMPTS)
+        mock_save_token.assert_not_called()
+
+
+class TestTokenCache(unittest.TestCase):
+    """Test the token cache of the decorator kytos_auth."""
+
+    def setUp(self):
+        """Use a config file of its own."""
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.config_file = os.path.join(tmp_dir.name, '.kytosrc')
+        self.kytos_auth = kytos_auth(MagicMock())
+        self.kytos_auth.config_file = self.config_file
+        self.kytos_auth.config = KytosConfig(self.config_file).config
+        self.kytos_auth.config.set('auth', 'user', 'username')
+
+    def save_token(self, token, expires_in):
+        """Save a token expiring in ``expires_in`` seconds."""
+        KytosConfig(self.config_file).save_token('username', token,
+                                                 time.time() + expires_in)
+
+    @patch('kytos.utils.decorators.kytos_auth.authenticate')
+    def test_get_token(self, mock_authenticate):
+        """Test get_token method with a valid token."""
+        self.save_token('saved', 3600)
+
+        self.assertEqual(self.kytos_auth.get_token(), 'saved')
+        mock_authenticate.assert_not_called()
+
+    @patch('kytos.utils.decorators.kytos_auth.authenticate',
+           return_value='new')
+    def test_get_token__expiring(self, mock_authenticate):
+        """Test get_token method renews a token about to expire."""
+        self.save_token('saved', REFRESH_MARGIN / 2)
+
+        self.assertEqual(self.kytos_auth.get_token(), 'new')
+        mock_authenticate.assert_called_once()
+
+    @patch('kytos.utils.decorators.kytos_auth.authenticate',
+           return_value='new')
+    def test_get_token__refused(self, mock_authenticate):
+        """Test get_token method doesn't return a refused token."""
+        self.save_token('saved', 3600)
+
+        self.assertEqual(self.kytos_auth.get_token(refused='saved'), 'new')
+        mock_authenticate.assert_called_once()
+
+    def test_get_token__threads(self):
+        """Test get_token method authenticates once for many threads."""
+        def authenticate():
+            time.sleep(0.05)
+            self.save_token('new', 3600)
+            return 'new'
+
+        with patch('kytos.utils.decorators.kytos_auth.authenticate',
+                   side_effect=authenticate) as mock_authenticate, \
+                ThreadPoolExecutor(max_workers=8) as executor:
+            tokens = list(executor.map(lambda _: self.kytos_auth.get_token(),
+                                       range(8)))
+
+        self.assertEqual(tokens, ['new'] * 8)
+        mock_authenticate.assert_called_once()
+
+    def test_call__refused(self):
+        """Test call method retries once with a new token on HTTP 401."""
+        refused = requests.HTTPError(response=MagicMock(status_code=401))
+        self.kytos_auth.func = MagicMock(side_effect=[refused, 'result'])
+        obj = MagicMock()
+        self.save_token('saved', 3600)
+
+        with patch('kytos.utils.decorators.kytos_auth.authenticate',
+                   return_value='new'):
+            result = self.kytos_auth.call(obj)
+
+        self.assertEqual(result, 'result')
+        self.assertEqual(self.kytos_auth.func.call_count, 2)
+        obj._config.set.assert_called_with('auth', 'token', 'new')
 
-        self.kytos_auth.authenticate()
+    def test_call__refused_twice(self):
+        """Test call method doesn't retry more than once."""
+        refused = requests.HTTPError(response=MagicMock(status_code=401))
+        self.kytos_auth.func = MagicMock(side_effect=refused)
+        self.save_token('saved', 3600)
 
-        call_count = self.kytos_auth.authenticate.call_count
+        with patch('kytos.utils.decorators.kytos_auth.authenticate',
+                   return_value='new'), \
+                self.assertRaises(requests.HTTPError):
+            self.kytos_auth.call(MagicMock())
 
-        self.assertEqual(call_count, 2)
+        self.assertEqual(self.kytos_auth.func.call_count, 2)
@@ -0,0 +1,101 @@
+"""kytos.utils.dependencies tests."""
+import threading
+import time
+import unittest
+
+from kytos.utils.dependencies import catalog_graph, closure, discover, levels
+from kytos.utils.exceptions import KytosException
+
+GRAPH = {('kytos', 'of_core'): [],
+         ('kytos', 'of_lldp'): [('kytos', 'of_core')],
+         ('kytos', 'topology'): [('kytos', 'of_core'), ('kytos', 'of_lldp')],
+         ('kytos', 'pathfinder'): [('kytos', 'topology')],
+         ('kytos', 'storehouse'): []}
+
+
+class TestDependencies(unittest.TestCase):
+    """Test the dependency graph functions."""
+
+    def test_catalog_graph(self):
+        """Test catalog_graph function."""
+        catalog = [{'username': 'kytos', 'name': 'of_lldp',
+                    'napp_dependencies': ['kytos/of_core']},
+                   {'author': 'kytos', 'name': 'of_core',
+                    'napp_dependencies': None}]
+
+        self.assertEqual(catalog_graph(catalog),
+                         {('kytos', 'of_lldp'): [('kytos', 'of_core')],
+                          ('kytos', 'of_core'): []})
+
+    def test_closure(self):
+        """Test closure function including transitive dependencies."""
+        napps = closure([('kytos', 'pathfinder'), ('other', 'napp')], GRAPH)
+
+        self.assertEqual(napps, {('kytos', 'pathfinder'),
+                                 ('kytos', 'topology'), ('kytos', 'of_lldp'),
+                                 ('kytos', 'of_core'), ('other', 'napp')})
+
+    def test_discover(self):
+        """Test discover function requesting independent NApps together."""
+        active, most_active = set(), []
+        lock = threading.Lock()
+
+        def fetch(username, name):
+            with lock:
+                active.add((username, name))
+                most_active.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.discard((username, name))
+            if (username, name) not in GRAPH:
+                return None
+            return {'napp_dependencies': ['/'.join(dep)
+                                          for dep in GRAPH[(username, name)]]}
+
+        graph = discover([('kytos', 'pathfinder'), ('kytos', 'storehouse'),
+                          ('other', 'napp')], fetch)
+
+        self.assertEqual(graph, GRAPH)
+        self.assertGreater(max(most_active), 1)
+
+    def test_discover__errors(self):
+        """Test discover function leaving out NApps it can't request."""
+        def fetch(username, name):
+            if name == 'topology':
+                raise SystemExit(1)
+            if name == 'of_lldp':
+                raise KytosException('NApps server error')
+            return {'napp_dependencies': ['/'.join(dep)
+                                          for dep in GRAPH[(username, name)]]}
+
+        graph = discover([('kytos', 'pathfinder'), ('kytos', 'of_lldp'),
+                          ('kytos', 'storehouse')], fetch)
+
+        self.assertEqual(graph, {
+            ('kytos', 'pathfinder'): [('kytos', 'topology')],
+            ('kytos', 'storehouse'): []})
+
+    def test_levels(self):
+        """Test levels function ordering dependencies first."""
+        result = levels(GRAPH, GRAPH)
+
+        self.assertEqual(result, [[('kytos', 'of_core'),
+                                   ('kytos', 'storehouse')],
+                                  [('kytos', 'of_lldp')],
+                                  [('kytos', 'topology')],
+                                  [('kytos', 'pathfinder')]])
+
+    def test_levels__subset(self):
+        """Test levels function ignoring dependencies not given."""
+        result = levels([('kytos', 'pathfinder'), ('kytos', 'of_lldp')],
+                        GRAPH)
+
+        self.assertEqual(result, [[('kytos', 'of_lldp'),
+                                   ('kytos', 'pathfinder')]])
+
+    def test_levels__cycle(self):
+        """Test levels function with a dependency cycle."""
+        graph = {('a', 'aaa'): [('b', 'bbb')], ('b', 'bbb'): [('a', 'aaa')]}
+
+        with self.assertRaises(KytosException):
+            levels(graph, graph)
@@ -0,0 +1,154 @@
+"""kytos.utils.diagnostics tests."""
+import socket
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from kytos.utils.diagnostics import (KYTOSD_ENDPOINTS, probe, probe_kytosd,
+                                     time_connection, time_download,
+                                     time_package_build)
+from kytos.utils.standin import StandInServer
+
+
+class TestDiagnostics(unittest.TestCase):
+    """Test the latency probes against a stand-in kytosd."""
+
+    def setUp(self):
+        """Start a stand-in server."""
+        self.server = StandInServer(napps=3).start()
+
+    def tearDown(self):
+        """Stop the stand-in server."""
+        self.server.stop()
+
+    def test_probe_kytosd(self):
+        """Test probe_kytosd function."""
+        probes = probe_kytosd(self.server.url, samples=2)
+
+        self.assertEqual([result['url'] for result in probes],
+                         [self.server.url + endpoint
+                          for endpoint in KYTOSD_ENDPOINTS])
+        for result in probes:
+            self.assertEqual(result['status'], 200)
+            self.assertEqual(len(result['seconds']), 2)
+            self.assertIsNotNone(result['median'])
+            self.assertIsNone(result['error'])
+
+    def test_probe__http_error(self):
+        """Test probe function keeping the status of HTTP errors."""
+        result = probe(self.server.url + 'api/kytos/core/nothing', samples=1)
+
+        self.assertEqual(result['status'], 404)
+        self.assertEqual(len(result['seconds']), 1)
+
+    def test_probe__unreachable(self):
+        """Test probe function when nothing listens to the port."""
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            url = 'http://127.0.0.1:{}/'.format(sock.getsockname()[1])
+
+        result = probe(url, samples=3, timeout=0.5)
+
+        self.assertIsNotNone(result['error'])
+        self.assertEqual(result['seconds'], [])
+        self.assertIsNone(result['median'])
+
+    def test_probe__deadline(self):
+        """Test probe function stops at the deadline."""
+        result = probe(self.server.url, samples=3,
+                       deadline=time.monotonic())
+
+        self.assertEqual(result['error'], 'timed out')
+        self.assertEqual(result['seconds'], [])
+
+    def test_probe_kytosd__total(self):
+        """Test probe_kytosd function gives up probes after total seconds."""
+        with socket.socket() as sock:
+            # Connections are accepted by the kernel but never answered.
+            sock.bind(('127.0.0.1', 0))
+            sock.listen(8)
+            url = 'http://127.0.0.1:{}/'.format(sock.getsockname()[1])
+
+            start = time.monotonic()
+            probes = probe_kytosd(url, samples=3, timeout=5, total=0.3)
+
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertEqual(len(probes), len(KYTOSD_ENDPOINTS))
+        for result in probes:
+            self.assertIsNotNone(result['error'])
+            self.assertEqual(result['seconds'], [])
+
+    def test_time_connection(self):
+        """Test time_connection function with plain HTTP."""
+        result = time_connection(self.server.url + 'api/napps/')
+
+        self.assertIsNone(result['error'])
+        self.assertIsNone(result['tls'])
+        for phase in ('dns', 'tcp', 'first_byte'):
+            self.assertGreaterEqual(result[phase], 0)
+
+    def test_time_connection__refused(self):
+        """Test time_connection function when the connection is refused."""
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            url = 'http://127.0.0.1:{}/'.format(sock.getsockname()[1])
+
+        result = time_connection(url, timeout=0.5)
+
+        self.assertIsNotNone(result['dns'])
+        self.assertIsNone(result['tcp'])
+        self.assertIsNotNone(result['error'])
+
+    def test_time_connection__kept_open(self):
+        """Test time_connection function when the answer never ends."""
+        server = socket.socket()
+        self.addCleanup(server.close)
+        server.bind(('127.0.0.1', 0))
+        server.listen(1)
+
+        def answer():
+            conn, _ = server.accept()
+            conn.recv(1024)
+            conn.sendall(b'HTTP/1.1 200 OK\r\n')
+            time.sleep(1)
+            conn.close()
+        threading.Thread(target=answer, daemon=True).start()
+
+        result = time_connection('http://127.0.0.1:{}/'.format(
+            server.getsockname()[1]), timeout=0.2)
+
+        self.assertIsNone(result['error'])
+        self.assertIsNotNone(result['first_byte'])
+
+    @patch('kytos.utils.diagnostics.socket.getaddrinfo')
+    def test_time_connection__slow_dns(self, mock_getaddrinfo):
+        """Test time_connection function gives up slow name resolutions."""
+        def getaddrinfo(*args, **kwargs):  # pylint: disable=unused-argument
+            time.sleep(1)
+            return [(socket.AF_INET, socket.SOCK_STREAM, 6, '',
+                     ('127.0.0.1', 80))]
+        mock_getaddrinfo.side_effect = getaddrinfo
+
+        start = time.monotonic()
+        result = time_connection('http://kytos.invalid/', timeout=0.2)
+
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertIsNone(result['dns'])
+        self.assertIn('timed out', result['error'])
+
+    def test_time_download(self):
+        """Test time_download function."""
+        result = time_download(self.server.url + 'api/napps/')
+
+        self.assertIsNone(result['error'])
+        self.assertGreater(result['bytes'], 0)
+        self.assertGreater(result['throughput'], 0)
+
+    def test_time_package_build(self):
+        """Test time_package_build function."""
+        result = time_package_build(files=5, file_size=100)
+
+        self.assertEqual(result['bytes'], 500)
+        self.assertGreater(result['compressed'], 0)
+        self.assertGreater(result['seconds'], 0)
@@ -0,0 +1,96 @@
+"""kytos.utils.fanout tests."""
+import logging
+import sys
+import tempfile
+import unittest
+from configparser import ConfigParser
+from unittest.mock import patch
+
+from kytos.utils.config import KytosConfig
+from kytos.utils.exceptions import KytosException
+from kytos.utils.fanout import fan_out, print_results, select_controllers
+
+LOG = logging.getLogger(__name__)
+
+CONFIG = '''
+[controllers]
+core1 = http://core1:8181/
+core2 = http://core2:8181/
+edge1 = http://edge1:8181/
+
+[controller_groups]
+core = core1, core2
+'''
+
+
+class TestFanOut(unittest.TestCase):
+    """Test running commands on several controllers."""
+
+    def setUp(self):
+        """Read the controllers configuration."""
+        self.config = ConfigParser()
+        self.config.read_string(CONFIG)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.config_file = self.tmp_dir.name + '/.kytosrc'
+        open(self.config_file, 'w').close()
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp_dir.cleanup()
+
+    def test_select_controllers(self):
+        """Test select_controllers function with groups and names."""
+        selected = select_controllers('core, edge1,core1', self.config)
+
+        self.assertEqual(selected, {'core1': 'http://core1:8181/',
+                                    'core2': 'http://core2:8181/',
+                                    'edge1': 'http://edge1:8181/'})
+        self.assertEqual(list(select_controllers('all', self.config)),
+                         ['core1', 'core2', 'edge1'])
+
+    def test_select_controllers__unknown(self):
+        """Test select_controllers function with an unknown name."""
+        with self.assertRaises(KytosException):
+            select_controllers('core,nope', self.config)
+
+    @patch('kytos.utils.config.create_skel_dir')
+    def test_fan_out(self, _):
+        """Test fan_out function capturing each controller separately."""
+        def command(suffix):
+            api = KytosConfig(self.config_file).config.get('kytos', 'api')
+            print(api + suffix)
+            if 'core2' in api:
+                LOG.error('Failed in %s', api)
+            if 'edge1' in api:
+                raise ValueError('unexpected')
+
+        controllers = select_controllers('all', self.config)
+        stdout = sys.stdout
+
+        results = fan_out(controllers, command, 'x', max_workers=3)
+
+        self.assertIs(sys.stdout, stdout)
+        for result in results:
+            self.assertEqual(result.output.count('8181/x'), 1)
+            self.assertIn(result.url + 'x\n', result.output)
+        self.assertEqual([result.ok for result in results],
+                         [True, False, False])
+        self.assertEqual(results[2].error, "ValueError('unexpected')")
+        # The override is not saved nor kept after fan_out.
+        self.assertEqual(
+            KytosConfig(self.config_file).config.get('kytos', 'api'),
+            'http://localhost:8181/')
+
+    @patch('builtins.print')
+    @patch('kytos.utils.config.create_skel_dir')
+    def test_print_results(self, *args):
+        """Test print_results function."""
+        (_, mock_print) = args
+        results = fan_out({'core1': 'http://core1:8181/'}, print, 'done')
+
+        print_results(results)
+
+        printed = [str(call_args[0][0]) if call_args[0] else ''
+                   for call_args in mock_print.call_args_list]
+        self.assertIn('## core1 (http://core1:8181/)', printed)
+        self.assertIn('1 succeeded, 0 failed.', printed)
@@ -0,0 +1,121 @@
+"""kytos.utils.helper and kytos.utils.helper_server tests."""
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from kytos.utils.helper import forward, is_eligible, send, socket_path
+from kytos.utils.helper_server import HelperServer, run_command
+
+
+class TestHelperClient(unittest.TestCase):
+    """Test the client side of the helper."""
+
+    @patch.dict(os.environ, {'KYTOS_HELPER_SOCKET': '/tmp/any.sock'})
+    def test_socket_path(self):
+        """Test socket_path function with an environment variable."""
+        self.assertEqual(socket_path(), '/tmp/any.sock')
+
+    @patch.dict(os.environ, {}, clear=True)
+    def test_is_eligible(self):
+        """Test is_eligible function."""
+        self.assertTrue(is_eligible(['napps', 'list']))
+        self.assertTrue(is_eligible(['web', 'update', '1.0']))
+        self.assertFalse(is_eligible(['napps', 'create']))
+        self.assertFalse(is_eligible(['napps', 'list', '--help']))
+        self.assertFalse(is_eligible(['napps']))
+
+    @patch.dict(os.environ, {'KYTOS_HELPER_SOCKET': '/tmp/none/x.sock'})
+    def test_forward__not_running(self):
+        """Test forward function without a running helper."""
+        self.assertIsNone(forward(['napps', 'list']))
+
+    @patch('kytos.utils.helper.send', return_value={'stdout': '',
+                                                    'status': 0})
+    @patch('os.path.exists', return_value=True)
+    @patch.dict(os.environ, {}, clear=True)
+    def test_forward(self, *args):
+        """Test forward function sends the client state."""
+        (_, mock_send) = args
+        with patch('shutil.get_terminal_size',
+                   return_value=os.terminal_size((90, 30))):
+            self.assertEqual(forward(['napps', 'list']), 0)
+
+        request = mock_send.call_args[0][0]
+        self.assertEqual(request['argv'], ['napps', 'list'])
+        self.assertEqual(request['cwd'], os.getcwd())
+        self.assertEqual(request['env']['COLUMNS'], '90')
+
+
+class TestHelperServer(unittest.TestCase):
+    """Test the server side of the helper."""
+
+    def test_run_command(self):
+        """Test run_command function capturing output and exit status."""
+        def parse(_):
+            print('output')
+            raise SystemExit(3)
+        parser = MagicMock()
+        parser.parse.side_effect = parse
+
+        with patch.dict('kytos.utils.helper_server.PARSERS',
+                        {'napps': parser}):
+            answer = run_command(['napps', 'list'])
+
+        self.assertEqual(answer, {'stdout': 'output\n', 'stderr': '',
+                                  'status': 3})
+
+    def test_run_command__client_state(self):
+        """Test run_command function uses the client cwd and environment."""
+        seen = {}
+
+        def parse(_):
+            seen.update(cwd=os.getcwd(),
+                        columns=shutil.get_terminal_size().columns)
+        parser = MagicMock()
+        parser.parse.side_effect = parse
+        cwd, environ = os.getcwd(), dict(os.environ)
+
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+                patch.dict('kytos.utils.helper_server.PARSERS',
+                           {'napps': parser}):
+            answer = run_command(['napps', 'list'], tmp_dir,
+                                 {'COLUMNS': '123', 'LINES': '40'})
+            self.assertEqual(seen['cwd'], os.path.realpath(tmp_dir))
+
+        self.assertEqual(answer['status'], 0)
+        self.assertEqual(seen['columns'], 123)
+        self.assertEqual(os.getcwd(), cwd)
+        self.assertEqual(dict(os.environ), environ)
+
+    def test_run_command__not_supported(self):
+        """Test run_command function with an interactive command."""
+        answer = run_command(['napps', 'create'])
+
+        self.assertEqual(answer['status'], 2)
+
+    @patch('kytos.utils.helper_server.run_command')
+    @patch('kytos.utils.helper_server.HelperServer.warm_up')
+    def test_serve(self, *args):
+        """Test a request, a status query and stop through the socket."""
+        (_, mock_run_command) = args
+        mock_run_command.return_value = {'stdout': 'ok', 'status': 0}
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'helper.sock')
+            server = HelperServer(path, idle_timeout=5)
+            thread = threading.Thread(target=server.serve)
+            thread.start()
+
+            answer = send({'argv': ['napps', 'list']}, path, timeout=5)
+            status = send({'command': 'status'}, path, timeout=5)
+            send({'command': 'stop'}, path, timeout=5)
+            thread.join(5)
+
+            self.assertEqual(answer, {'stdout': 'ok', 'status': 0})
+            self.assertEqual(status['requests'], 1)
+            self.assertFalse(os.path.exists(path))
+            mock_run_command.assert_called_with(['napps', 'list'], None,
+                                                None)
@@ -0,0 +1,114 @@
+"""kytos.utils.journal tests."""
+import json
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from configparser import ConfigParser
+from pathlib import Path
+from unittest.mock import patch
+
+from kytos.utils.config import KytosConfig
+from kytos.utils.journal import journaled
+from kytos.utils.napps import NAppsManager
+from kytos.utils.standin import StandInServer
+
+
+class TestJournal(unittest.TestCase):
+    """Test the journal functions."""
+
+    def setUp(self):
+        """Use a journal of its own."""
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.journal = Path(tmp_dir.name, 'logs', 'journal.jsonl')
+        self.config = ConfigParser()
+        self.config.read_dict({'global': {'journal': str(self.journal)}})
+
+    def entries(self):
+        """Return the journal entries."""
+        return [json.loads(line)
+                for line in self.journal.read_text().splitlines()]
+
+    def test_journaled(self):
+        """Test journaled function."""
+        with journaled(self.config, 'enable', 'url', 'kytos/of_core'):
+            pass
+
+        (entry,) = self.entries()
+        self.assertEqual(entry['action'], 'enable')
+        self.assertEqual(entry['napp'], 'kytos/of_core')
+        self.assertEqual(entry['endpoint'], 'url')
+        self.assertEqual(entry['result'], 'ok')
+        self.assertLessEqual(entry['start'], entry['end'])
+        self.assertGreaterEqual(entry['seconds'], 0)
+        self.assertNotIn('error', entry)
+
+    def test_journaled__exception(self):
+        """Test journaled function when the request raises."""
+        with self.assertRaises(ValueError), \
+                journaled(self.config, 'install', 'url', 'kytos/of_core'):
+            raise ValueError('refused')
+
+        (entry,) = self.entries()
+        self.assertEqual(entry['result'], 'error')
+        self.assertEqual(entry['error'], 'refused')
+
+    def test_journaled__status(self):
+        """Test journaled function with an HTTP error status."""
+        with journaled(self.config, 'upload', 'url') as entry:
+            entry['status'] = 401
+
+        (entry,) = self.entries()
+        self.assertEqual(entry['status'], 401)
+        self.assertEqual(entry['result'], 'error')
+        self.assertEqual(entry['error'], 'HTTP 401')
+
+    def test_journaled__disabled(self):
+        """Test journaled function without journal."""
+        self.config.remove_option('global', 'journal')
+
+        with journaled(self.config, 'enable', 'url') as entry:
+            entry['status'] = 200
+
+        self.assertFalse(self.journal.exists())
+
+    @patch('kytos.utils.journal.os.write', side_effect=OSError)
+    def test_journaled__write_error(self, _):
+        """Test journaled function doesn't fail when it can't write."""
+        with journaled(self.config, 'enable', 'url'):
+            pass
+
+    def test_journaled__threads(self):
+        """Test journaled function doesn't mix lines of several threads."""
+        def enable(index):
+            with journaled(self.config, 'enable', 'url', f'user/napp{index}'):
+                pass
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(enable, range(200)))
+
+        napps = {entry['napp'] for entry in self.entries()}
+        self.assertEqual(len(napps), 200)
+
+    @patch('kytos.utils.config.create_skel_dir')
+    def test_napps_manager(self, _):
+        """Test NAppsManager actions are journaled."""
+        server = StandInServer(napps=[{'username': 'kytos',
+                                       'name': 'of_core',
+                                       'version': '1.0'}]).start()
+        self.addCleanup(server.stop)
+
+        with KytosConfig.override('kytos', 'api', server.url), \
+                KytosConfig.override('global', 'journal', str(self.journal)):
+            mgr = NAppsManager()
+            mgr.set_napp('kytos', 'of_core')
+            mgr.remote_install()
+            mgr.enable()
+            mgr.enable()
+
+        entries = self.entries()
+        self.assertEqual([entry['action'] for entry in entries],
+                         ['install', 'enable', 'enable'])
+        self.assertEqual({entry['napp'] for entry in entries},
+                         {'kytos/of_core'})
+        self.assertTrue(entries[1]['endpoint'].startswith(server.url))
@@ -0,0 +1,115 @@
+"""kytos.utils.lock tests."""
+import copy
+import hashlib
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from kytos.utils.config import KytosConfig
+from kytos.utils.exceptions import KytosException
+from kytos.utils.lock import (lock_catalog, lock_desired, make_lock,
+                              package_url, read_lock, verify_lock,
+                              write_lock)
+from kytos.utils.standin import StandInServer, napp_package
+from kytos.utils.state import Desired, apply_plan, fetch_plan
+
+CATALOG = [
+    {'username': 'kytos', 'name': 'of_core', 'version': '2.0',
+     'napp_dependencies': []},
+    {'username': 'kytos', 'name': 'of_lldp', 'version': '2.0',
+     'napp_dependencies': ['kytos/of_core']},
+    {'username': 'kytos', 'name': 'topology', 'version': '1.0',
+     'napp_dependencies': ['kytos/of_lldp']}]
+
+
+class TestLock(unittest.TestCase):
+    """Test writing, reading and installing lockfiles."""
+
+    def setUp(self):
+        """Start a stand-in NApps server and kytosd."""
+        self.server = StandInServer(napps=copy.deepcopy(CATALOG)).start()
+        self.repo = self.server.url + 'repo/'
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Stop the server and remove temporary files."""
+        self.server.stop()
+        self.tmp_dir.cleanup()
+
+    def test_package_url(self):
+        """Test package_url function."""
+        self.assertEqual(package_url('https://napps.kytos.io/repo', 'kytos',
+                                     'of_core', '2.0'),
+                         'https://napps.kytos.io/repo/kytos/of_core-2.0.napp')
+
+    def test_make_lock(self):
+        """Test make_lock function resolving dependencies and digests."""
+        lock = make_lock([('kytos', 'topology', None)], CATALOG, self.repo)
+
+        digest = hashlib.sha256(napp_package(CATALOG[0])).hexdigest()
+        self.assertEqual(lock['lock_version'], 1)
+        self.assertEqual(lock['napps']['kytos/of_core'],
+                         {'version': '2.0', 'sha256': digest,
+                          'napp_dependencies': []})
+        self.assertEqual(lock['napps']['kytos/topology']['napp_dependencies'],
+                         ['kytos/of_lldp'])
+        self.assertEqual(lock['levels'], [['kytos/of_core'],
+                                          ['kytos/of_lldp'],
+                                          ['kytos/topology']])
+        self.assertEqual(self.server.counts['package'], 3)
+
+    def test_make_lock__errors(self):
+        """Test make_lock function with unavailable NApps and versions."""
+        for napp in (('kytos', 'unknown', None), ('kytos', 'of_core', '1.0')):
+            with self.subTest(napp=napp):
+                with self.assertRaises(KytosException):
+                    make_lock([napp], CATALOG, self.repo)
+
+        with self.assertRaisesRegex(KytosException, 'HTTP 404'):
+            make_lock([('kytos', 'of_core', None)], CATALOG,
+                      self.server.url + 'other/')
+
+    def test_write_and_read_lock(self):
+        """Test write_lock and read_lock functions."""
+        lock_file = Path(self.tmp_dir.name, 'napps.lock')
+        lock = make_lock([('kytos', 'of_lldp', '2.0')], CATALOG, self.repo)
+
+        write_lock(lock, lock_file)
+
+        self.assertEqual(read_lock(lock_file), lock)
+        self.assertEqual(lock_desired(lock),
+                         {('kytos', 'of_core'): Desired('2.0', True, True),
+                          ('kytos', 'of_lldp'): Desired('2.0', True, True)})
+        self.assertEqual(lock_catalog(lock), CATALOG[:2])
+
+        lock_file.write_text(json.dumps({'lock_version': 0}))
+        with self.assertRaises(KytosException):
+            read_lock(lock_file)
+
+    def test_verify_lock(self):
+        """Test verify_lock function with a changed package."""
+        lock = make_lock([('kytos', 'of_lldp', None)], CATALOG, self.repo)
+        verify_lock(lock, [('kytos', 'of_core'), ('kytos', 'of_lldp')],
+                    self.repo)
+
+        self.server.catalog['kytos/of_core']['description'] = 'Changed.'
+        with self.assertRaisesRegex(KytosException, 'of_core-2.0.napp'):
+            verify_lock(lock, [('kytos', 'of_core'), ('kytos', 'of_lldp')],
+                        self.repo)
+
+    @patch('kytos.utils.config.create_skel_dir')
+    def test_install_from_lock(self, _):
+        """Test installing a lock without asking for dependencies."""
+        lock = make_lock([('kytos', 'topology', None)], CATALOG, self.repo)
+        self.server.reset_counts()
+
+        with KytosConfig.override('kytos', 'api', self.server.url):
+            plan = fetch_plan(lock_desired(lock), False, lock_catalog(lock))
+            results = apply_plan(plan)
+
+        self.assertFalse(any(results.values()))
+        self.assertEqual(len(self.server.enabled), 3)
+        self.assertEqual(self.server.counts['catalog'], 0)
+        self.assertEqual(self.server.counts['napp_metadata'], 0)
@@ -0,0 +1,86 @@
+"""kytos.utils.mirror tests."""
+import copy
+import tempfile
+import threading
+import unittest
+import urllib.request
+from pathlib import Path
+
+from kytos.utils.lock import make_lock, resolve
+from kytos.utils.mirror import file_digest, make_server, read_sums, sync
+from kytos.utils.standin import StandInServer, napp_package
+
+CATALOG = [
+    {'username': 'kytos', 'name': 'of_core', 'version': '2.0',
+     'napp_dependencies': []},
+    {'username': 'kytos', 'name': 'of_lldp', 'version': '2.0',
+     'napp_dependencies': ['kytos/of_core']}]
+
+
+class TestMirror(unittest.TestCase):
+    """Test syncing and serving NApps repository mirrors."""
+
+    def setUp(self):
+        """Start a stand-in NApps repository."""
+        self.server = StandInServer(napps=copy.deepcopy(CATALOG)).start()
+        self.repo = self.server.url + 'repo/'
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.mirror = Path(self.tmp_dir.name, 'mirror')
+
+    def tearDown(self):
+        """Stop the server and remove the mirror."""
+        self.server.stop()
+        self.tmp_dir.cleanup()
+
+    def test_sync(self):
+        """Test sync function downloading only what changed."""
+        lock = resolve([('kytos', 'of_lldp', None)], CATALOG)
+
+        results = sync(self.mirror, lock, self.repo)
+
+        self.assertEqual([(r.napp_id, r.downloaded, r.error)
+                          for r in results],
+                         [('kytos/of_core', True, None),
+                          ('kytos/of_lldp', True, None)])
+        package = self.mirror / 'kytos' / 'of_core-2.0.napp'
+        self.assertEqual(package.read_bytes(), napp_package(CATALOG[0]))
+        self.assertEqual(
+            (self.mirror / 'kytos' / 'of_core-latest.napp').read_bytes(),
+            package.read_bytes())
+        self.assertEqual(read_sums(self.mirror)['kytos/of_core-2.0.napp'],
+                         file_digest(package))
+        self.assertEqual(self.server.counts['package'], 2)
+
+        # Nothing is downloaded again, unless a file was changed.
+        package.write_bytes(b'corrupted')
+        results = sync(self.mirror, lock, self.repo)
+
+        self.assertEqual([r.downloaded for r in results], [True, False])
+        self.assertEqual(self.server.counts['package'], 3)
+        self.assertEqual(package.read_bytes(), napp_package(CATALOG[0]))
+
+    def test_sync__lock_digests(self):
+        """Test sync function rejecting packages that differ from a lock."""
+        lock = make_lock([('kytos', 'of_core', None)], CATALOG, self.repo)
+        self.server.catalog['kytos/of_core']['description'] = 'Changed.'
+
+        results = sync(self.mirror, lock, self.repo)
+
+        self.assertIn('digest differs', str(results[0].error))
+        self.assertEqual(list(self.mirror.glob('kytos/*')), [])
+        self.assertEqual(read_sums(self.mirror), {})
+
+    def test_make_server(self):
+        """Test make_server function serving the mirror."""
+        sync(self.mirror, resolve([('kytos', 'of_core', None)], CATALOG),
+             self.repo)
+        server = make_server(self.mirror, port=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        url = 'http://127.0.0.1:{}/kytos/of_core-latest.napp'.format(
+            server.server_address[1])
+        with urllib.request.urlopen(url) as response:
+            self.assertEqual(response.read(), napp_package(CATALOG[0]))
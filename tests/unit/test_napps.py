@@ -445,6 +445,19 @@ class TestNapps(unittest.TestCase):
 
         mock_urlopen.assert_called_with(uri)
 
+    @patch('urllib.request.urlopen')
+    def test_napp_action(self, mock_urlopen):
+        """Test napp_action method raising HTTP errors."""
+        self.napps_manager.set_napp('kytos', 'mef_eline')
+        mock_urlopen.side_effect = HTTPError('url', 400, 'msg', None, None)
+
+        with self.assertRaises(HTTPError):
+            self.napps_manager.napp_action('enable')
+
+        uri = self.napps_manager._kytos_api + \
+            self.napps_manager._NAPP_ENABLE.format('kytos', 'mef_eline')
+        mock_urlopen.assert_called_with(uri)
+
     def test_valid_name(self):
         """Test valid_name method."""
         valid_name = self.napps_manager.valid_name('username')
@@ -511,6 +524,73 @@ class TestNapps(unittest.TestCase):
                                       call('username/napp/ui/k-action-menu')])
         mock_render_template.assert_has_calls(calls, any_order=True)
 
+    def test_read_manifest(self):
+        """Test read_manifest method."""
+        with tempfile.NamedTemporaryFile('w', suffix='.yml') as manifest:
+            manifest.write('napps:\n'
+                           '  - {username: kytos, name: one}\n'
+                           '  - username: kytos\n'
+                           '    name: two\n'
+                           '    description: Second NApp.\n'
+                           '    meta: true\n')
+            manifest.flush()
+
+            napps = self.napps_manager.read_manifest(manifest.name)
+
+        self.assertEqual(napps, [('kytos', 'one', None, False),
+                                 ('kytos', 'two', 'Second NApp.', True)])
+
+    def test_read_manifest__invalid(self):
+        """Test read_manifest method with invalid manifests."""
+        contents = ['- {username: kytos, name: one}\n'
+                    '- {username: kytos, name: one}\n',
+                    '- {username: 1x, name: one}\n',
+                    'napps: one\n',
+                    'napps: [\n']
+        for content in contents:
+            with tempfile.NamedTemporaryFile('w') as manifest, \
+                    self.subTest(content=content):
+                manifest.write(content)
+                manifest.flush()
+                with self.assertRaises(KytosException):
+                    self.napps_manager.read_manifest(manifest.name)
+
+        with self.assertRaises(KytosException):
+            self.napps_manager.read_manifest('/nonexistent/napps.yml')
+
+    @patch('kytos.utils.napps.NAppsManager._create_user_package')
+    @patch('kytos.utils.napps.NAppsManager.create_napp_tree')
+    def test_create_napps(self, *args):
+        """Test create_napps method reporting each NApp."""
+        (mock_create_napp_tree, mock_create_user_package) = args
+        error = FileExistsError('kytos/two')
+        mock_create_napp_tree.side_effect = [None, error]
+        napps = [('kytos', 'one', None, False), ('kytos', 'two', None, True)]
+
+        results = self.napps_manager.create_napps(napps, max_workers=1)
+
+        self.assertEqual(results, {'kytos/one': None, 'kytos/two': error})
+        mock_create_user_package.assert_called_once_with('kytos')
+        mock_create_napp_tree.assert_has_calls([
+            call(*napp, user_package=False) for napp in napps])
+
+    @patch('kytos.utils.napps.NAppsManager._create_user_package')
+    @patch('kytos.utils.napps.NAppsManager.create_napp_tree')
+    def test_create_napps__user_error(self, *args):
+        """Test create_napps method when a user package can't be created."""
+        (mock_create_napp_tree, mock_create_user_package) = args
+        error = PermissionError('other')
+        mock_create_user_package.side_effect = [None, error]
+        napps = [('kytos', 'one', None, False), ('other', 'two', None, False),
+                 ('other', 'three', None, False)]
+
+        results = self.napps_manager.create_napps(napps)
+
+        self.assertEqual(results, {'kytos/one': None, 'other/two': error,
+                                   'other/three': error})
+        mock_create_napp_tree.assert_called_once_with(*napps[0],
+                                                      user_package=False)
+
     def test_check_module(self):
         """Test _check_module method."""
         folder = MagicMock()
@@ -544,12 +624,11 @@ class TestNapps(unittest.TestCase):
                      call(PurePosixPath('username/napp/B'))]
             mock_add.assert_has_calls(calls)
 
-    @patch('ruamel.yaml.YAML.load', return_value='openapi')
-    @patch('pathlib.Path.open')
+    @patch('kytos.utils.napps.compile_spec', return_value='"openapi"')
     @patch('builtins.open')
     def test_create_metadata(self, *args):
         """Test create_metadata method."""
-        (mock_open, _, _) = args
+        (mock_open, _) = args
         enter_file_1 = MagicMock()
         enter_file_1.read.return_value = '{}'
 
@@ -609,6 +688,21 @@ class TestNapps(unittest.TestCase):
         mock_openapi.assert_called_with(napp_path, tpl_path)
         mock_openapi.return_value.render_template.assert_called()
 
+    @patch('kytos.utils.napps.OpenAPI')
+    @patch('kytos.utils.napps.NAppsManager._ask_openapi')
+    def test_prepare__incremental(self, *args):
+        """Test prepare method updating openapi.yml without asking."""
+        (mock_ask_openapi, mock_openapi) = args
+        mock_openapi.return_value.update_spec.return_value = {
+            'added': [('/api/kytos/mef_eline/v2/evc', 'post')],
+            'removed': [], 'updated': []}
+
+        self.napps_manager.prepare(incremental=True)
+
+        mock_ask_openapi.assert_not_called()
+        mock_openapi.return_value.update_spec.assert_called()
+        mock_openapi.return_value.render_template.assert_not_called()
+
     @patch('pathlib.Path.exists')
     @patch('builtins.input')
     def test_ask_openapi(self, *args):
@@ -1,27 +1,32 @@
 """kytos.utils.openapi tests."""
+import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from kytos.utils.openapi import OpenAPI
+from kytos.utils.openapi import OpenAPI, compile_spec
+from kytos.utils.yamlloader import YAML_ERRORS
+
+TPL_PATH = Path(__file__).resolve().parents[2] / 'kytos' / 'templates' / \
+    'skel' / 'napp-structure' / 'username' / 'napp'
 
 MAIN_FILE = '''
-    from kytos.core import KytosNApp, log
+from kytos.core import KytosNApp, log
 
-    class Main(KytosNApp):
-        def setup(self):
-            pass
+class Main(KytosNApp):
+    def setup(self):
+        pass
 
-        def execute(self):
-            pass
+    def execute(self):
+        pass
 
-        def shutdown(self):
-            pass
+    def shutdown(self):
+        pass
 
-        @rest("/any", methods=["GET"])
-        def any(self):
-            """docstring"""
-            pass
+    @rest("/any", methods=["GET"])
+    def any(self):
+        """docstring"""
+        pass
 '''
 
 
@@ -43,13 +48,15 @@ class TestOpenAPI(unittest.TestCase):
         self.open_api = OpenAPI(napp_path, tpl_path)
 
     @patch('pathlib.Path.open')
+    @patch('kytos.utils.openapi.OpenAPI._get_modules')
     @patch('kytos.utils.openapi.OpenAPI._save')
     def test_render_template(self, *args):
         """Test render_template method."""
-        (mock_save, mock_open) = args
+        (mock_save, mock_get_modules, mock_open) = args
+        mock_get_modules.return_value = [Path('main.py')]
         open_file = MagicMock()
         open_file.read.return_value = MAIN_FILE
-        mock_open.return_value = open_file
+        mock_open.return_value.__enter__.return_value = open_file
 
         self.open_api.render_template()
 
@@ -60,6 +67,60 @@ class TestOpenAPI(unittest.TestCase):
                     'paths': {'/api/kytos/mef_eline/any': path_dict}}
         mock_save.assert_called_with(expected)
 
+    def test_parse_decorated_functions(self):
+        """Test _parse_decorated_functions method with several decorators."""
+        code = '''
+@rest('/v2/evc/<circuit_id>',
+      methods=['PATCH', 'PUT'])
+@rest(rule='/evc', methods=('GET',))
+@other('/not/rest')
+def update(self, circuit_id):
+    """Update a circuit.
+
+    Only the given attributes
+    are changed.
+    """
+
+@api.rest('/v2/evc/', methods=['POST'])
+async def create(self):
+    pass
+
+@rest(RULE)
+def dynamic(self):
+    """Rules that are not literals are skipped."""
+'''
+        self.open_api._parse_decorated_functions(code)
+
+        prefix = '/api/kytos/mef_eline'
+        update = {'summary': 'Update a circuit.',
+                  'description': 'Only the given attributes are changed.'}
+        self.assertEqual(self.open_api._paths, {
+            prefix + '/v2/evc/{circuit_id}': {'patch': update, 'put': update},
+            prefix + '/evc': {'get': update},
+            prefix + '/v2/evc/': {'post': {
+                'summary': 'TODO write the summary.',
+                'description': 'TODO write/remove the description'}}})
+
+    def test_parse_paths(self):
+        """Test _parse_paths method reading all modules but tests."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            napp_path = Path(tmp_dir)
+            napp_path.joinpath('main.py').write_text(MAIN_FILE)
+            napp_path.joinpath('v2').mkdir()
+            napp_path.joinpath('v2', 'api.py').write_text(
+                '@rest("/v2/any")\ndef any_v2(self):\n    """v2"""\n')
+            napp_path.joinpath('tests').mkdir()
+            napp_path.joinpath('tests', 'test_main.py').write_text(
+                '@rest("/test")\ndef test(self):\n    pass\n')
+            napp_path.joinpath('broken.py').write_text('def broken(:\n')
+            self.open_api._napp_path = napp_path
+
+            self.open_api._parse_paths()
+
+        self.assertEqual(list(self.open_api._paths),
+                         ['/api/kytos/mef_eline/any',
+                          '/api/kytos/mef_eline/v2/any'])
+
     @patch('pathlib.Path.open')
     def test_read_napp_info(self, mock_open):
         """Test _read_napp_info method."""
@@ -87,3 +148,165 @@ class TestOpenAPI(unittest.TestCase):
 
         tmpl.render.assert_called_with('context')
         enter_openapi.write.assert_called_with('content')
+
+
+class TestOpenAPIIncremental(unittest.TestCase):
+    """Test the incremental update of openapi.yml."""
+
+    def setUp(self):
+        """Create a NApp with two modules in a temporary directory."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.napp_path = Path(self.tmp_dir.name)
+        self.napp_path.joinpath('kytos.json').write_text(
+            '{"username": "kytos", "name": "mef_eline", "version": "1.0"}')
+        self.napp_path.joinpath('main.py').write_text(MAIN_FILE)
+        self.write_v2('@rest("/v2/evc", methods=["GET", "POST"])',
+                      'List circuits.')
+        self.api_file = self.napp_path / 'openapi.yml'
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp_dir.cleanup()
+
+    def write_v2(self, decorator, docstring):
+        """Write the v2 module of the NApp."""
+        self.napp_path.joinpath('v2.py').write_text(
+            f'{decorator}\ndef evc(self):\n    """{docstring}"""\n')
+
+    def update_spec(self):
+        """Run update_spec as kytos napps prepare --incremental would."""
+        return OpenAPI(self.napp_path, TPL_PATH).update_spec()
+
+    def test_update_spec__no_spec(self):
+        """Test update_spec method rendering the whole skeleton."""
+        changes = self.update_spec()
+
+        self.assertEqual(len(changes['added']), 3)
+        self.assertIn('/api/kytos/mef_eline/v2/evc:',
+                      self.api_file.read_text())
+        self.assertTrue(
+            self.napp_path.joinpath('.kytos', 'openapi-sources.json').exists())
+
+    def test_update_spec__keeps_edits(self):
+        """Test update_spec method changing only the affected paths."""
+        self.update_spec()
+        spec = self.api_file.read_text()
+        spec = spec.replace('summary: docstring', 'summary: Hand written',
+                            1).replace('openapi: 3.0.0',
+                                       'openapi: 3.0.0  # keep me')
+        self.api_file.write_text(spec)
+        self.write_v2('@rest("/v2/evc", methods=["GET", "PUT"])',
+                      'Circuits.')
+        self.napp_path.joinpath('main.py').touch()
+
+        changes = self.update_spec()
+
+        evc = '/api/kytos/mef_eline/v2/evc'
+        self.assertEqual(changes, {'added': [(evc, 'put')],
+                                   'removed': [(evc, 'post')],
+                                   'updated': [(evc, 'get')]})
+        spec = self.api_file.read_text()
+        self.assertIn('# keep me', spec)
+        self.assertIn('summary: Hand written', spec)
+        self.assertIn('summary: Circuits.', spec)
+        self.assertNotIn('post:', spec)
+
+    def test_update_spec__unchanged(self):
+        """Test update_spec method leaving openapi.yml untouched."""
+        self.update_spec()
+        content = self.api_file.read_text()
+
+        with patch('kytos.utils.openapi.OpenAPI._parse_module') as mock_parse:
+            changes = self.update_spec()
+
+        mock_parse.assert_not_called()
+        self.assertFalse(any(changes.values()))
+        self.assertEqual(self.api_file.read_text(), content)
+
+    def test_update_spec__syntax_error(self):
+        """Test update_spec method keeps the endpoints of broken modules."""
+        self.update_spec()
+        self.api_file.write_text(self.api_file.read_text().replace(
+            'summary: docstring', 'summary: Hand written', 1))
+        self.napp_path.joinpath('v2.py').write_text('def evc(self:\n')
+
+        changes = self.update_spec()
+
+        self.assertFalse(any(changes.values()))
+        self.assertIn('/api/kytos/mef_eline/v2/evc:',
+                      self.api_file.read_text())
+        self.assertIn('summary: Hand written', self.api_file.read_text())
+
+        # Once fixed, the module is parsed again.
+        self.write_v2('@rest("/v2/evc")', 'List circuits.')
+        changes = self.update_spec()
+
+        self.assertEqual(changes['removed'],
+                         [('/api/kytos/mef_eline/v2/evc', 'post')])
+
+    def test_update_spec__empty_spec(self):
+        """Test update_spec method with an empty openapi.yml."""
+        self.update_spec()
+        self.api_file.write_text('')
+        self.napp_path.joinpath('v2.py').write_text('')
+
+        self.update_spec()
+
+        self.assertIn('/api/kytos/mef_eline/', self.api_file.read_text())
+
+
+class TestCompileSpec(unittest.TestCase):
+    """Test the function compile_spec."""
+
+    def setUp(self):
+        """Write an openapi.yml in a temporary directory."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.api_file = Path(self.tmp_dir.name) / 'openapi.yml'
+        self.api_file.write_text('openapi: 3.0.0\npaths:\n  /a:\n'
+                                 '    get:\n      summary: A\n')
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp_dir.cleanup()
+
+    def test_compile_spec(self):
+        """Test compile_spec function minifying and caching the spec."""
+        spec = compile_spec(self.api_file)
+
+        expected = '{"openapi":"3.0.0","paths":{"/a":{"get":{"summary":"A"}}}}'
+        self.assertEqual(spec, expected)
+        with patch('kytos.utils.openapi.safe_load') as mock_load:
+            self.assertEqual(compile_spec(self.api_file), expected)
+        mock_load.assert_not_called()
+
+    def test_compile_spec__changed(self):
+        """Test compile_spec function after openapi.yml changes."""
+        compile_spec(self.api_file)
+        self.api_file.write_text('openapi: 3.0.1\n')
+
+        self.assertEqual(compile_spec(self.api_file), '{"openapi":"3.0.1"}')
+
+    def test_compile_spec__interrupted(self):
+        """Test compile_spec function after a failed cache write."""
+        compile_spec(self.api_file)
+        original = self.api_file.read_text()
+        self.api_file.write_text('openapi: 3.0.1\n')
+
+        with patch('kytos.utils.openapi.os.replace', side_effect=OSError):
+            compile_spec(self.api_file)
+        self.api_file.write_text(original)
+
+        cache_dir = self.api_file.parent / '.kytos'
+        self.assertFalse((cache_dir / 'openapi.json.sha256').exists())
+        self.assertEqual(list(cache_dir.glob('*.tmp')), [])
+        with patch('kytos.utils.openapi.safe_load',
+                   return_value={'openapi': '3.0.0'}) as mock_load:
+            compile_spec(self.api_file)
+        mock_load.assert_called()
+
+    def test_compile_spec__invalid(self):
+        """Test compile_spec function with invalid YAML."""
+        self.api_file.write_text('paths: [\n')
+
+        with self.assertRaises(YAML_ERRORS):
+            compile_spec(self.api_file)
@@ -0,0 +1,37 @@
+"""kytos.utils.settings tests."""
+import importlib
+import os
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from kytos.utils import settings
+
+
+class TestSettings(unittest.TestCase):
+    """Test the settings read from the environment."""
+
+    def tearDown(self):
+        """Read the settings of the real environment again."""
+        importlib.reload(settings)
+
+    def test_cache_path(self):
+        """Test CACHE_PATH inside XDG_CACHE_HOME."""
+        with patch.dict(os.environ, XDG_CACHE_HOME='/tmp/cache'):
+            importlib.reload(settings)
+
+        self.assertEqual(settings.CACHE_PATH, Path('/tmp/cache/kytos'))
+
+    def test_cache_path__default(self):
+        """Test CACHE_PATH with an unset or empty XDG_CACHE_HOME."""
+        for value in (None, ''):
+            with self.subTest(value=value), \
+                    patch.dict(os.environ, HOME='/home/user'):
+                if value is None:
+                    os.environ.pop('XDG_CACHE_HOME', None)
+                else:
+                    os.environ['XDG_CACHE_HOME'] = value
+                importlib.reload(settings)
+
+                self.assertEqual(settings.CACHE_PATH,
+                                 Path('/home/user/.cache/kytos'))
@@ -0,0 +1,106 @@
+"""kytos.utils.standin tests."""
+import io
+import json
+import tarfile
+import unittest
+
+import requests
+
+from kytos.utils.standin import StandInServer, napp_package, synthetic_catalog
+
+
+class TestSyntheticCatalog(unittest.TestCase):
+    """Test the synthetic catalog helpers."""
+
+    def test_synthetic_catalog(self):
+        """Test synthetic_catalog function generating an acyclic graph."""
+        catalog = synthetic_catalog(50, max_dependencies=3, seed=1)
+
+        self.assertEqual(len(catalog), 50)
+        seen = set()
+        for napp in catalog:
+            napp_id = '{username}/{name}'.format_map(napp)
+            self.assertTrue(set(napp['napp_dependencies']) <= seen)
+            self.assertLessEqual(len(napp['napp_dependencies']), 3)
+            seen.add(napp_id)
+        self.assertEqual(catalog, synthetic_catalog(50, 3, seed=1))
+
+    def test_napp_package(self):
+        """Test napp_package function."""
+        meta = {'username': 'kytos', 'name': 'of_core'}
+
+        package = napp_package(meta)
+
+        with tarfile.open(fileobj=io.BytesIO(package)) as tar:
+            self.assertEqual(tar.getnames(), ['kytos/of_core/kytos.json'])
+        self.assertEqual(package, napp_package(meta))
+
+
+class TestStandInServer(unittest.TestCase):
+    """Test the class StandInServer through HTTP."""
+
+    def setUp(self):
+        """Start a stand-in server with a small catalog."""
+        self.server = StandInServer(napps=5, installed=1).start()
+        self.url = self.server.url
+
+    def tearDown(self):
+        """Stop the stand-in server."""
+        self.server.stop()
+
+    def get(self, path):
+        """Return the decoded answer of a GET request."""
+        return requests.get(self.url + path).json()
+
+    def test_kytosd_napps(self):
+        """Test install, enable and list endpoints of kytosd."""
+        core = 'api/kytos/core/'
+        self.get(core + 'napps/user1/napp1/install')
+        self.get(core + 'napps/user1/napp1/enable')
+
+        installed = self.get(core + 'napps_installed')['napps']
+        enabled = self.get(core + 'napps_enabled')['napps']
+        version = self.get(core + 'napps/user1/napp1/metadata/version')
+
+        self.assertEqual(installed, [['user0', 'napp0'], ['user1', 'napp1']])
+        self.assertEqual(enabled, installed)
+        self.assertEqual(version, {'version': '1.1'})
+        self.assertEqual(self.server.counts['napp_action'], 2)
+
+    def test_install__not_found(self):
+        """Test install endpoint with an unknown NApp."""
+        response = requests.get(self.url +
+                                'api/kytos/core/napps/user/nope/install')
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_napps_server(self):
+        """Test catalog, auth, upload and package endpoints."""
+        catalog = self.get('api/napps/')['napps']
+        token = requests.get(self.url + 'api/auth/',
+                             auth=('user', 'pass')).json()['hash']
+        upload = requests.post(self.url + 'api/napps/',
+                               data={'token': token},
+                               files={'file': b'package'})
+        package = requests.get(self.url + 'repo/user0/napp0-latest.napp')
+
+        self.assertEqual(len(catalog), 5)
+        self.assertEqual(upload.status_code, 201)
+        self.assertEqual(package.content, napp_package(catalog[0]))
+
+    def test_register(self):
+        """Test users endpoint refusing an existing username."""
+        user = json.dumps({'username': 'john'})
+        first = requests.post(self.url + 'api/users/', data=user)
+        second = requests.post(self.url + 'api/users/', data=user)
+
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(second.status_code, 400)
+
+    def test_error_rate(self):
+        """Test injected errors."""
+        self.server.error_rate = 1
+
+        response = requests.get(self.url + 'api/napps/')
+
+        self.assertEqual(response.status_code, 500)
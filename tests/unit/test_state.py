@@ -0,0 +1,196 @@
+"""kytos.utils.state tests."""
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+from urllib.error import HTTPError
+
+from kytos.utils.config import KytosConfig
+from kytos.utils.exceptions import KytosException
+from kytos.utils.standin import StandInServer
+from kytos.utils.state import (Desired, Plan, apply_plan, fetch_plan,
+                               make_plan, read_state)
+
+CATALOG = [
+    {'username': 'kytos', 'name': 'of_core', 'version': '2.0',
+     'napp_dependencies': []},
+    {'username': 'kytos', 'name': 'of_lldp', 'version': '2.0',
+     'napp_dependencies': ['kytos/of_core']},
+    {'username': 'kytos', 'name': 'topology', 'version': '2.0',
+     'napp_dependencies': ['kytos/of_core', 'kytos/of_lldp']},
+    {'username': 'kytos', 'name': 'storehouse', 'version': '1.0',
+     'napp_dependencies': []}]
+
+OF_CORE, OF_LLDP = ('kytos', 'of_core'), ('kytos', 'of_lldp')
+TOPOLOGY, STOREHOUSE = ('kytos', 'topology'), ('kytos', 'storehouse')
+
+
+class TestState(unittest.TestCase):
+    """Test reading, planning and applying desired states."""
+
+    def setUp(self):
+        """Create a temporary directory for state files."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp_dir.cleanup()
+
+    def write_state(self, content):
+        """Write a state file and return its path."""
+        path = Path(self.tmp_dir.name, 'napps.yml')
+        path.write_text(content)
+        return str(path)
+
+    def test_read_state(self):
+        """Test read_state function with every kind of item."""
+        state_file = self.write_state(
+            'napps:\n'
+            '  - kytos/topology:2.0\n'
+            '  - napp: kytos/of_lldp\n'
+            '    enabled: false\n'
+            '  - napp: kytos/storehouse\n'
+            '    version: "1.0"\n'
+            '    installed: false\n'
+            'prune: true\n')
+
+        napps, prune = read_state(state_file)
+
+        self.assertTrue(prune)
+        self.assertEqual(napps, {TOPOLOGY: Desired('2.0', True, True),
+                                 OF_LLDP: Desired(None, True, False),
+                                 STOREHOUSE: Desired('1.0', False, False)})
+
+    def test_read_state__invalid(self):
+        """Test read_state function with invalid and repeated NApps."""
+        state_file = self.write_state('napps: [kytos/of_core, x/y, '
+                                      'kytos/of_core]\n')
+
+        with self.assertRaisesRegex(KytosException,
+                                    'item 2.*item 3: kytos/of_core repeated'):
+            read_state(state_file)
+
+        with self.assertRaises(KytosException):
+            read_state(self.write_state('- kytos/of_core\n'))
+
+    def test_make_plan(self):
+        """Test make_plan function adding dependencies and disabling."""
+        desired = {TOPOLOGY: Desired(None, True, True),
+                   STOREHOUSE: Desired(None, True, False)}
+
+        plan = make_plan(desired, False, {OF_CORE, STOREHOUSE},
+                         {OF_CORE, STOREHOUSE}, CATALOG, {})
+
+        self.assertEqual(plan[:4], ([STOREHOUSE], [], [OF_LLDP, TOPOLOGY],
+                                    [OF_LLDP, TOPOLOGY]))
+
+    def test_make_plan__converged(self):
+        """Test make_plan function when nothing has to be done."""
+        desired = {OF_LLDP: Desired('2.0', True, True)}
+
+        plan = make_plan(desired, True, {OF_CORE, OF_LLDP},
+                         {OF_CORE, OF_LLDP}, CATALOG, {OF_LLDP: '2.0'})
+
+        self.assertFalse(any(plan[:4]))
+
+    def test_make_plan__prune_and_reinstall(self):
+        """Test make_plan function pruning and reinstalling a pinned NApp."""
+        desired = {OF_CORE: Desired('2.0', True, True)}
+
+        plan = make_plan(desired, True, {OF_CORE, STOREHOUSE}, {OF_CORE},
+                         CATALOG, {OF_CORE: '1.0'})
+
+        self.assertEqual(plan[:4], ([OF_CORE], [OF_CORE, STOREHOUSE],
+                                    [OF_CORE], [OF_CORE]))
+
+    def test_make_plan__errors(self):
+        """Test make_plan function with unreachable states."""
+        cases = [
+            # of_core is needed by of_lldp.
+            {OF_LLDP: Desired(None, True, True),
+             OF_CORE: Desired(None, False, False)},
+            # The NApps server has another version.
+            {OF_CORE: Desired('3.0', True, True)},
+            # Not in the NApps server.
+            {('kytos', 'unknown'): Desired(None, True, True)}]
+        for desired in cases:
+            with self.subTest(desired=desired):
+                with self.assertRaises(KytosException):
+                    make_plan(desired, False, set(), set(), CATALOG, {})
+
+        # Disabling of_core would break the enabled of_lldp.
+        with self.assertRaisesRegex(KytosException, 'of_lldp needs'):
+            make_plan({OF_CORE: Desired(None, True, False)}, False,
+                      {OF_CORE, OF_LLDP}, {OF_CORE, OF_LLDP}, CATALOG, {})
+
+    def test_make_plan__no_version(self):
+        """Test make_plan function with NApps metadata without version."""
+        catalog = [{'username': 'kytos', 'name': 'of_core',
+                    'napp_dependencies': []}]
+
+        with self.assertRaisesRegex(KytosException,
+                                    'of_core:2.0 not available'):
+            make_plan({OF_CORE: Desired('2.0', True, True)}, False, set(),
+                      set(), catalog, {})
+        plan = make_plan({OF_CORE: Desired(None, True, True)}, False, set(),
+                         set(), catalog, {})
+        self.assertEqual(plan.install, [OF_CORE])
+
+    @patch('kytos.utils.state.NAppsManager.get_version')
+    @patch('kytos.utils.config.create_skel_dir')
+    def test_fetch_plan__version_error(self, *args):
+        """Test fetch_plan function when kytosd doesn't give a version."""
+        (_, mock_get_version) = args
+        mock_get_version.side_effect = HTTPError('url', 404, 'Not Found', {},
+                                                 None)
+        server = StandInServer(napps=CATALOG, installed=1).start()
+        self.addCleanup(server.stop)
+
+        with KytosConfig.override('kytos', 'api', server.url), \
+                KytosConfig.override('napps', 'api', server.url + 'api/'), \
+                self.assertRaisesRegex(KytosException,
+                                       'kytos/of_core: HTTP 404'):
+            fetch_plan({OF_CORE: Desired('2.0', True, True)}, prune=False)
+
+    @patch('kytos.utils.config.create_skel_dir')
+    def test_fetch_and_apply_plan(self, _):
+        """Test fetch_plan and apply_plan functions against kytosd."""
+        server = StandInServer(napps=CATALOG, installed=1).start()
+        self.addCleanup(server.stop)
+        desired = {TOPOLOGY: Desired('2.0', True, True),
+                   STOREHOUSE: Desired(None, True, False)}
+
+        with KytosConfig.override('kytos', 'api', server.url), \
+                KytosConfig.override('napps', 'api', server.url + 'api/'):
+            plan = fetch_plan(desired, prune=False)
+            results = apply_plan(plan)
+
+        self.assertEqual(plan[:4], ([], [], [OF_LLDP, STOREHOUSE, TOPOLOGY],
+                                    [OF_LLDP, TOPOLOGY]))
+        self.assertEqual(results, dict.fromkeys([OF_LLDP, STOREHOUSE,
+                                                 TOPOLOGY]))
+        self.assertEqual(server.installed, {'kytos/of_core', 'kytos/of_lldp',
+                                            'kytos/topology',
+                                            'kytos/storehouse'})
+        self.assertEqual(server.enabled, {'kytos/of_core', 'kytos/of_lldp',
+                                          'kytos/topology'})
+        # One request for each action and none to check each NApp.
+        self.assertEqual(server.counts['napp_action'], 5)
+        self.assertEqual(server.counts['installed'], 1)
+        self.assertEqual(server.counts['enabled'], 1)
+
+    @patch('kytos.utils.config.create_skel_dir')
+    def test_apply_plan__failed_dependency(self, _):
+        """Test apply_plan function skipping NApps whose dependency failed."""
+        server = StandInServer(napps=CATALOG[1:]).start()
+        self.addCleanup(server.stop)
+        graph = {OF_LLDP: [OF_CORE], TOPOLOGY: [OF_CORE, OF_LLDP]}
+        plan = Plan([], [], [OF_CORE, OF_LLDP, TOPOLOGY], [OF_CORE], graph)
+
+        with KytosConfig.override('kytos', 'api', server.url):
+            results = apply_plan(plan)
+
+        self.assertIn('HTTP 404', str(results[OF_CORE]))
+        self.assertIn('skipped', str(results[OF_LLDP]))
+        self.assertIn('skipped', str(results[TOPOLOGY]))
+        self.assertEqual(server.installed, set())
@@ -0,0 +1,64 @@
+"""kytos.utils.templating tests."""
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from kytos.utils import templating
+from kytos.utils.metadata import __version__
+
+
+class TestTemplating(unittest.TestCase):
+    """Test the shared Jinja2 environments."""
+
+    def setUp(self):
+        """Use temporary template and cache directories."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.templates = Path(self.tmp_dir.name) / 'templates'
+        self.templates.mkdir()
+        (self.templates / 'hello.template').write_text('Hello {{name}}!')
+        self.cache = Path(self.tmp_dir.name) / 'cache'
+        patcher = patch('kytos.utils.templating.CACHE_PATH', self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.clear_caches()
+        self.addCleanup(self.clear_caches)
+
+    def tearDown(self):
+        """Remove the temporary directories."""
+        self.tmp_dir.cleanup()
+
+    @staticmethod
+    def clear_caches():
+        """Forget the environments created by other tests."""
+        # pylint: disable=protected-access
+        templating._get_environment.cache_clear()
+        templating._get_bytecode_cache.cache_clear()
+
+    def test_get_environment(self):
+        """Test get_environment function sharing environments."""
+        env = templating.get_environment(self.templates)
+
+        self.assertIs(env, templating.get_environment(str(self.templates)))
+        self.assertIsNot(env, templating.get_environment(self.templates,
+                                                         trim_blocks=True))
+        self.assertEqual(env.get_template('hello.template').render(
+            name='Kytos'), 'Hello Kytos!')
+
+    def test_bytecode_cache(self):
+        """Test compiled templates being written to the user cache."""
+        env = templating.get_environment(self.templates)
+        env.get_template('hello.template')
+
+        cached = list((self.cache / 'jinja' / __version__).iterdir())
+        self.assertEqual(len(cached), 1)
+
+    def test_bytecode_cache__unwritable(self):
+        """Test environments without cache when it can't be created."""
+        self.cache.write_text('not a directory')
+
+        env = templating.get_environment(self.templates)
+
+        self.assertIsNone(env.bytecode_cache)
+        self.assertEqual(env.get_template('hello.template').render(
+            name='Kytos'), 'Hello Kytos!')
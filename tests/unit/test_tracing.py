@@ -0,0 +1,150 @@
+"""kytos.utils.tracing tests."""
+import json
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from configparser import ConfigParser
+from pathlib import Path
+from unittest.mock import patch
+
+from kytos.cli.commands.napps.api import NAppsAPI
+from kytos.utils import tracing
+from kytos.utils.config import KytosConfig
+from kytos.utils.standin import StandInServer
+
+
+class TestTracing(unittest.TestCase):
+    """Test the tracing functions."""
+
+    def setUp(self):
+        """Trace to a file of its own."""
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.trace = Path(tmp_dir.name, 'trace.jsonl')
+        self.config = ConfigParser()
+        self.config.read_dict({'global': {'trace': str(self.trace)}})
+
+    def spans(self):
+        """Return the exported spans by name."""
+        (line,) = self.trace.read_text().splitlines()
+        (resource_spans,) = json.loads(line)['resourceSpans']
+        (scope_spans,) = resource_spans['scopeSpans']
+        return {span['name']: span for span in scope_spans['spans']}
+
+    def test_span__off(self):
+        """Test span function without a traced command."""
+        with tracing.span('napp') as current:
+            current.set_attribute('key', 'value')
+            current.set_error('error')
+
+        self.assertFalse(self.trace.exists())
+
+    def test_command__off(self):
+        """Test command function without trace destination."""
+        self.config.remove_option('global', 'trace')
+
+        with tracing.command(['napps', 'list'], self.config), \
+                tracing.span('napp'):
+            pass
+
+        self.assertFalse(self.trace.exists())
+
+    def test_command(self):
+        """Test command function exports nested spans as OTLP/JSON."""
+        with tracing.command(['napps', 'install', 'kytos/of_core'],
+                             self.config, '2022.3'):
+            with tracing.span('kytos/of_core', **{'kytos.retries': 2,
+                                                  'kytos.local': False}):
+                with tracing.http_span('GET', 'http://kytos/') as current:
+                    tracing.set_status(current, 404)
+
+        spans = self.spans()
+        command = spans['kytos napps install']
+        napp, request = spans['kytos/of_core'], spans['GET']
+        self.assertNotIn('parentSpanId', command)
+        self.assertEqual(napp['parentSpanId'], command['spanId'])
+        self.assertEqual(request['parentSpanId'], napp['spanId'])
+        self.assertEqual({span['traceId'] for span in spans.values()},
+                         {command['traceId']})
+        self.assertEqual(len(command['traceId']), 32)
+        self.assertEqual(request['kind'], tracing.CLIENT)
+        self.assertEqual(request['status'], {'code': 2,
+                                             'message': 'HTTP 404'})
+        self.assertEqual(napp['status'], {'code': 1})
+        self.assertIn({'key': 'kytos.retries', 'value': {'intValue': '2'}},
+                      napp['attributes'])
+        self.assertIn({'key': 'kytos.local', 'value': {'boolValue': False}},
+                      napp['attributes'])
+        self.assertLessEqual(int(command['startTimeUnixNano']),
+                             int(napp['startTimeUnixNano']))
+        self.assertGreaterEqual(int(command['endTimeUnixNano']),
+                                int(napp['endTimeUnixNano']))
+
+    def test_command__error(self):
+        """Test command function marks failed spans."""
+        with self.assertRaises(SystemExit), \
+                tracing.command(['napps', 'install'], self.config):
+            with tracing.span('napp'):
+                raise SystemExit(1)
+
+        spans = self.spans()
+        self.assertEqual(spans['napp']['status']['code'], 2)
+        self.assertEqual(spans['kytos napps install']['status'],
+                         {'code': 2, 'message': 'exit status 1'})
+
+    def test_command__threads(self):
+        """Test spans of worker threads are children of the command."""
+        def work(index):
+            with tracing.span(f'napp{index}'):
+                pass
+
+        with tracing.command(['napps', 'install'], self.config), \
+                ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(work, range(4)))
+
+        spans = self.spans()
+        command_id = spans['kytos napps install']['spanId']
+        for index in range(4):
+            self.assertEqual(spans[f'napp{index}']['parentSpanId'],
+                             command_id)
+
+    @patch('kytos.utils.tracing.urllib.request.urlopen')
+    def test_command__endpoint(self, mock_urlopen):
+        """Test command function posts spans to a collector."""
+        self.config.set('global', 'trace_endpoint',
+                        'http://localhost:4318/v1/traces')
+
+        with tracing.command(['napps', 'list'], self.config):
+            pass
+
+        request = mock_urlopen.call_args[0][0]
+        self.assertEqual(request.full_url, 'http://localhost:4318/v1/traces')
+        self.assertEqual(request.get_header('Content-type'),
+                         'application/json')
+        self.assertIn('resourceSpans', json.loads(request.data))
+        self.assertIn('kytos napps list', self.spans())
+
+    @patch('kytos.utils.config.create_skel_dir')
+    def test_enable_napps(self, _):
+        """Test NApp and HTTP spans of a command against kytosd."""
+        server = StandInServer(napps=[{'username': 'kytos',
+                                       'name': 'of_core',
+                                       'version': '1.0'}],
+                               installed=1).start()
+        self.addCleanup(server.stop)
+
+        with KytosConfig.override('kytos', 'api', server.url), \
+                tracing.command(['napps', 'enable'], self.config):
+            NAppsAPI.enable_napps([('kytos', 'of_core')])
+
+        (line,) = self.trace.read_text().splitlines()
+        spans = json.loads(line)['resourceSpans'][0]['scopeSpans'][0]['spans']
+        napp = next(span for span in spans if span['name'] == 'kytos/of_core')
+        requests = [span for span in spans
+                    if span.get('parentSpanId') == napp['spanId']]
+        self.assertTrue(requests)
+        self.assertTrue(all(span['name'] == 'GET' for span in requests))
+        self.assertIn({'key': 'kytos.action',
+                       'value': {'stringValue': 'enable'}},
+                      napp['attributes'])
+        self.assertEqual(server.enabled, {'kytos/of_core'})
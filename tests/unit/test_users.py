@@ -1,8 +1,17 @@
 """kytos.utils.users tests."""
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import patch
 
-from kytos.utils.users import UsersManager
+import requests
+
+from kytos.utils.config import KytosConfig
+from kytos.utils.exceptions import KytosException
+from kytos.utils.standin import StandInServer
+from kytos.utils.users import RateLimiter, UsersManager
+
+CSV_HEADER = 'username,first_name,last_name,password,email\n'
 
 
 class TestUsersManager(unittest.TestCase):
@@ -35,3 +44,115 @@ class TestUsersManager(unittest.TestCase):
         input_value = self.user_manager.ask_question('field', password=True)
 
         self.assertEqual(input_value, 'password')
+
+    def write_csv(self, content):
+        """Write a CSV file to be removed after the test."""
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        csv_file = Path(tmp_dir.name, 'users.csv')
+        csv_file.write_text(content)
+        return csv_file
+
+    def test_read_users(self):
+        """Test read_users method."""
+        csv_file = self.write_csv(CSV_HEADER +
+                                  'alice,Alice,,secret1,alice@test.com\n'
+                                  ' bob ,Bob,Smith,secret2,bob@test.com\n')
+
+        users = UsersManager.read_users(csv_file)
+
+        self.assertEqual(users, [
+            {'username': 'alice', 'first_name': 'Alice',
+             'password': 'secret1', 'email': 'alice@test.com'},
+            {'username': 'bob', 'first_name': 'Bob', 'last_name': 'Smith',
+             'password': 'secret2', 'email': 'bob@test.com'}])
+
+    def test_read_users__invalid(self):
+        """Test read_users method with invalid rows."""
+        csv_file = self.write_csv(CSV_HEADER +
+                                  'alice,Alice,,secret1,alice@test.com\n'
+                                  'alice,Alice,,secret1,alice@test.com\n'
+                                  'b,,Sm1th,short,bob\n')
+
+        with self.assertRaises(KytosException) as context:
+            UsersManager.read_users(csv_file)
+
+        message = str(context.exception)
+        self.assertIn('line 3: alice repeated', message)
+        self.assertIn('line 4: invalid username, first_name, last_name, '
+                      'password, email', message)
+        self.assertNotIn('short', message)
+
+    def test_read_users__columns(self):
+        """Test read_users method with unknown and missing columns."""
+        csv_file = self.write_csv('username,nickname\nalice,al\n')
+
+        with self.assertRaises(KytosException) as context:
+            UsersManager.read_users(csv_file)
+
+        message = str(context.exception)
+        self.assertIn('unknown column nickname', message)
+        self.assertIn('missing column password', message)
+
+    def test_read_users__missing_file(self):
+        """Test read_users method with a missing file."""
+        with self.assertRaises(KytosException):
+            UsersManager.read_users('/nonexistent/users.csv')
+
+    def test_register_users(self):
+        """Test register_users method against a stand-in NApps server."""
+        server = StandInServer().start()
+        self.addCleanup(server.stop)
+        server.users['bob'] = {'username': 'bob'}
+        users = [{'username': name, 'first_name': name.title(),
+                  'password': 'secret', 'email': f'{name}@test.com'}
+                 for name in ('alice', 'bob', 'carol')]
+
+        with KytosConfig.override('napps', 'api', server.url + 'api/'):
+            results = UsersManager().register_users(users, rate=0)
+
+        self.assertEqual(list(results), ['alice', 'bob', 'carol'])
+        self.assertIsNone(results['alice'])
+        self.assertIsInstance(results['bob'], KytosException)
+        self.assertIsNone(results['carol'])
+        self.assertEqual(set(server.users), {'alice', 'bob', 'carol'})
+
+    @patch('kytos.utils.client.CommonClient.make_request')
+    def test_register_users__errors(self, mock_make_request):
+        """Test register_users method reporting every failure."""
+        mock_make_request.side_effect = [
+            SystemExit(1), requests.ConnectionError('reset'),
+            KytosException('refused')]
+        users = [{'username': name} for name in ('alice', 'bob', 'carol')]
+
+        results = UsersManager().register_users(users, max_workers=1, rate=0)
+
+        self.assertEqual(list(results), ['alice', 'bob', 'carol'])
+        self.assertIsInstance(results['alice'], KytosException)
+        self.assertIsInstance(results['bob'], requests.ConnectionError)
+        self.assertIsInstance(results['carol'], KytosException)
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test the class RateLimiter."""
+
+    @patch('kytos.utils.users.time.sleep')
+    def test_wait(self, mock_sleep):
+        """Test wait method spreads calls."""
+        limiter = RateLimiter(10)
+        for _ in range(3):
+            limiter.wait()
+
+        delays = [call[0][0] for call in mock_sleep.call_args_list]
+        self.assertEqual(len(delays), 2)
+        self.assertAlmostEqual(delays[0], 0.1, delta=0.05)
+        self.assertAlmostEqual(delays[1], 0.2, delta=0.05)
+
+    @patch('kytos.utils.users.time.sleep')
+    def test_wait__disabled(self, mock_sleep):
+        """Test wait method without limit."""
+        limiter = RateLimiter(0)
+        limiter.wait()
+        limiter.wait()
+
+        mock_sleep.assert_not_called()
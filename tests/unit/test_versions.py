@@ -0,0 +1,91 @@
+"""kytos.utils.versions tests."""
+import json
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from kytos.utils.exceptions import KytosException
+from kytos.utils.versions import (MetadataCache, parse_constraint, satisfies,
+                                  version_key)
+
+
+class TestVersions(unittest.TestCase):
+    """Test version constraints."""
+
+    def test_version_key(self):
+        """Test version_key function ordering."""
+        versions = ['2022.10', '2022.1', '2022.1rc1', '2022.1.1', '2021.2']
+
+        self.assertEqual(sorted(versions, key=version_key),
+                         ['2021.2', '2022.1rc1', '2022.1', '2022.1.1',
+                          '2022.10'])
+
+    def test_parse_constraint(self):
+        """Test parse_constraint function."""
+        self.assertEqual(parse_constraint('>=2022.1, <2023'),
+                         [('>=', '2022.1'), ('<', '2023')])
+        self.assertEqual(parse_constraint('2022.3'), [('==', '2022.3')])
+        self.assertEqual(parse_constraint('latest'), [])
+        with self.assertRaises(KytosException):
+            parse_constraint('>=')
+
+    def test_satisfies(self):
+        """Test satisfies function."""
+        self.assertTrue(satisfies('2022.3', '>=2022.1,<2023'))
+        self.assertFalse(satisfies('2023.1', '>=2022.1,<2023'))
+        self.assertTrue(satisfies('1.0', '!=2.0'))
+        self.assertTrue(satisfies(None, None))
+        self.assertFalse(satisfies(None, '1.0'))
+
+
+class TestMetadataCache(unittest.TestCase):
+    """Test the class MetadataCache."""
+
+    def setUp(self):
+        """Create a cache with a fake NApps client."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.client = MagicMock()
+        self.client.get_napp.return_value = {'version': '2.0'}
+        self.cache = MetadataCache(self.tmp_dir.name, self.client)
+
+    def tearDown(self):
+        """Remove the cache directory."""
+        self.tmp_dir.cleanup()
+
+    def test_get(self):
+        """Test get method requesting each NApp once."""
+        for _ in range(3):
+            self.assertEqual(self.cache.get('kytos', 'of_core'),
+                             {'version': '2.0'})
+        self.assertEqual(
+            MetadataCache(self.tmp_dir.name, self.client).get('kytos',
+                                                              'of_core'),
+            {'version': '2.0'})
+
+        self.client.get_napp.assert_called_once_with('kytos', 'of_core')
+
+    def test_get__expired(self):
+        """Test get method requesting expired metadata again."""
+        cache_file = self.cache.path / 'kytos' / 'of_core.json'
+        cache_file.parent.mkdir(parents=True)
+        cache_file.write_text(json.dumps({
+            'fetched': time.time() - MetadataCache.ttl - 1,
+            'metadata': {'version': '1.0'}}))
+
+        self.assertEqual(self.cache.get('kytos', 'of_core'),
+                         {'version': '2.0'})
+
+        self.cache.forget('kytos', 'of_core')
+        self.assertFalse(cache_file.exists())
+
+    def test_resolve(self):
+        """Test resolve method."""
+        self.assertEqual(self.cache.resolve('kytos', 'of_core', '>=2.0'),
+                         '2.0')
+        with self.assertRaisesRegex(KytosException, 'server has 2.0'):
+            self.cache.resolve('kytos', 'of_core', '<2.0')
+
+        self.client.get_napp.return_value = None
+        with self.assertRaisesRegex(KytosException, 'not found'):
+            self.cache.resolve('kytos', 'unknown', None)
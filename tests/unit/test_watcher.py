@@ -0,0 +1,114 @@
+"""kytos.utils.watcher tests."""
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from kytos.utils.watcher import (InotifyObserver, NAppsWatcher,
+                                 PollingObserver, is_relevant)
+
+
+def create_napp(root, username, name):
+    """Create a minimal NApp directory with a kytos.json file."""
+    napp_dir = Path(root) / username / name
+    napp_dir.mkdir(parents=True)
+    meta = {'username': username, 'name': name}
+    (napp_dir / 'kytos.json').write_text(json.dumps(meta))
+    (napp_dir / 'main.py').write_text('')
+    return napp_dir
+
+
+class TestWatcherHelpers(unittest.TestCase):
+    """Test the helper functions and observers."""
+
+    def test_is_relevant(self):
+        """Test is_relevant function."""
+        self.assertTrue(is_relevant('kytos/of_core/main.py'))
+        self.assertFalse(is_relevant('kytos/of_core/main.pyc'))
+        self.assertFalse(is_relevant('kytos/of_core/.main.py.swp'))
+        self.assertFalse(is_relevant('kytos/of_core/__pycache__/a.py'))
+        self.assertFalse(is_relevant('kytos/of_core/.git/index'))
+
+    def test_polling_observer(self):
+        """Test PollingObserver detecting a new file."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            observer = PollingObserver(tmp_dir, interval=0.01)
+            self.assertEqual(observer.wait(0.02), [])
+
+            new_file = str(Path(tmp_dir) / 'new.py')
+            Path(new_file).write_text('')
+            self.assertEqual(observer.wait(1), [new_file])
+
+    def test_inotify_observer(self):
+        """Test InotifyObserver detecting a file written in a new dir."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            try:
+                observer = InotifyObserver(tmp_dir)
+            except OSError:
+                self.skipTest('inotify is not available.')
+
+            subdir = Path(tmp_dir) / 'sub'
+            subdir.mkdir()
+            self.assertEqual(observer.wait(1), [])
+
+            (subdir / 'a.py').write_text('')
+            changed = observer.wait(1)
+            observer.close()
+
+            self.assertIn(str(subdir / 'a.py'), changed)
+
+
+class TestNAppsWatcher(unittest.TestCase):
+    """Test the class NAppsWatcher."""
+
+    def setUp(self):
+        """Create two NApps in a temporary directory."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name).resolve()
+        self.of_core = create_napp(self.root, 'kytos', 'of_core')
+        self.of_lldp = create_napp(self.root, 'kytos', 'of_lldp')
+        self.observer = MagicMock()
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp_dir.cleanup()
+
+    def test_find_napps(self):
+        """Test find_napps method."""
+        watcher = NAppsWatcher(self.root, observer=self.observer)
+
+        self.assertEqual(watcher.napps,
+                         {self.of_core: ('kytos', 'of_core'),
+                          self.of_lldp: ('kytos', 'of_lldp')})
+
+    def test_find_napps__napp_dir(self):
+        """Test find_napps method when watching a NApp directory."""
+        watcher = NAppsWatcher(self.of_core, observer=self.observer)
+
+        self.assertEqual(watcher.napps, {self.of_core: ('kytos', 'of_core')})
+
+    def test_changed_napps(self):
+        """Test changed_napps method."""
+        watcher = NAppsWatcher(self.root, observer=self.observer)
+        paths = [self.of_core / 'main.py', self.of_core / 'main.pyc',
+                 self.of_lldp / '__pycache__' / 'main.cpython-36.pyc',
+                 self.root / 'README.rst']
+
+        self.assertEqual(watcher.changed_napps(paths), {('kytos', 'of_core')})
+
+    def test_watch(self):
+        """Test watch method coalescing a burst of changes."""
+        self.observer.wait.side_effect = [
+            [str(self.of_core / 'main.py')],
+            [str(self.of_lldp / 'main.py'), str(self.of_core / 'main.py')],
+            [],
+            KeyboardInterrupt]
+        callback = MagicMock()
+
+        watcher = NAppsWatcher(self.root, debounce=0, observer=self.observer)
+        watcher.watch(callback)
+
+        callback.assert_called_once_with([('kytos', 'of_core'),
+                                          ('kytos', 'of_lldp')])
+        self.observer.close.assert_called()
@@ -0,0 +1,55 @@
+"""kytos.utils.yamlloader tests."""
+import unittest
+from unittest.mock import patch
+
+from kytos.utils.yamlloader import (YAML_ERRORS, available_backends,
+                                    safe_load)
+
+DOCUMENT = '''
+openapi: 3.0.0
+paths:
+  /api/kytos/mef_eline/v2/evc/:
+    get:
+      responses:
+        200:
+          description: List circuits.
+          tags: [evc, "v2"]
+'''
+
+EXPECTED = {'openapi': '3.0.0', 'paths': {'/api/kytos/mef_eline/v2/evc/': {
+    'get': {'responses': {200: {'description': 'List circuits.',
+                                'tags': ['evc', 'v2']}}}}}}
+
+
+class TestYAMLLoader(unittest.TestCase):
+    """Test the YAML loader backends."""
+
+    def test_safe_load(self):
+        """Test safe_load function giving the same result in all backends."""
+        for backend in available_backends():
+            with self.subTest(backend=backend):
+                self.assertEqual(safe_load(DOCUMENT, backend), EXPECTED)
+                self.assertEqual(safe_load(DOCUMENT.encode(), backend),
+                                 EXPECTED)
+
+    def test_safe_load__invalid(self):
+        """Test safe_load function with invalid and unsafe documents."""
+        for backend in available_backends():
+            for document in ('a: [', '!!python/object:os.system {}'):
+                with self.subTest(backend=backend, document=document):
+                    with self.assertRaises(YAML_ERRORS):
+                        safe_load(document, backend)
+
+    def test_safe_load__yaml_1_2(self):
+        """Test safe_load function follows YAML 1.2 in all backends."""
+        for backend in available_backends():
+            with self.subTest(backend=backend):
+                self.assertEqual(safe_load('[yes, no, on, off, true, 010]',
+                                           backend),
+                                 ['yes', 'no', 'on', 'off', True, 10])
+
+    @patch('kytos.utils.yamlloader.CParser', None)
+    def test_available_backends__no_clib(self):
+        """Test available_backends function without ruamel.yaml.clib."""
+        self.assertEqual(available_backends(), ['ruamel-pure'])
+        self.assertEqual(safe_load('a: 1'), {'a': 1})